@@ -12,6 +12,12 @@ if [ ! -f "README.md" ] || [ ! -d "commands" ]; then
     exit 1
 fi
 
+# Prefer the incremental installer: it copies only files that changed and
+# removes ones deleted from the repository. Without Python, fall back to cp.
+install_with_python() {
+    command -v python3 >/dev/null 2>&1 && python3 setup/utilities/prompt-tools.py install --set "$1" --source .
+}
+
 # Option 1: Copy everything
 echo ""
 echo "Choose installation method:"
@@ -23,16 +29,20 @@ read -p "Enter your choice (1-3): " choice
 case $choice in
     1)
         echo "📦 Installing all commands and workflows..."
-        mkdir -p ~/.claude/commands ~/.claude/workflows ~/.claude/archive
-        cp commands/*.md ~/.claude/commands/ 2>/dev/null
-        cp workflows/*.md ~/.claude/workflows/ 2>/dev/null
-        cp -r _archive/* ~/.claude/archive/ 2>/dev/null
+        if ! install_with_python all; then
+            mkdir -p ~/.claude/commands ~/.claude/workflows ~/.claude/archive
+            cp commands/*.md ~/.claude/commands/ 2>/dev/null
+            cp workflows/*.md ~/.claude/workflows/ 2>/dev/null
+            cp -r _archive/* ~/.claude/archive/ 2>/dev/null
+        fi
         echo "✅ Complete installation finished!"
         ;;
     2)
         echo "📦 Installing core commands only..."
-        mkdir -p ~/.claude/commands
-        cp commands/{guide,agents,execute,workflows,senior-engineer,documentation}.md ~/.claude/commands/ 2>/dev/null
+        if ! install_with_python core; then
+            mkdir -p ~/.claude/commands
+            cp commands/{guide,agents,execute,workflows,senior-engineer,documentation}.md ~/.claude/commands/ 2>/dev/null
+        fi
         echo "✅ Core commands installed!"
         ;;
     3)
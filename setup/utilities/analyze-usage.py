@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Component Usage Analyzer
+
+Same as `python -m prompt_tools analyze-usage`; the implementation is in
+prompt_tools/analyze_usage.py.
+"""
+
+from prompt_tools.commands import analyze_usage
+
+if __name__ == '__main__':
+    analyze_usage.main()
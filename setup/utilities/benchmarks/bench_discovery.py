@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+File Discovery Benchmark
+
+Find the prompt files in a synthetic tree several ways:
+
+  glob-all      - directory.glob('**/*') with a suffix filter (how
+                  token-counter.py walked directories)
+  glob-per-ext  - one '**/*.ext' glob per extension (how prompt-validator.py
+                  and the converters walked directories)
+  os.walk       - os.walk with directory-name pruning (how
+                  discover_prompt_files() walked)
+  walk_files    - prompt_tools.discovery.walk_files()
+  walk (cached) - walk_files() with a warm ListingCache
+
+The tree holds prompt directories plus a .git directory and an _archive
+directory full of files; the glob walks descend into both, the others
+prune them.
+
+Usage:
+    python benchmarks/bench_discovery.py
+    python benchmarks/bench_discovery.py --dirs 200 --files-per-dir 50 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+UTILITIES_DIR = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(UTILITIES_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import best_of
+from prompt_tools.discovery import ListingCache, walk_files
+from prompt_tools.references import PROMPT_EXTENSIONS
+
+SKIP_DIRS = {'.git', '__pycache__', 'node_modules', '.venv', 'venv', '_archive'}
+
+
+def generate_tree(root: Path, dirs: int, files_per_dir: int):
+    """Write prompt files, plus .git and _archive trees of the same size."""
+    suffixes = ('.md', '.yaml', '.txt', '.py', '.json')
+    for top in ('prompts', '.git/objects', '_archive'):
+        for d in range(dirs):
+            folder = root / top / f"d{d // 10}" / f"d{d}"
+            folder.mkdir(parents=True, exist_ok=True)
+            for i in range(files_per_dir):
+                (folder / f"f{i}{suffixes[i % len(suffixes)]}").write_bytes(b'x')
+    # Settle directory mtimes so the listing cache trusts them
+    old = time.time() - 60
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (old, old))
+
+
+def glob_all(root: Path):
+    return [str(p) for p in root.glob('**/*') if p.is_file() and p.suffix in PROMPT_EXTENSIONS]
+
+
+def glob_per_ext(root: Path):
+    return [str(p) for ext in PROMPT_EXTENSIONS for p in root.glob(f"**/*{ext}") if p.is_file()]
+
+
+def os_walk(root: Path):
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            if os.path.splitext(name)[1] in PROMPT_EXTENSIONS:
+                files.append(os.path.join(dirpath, name))
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark shared file discovery against per-tool globbing'
+    )
+    parser.add_argument('--dirs', type=int, default=100,
+                       help='Directories per top-level tree (default: 100)')
+    parser.add_argument('--files-per-dir', type=int, default=40,
+                       help='Files per directory (default: 40)')
+    parser.add_argument('--repeat', type=int, default=3,
+                       help='Runs per method; the best is reported (default: 3)')
+    
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as temp:
+        root = Path(temp)
+        generate_tree(root, args.dirs, args.files_per_dir)
+        cache = ListingCache()
+        list(walk_files(root, PROMPT_EXTENSIONS, cache=cache))
+        
+        methods = [
+            ('glob-all', lambda: glob_all(root)),
+            ('glob-per-ext', lambda: glob_per_ext(root)),
+            ('os.walk', lambda: os_walk(root)),
+            ('walk_files', lambda: list(walk_files(root, PROMPT_EXTENSIONS))),
+            ('walk (cached)', lambda: list(walk_files(root, PROMPT_EXTENSIONS, cache=cache))),
+        ]
+        
+        print("=" * 60)
+        print(f"FILE DISCOVERY BENCHMARK ({3 * args.dirs * args.files_per_dir:,} files)")
+        print("=" * 60)
+        
+        baseline = None
+        all_same = True
+        for name, func in methods:
+            seconds, files = best_of(args.repeat, func)
+            baseline = baseline or seconds
+            note = f"{len(files):,} files"
+            if name.startswith('walk'):
+                same = sorted(files) == sorted(os_walk(root))
+                all_same &= same
+                note += ', same as os.walk' if same else ', DIFFERENT from os.walk'
+            print(f"  {name:<14} {seconds * 1000:9.1f} ms  ({baseline / seconds:5.2f}x)  {note}")
+        print("=" * 60)
+    
+    sys.exit(0 if all_same else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Installer Benchmark
+
+Install a synthetic command set repeatedly:
+
+  cp         - copy every file on every run, as INSTALL.sh's cp does
+  installer  - prompt_tools.installer.install(), which diffs against its
+               manifest and copies only what changed
+
+Each method runs a first install into an empty target, a reinstall with
+nothing changed, and a reinstall after --change-ratio of the files were
+edited. Both targets are compared at the end.
+
+Usage:
+    python benchmarks/bench_install.py
+    python benchmarks/bench_install.py --commands 2000 --archive 20000 --change-ratio 0.01
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+UTILITIES_DIR = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(UTILITIES_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import best_of
+from prompt_tools.installer import MANIFEST_NAME, install
+
+WORDS = ('prompt', 'context', 'review', 'agent', 'template', 'section', 'output', 'token')
+
+
+def generate_source(root: Path, commands: int, workflows: int, archive: int, size: int):
+    """Write commands/, workflows/ and a nested _archive/ tree of markdown files."""
+    rng = random.Random(0)
+    text = ' '.join(rng.choice(WORDS) for _ in range(size // 7)) + '\n'
+    layout = [('commands', commands, 1), ('workflows', workflows, 1), ('_archive', archive, 50)]
+    for directory, count, per_dir in layout:
+        for i in range(count):
+            folder = root / directory
+            if per_dir > 1:
+                folder = folder / f"area_{i // per_dir % 10}" / f"group_{i // per_dir}"
+            folder.mkdir(parents=True, exist_ok=True)
+            (folder / f"{directory.strip('_')}_{i}.md").write_text(f"# {i}\n{text}", encoding='utf-8')
+    # Settle mtimes so the installer trusts them
+    old = time.time() - 60
+    for path in root.rglob('*'):
+        os.utime(path, (old, old))
+
+
+def edit_source(root: Path, ratio: float):
+    """Append a line to ratio of the source files."""
+    rng = random.Random(1)
+    files = sorted(p for p in root.rglob('*.md'))
+    old = time.time() - 30
+    for path in rng.sample(files, round(len(files) * ratio)):
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write("edited\n")
+        os.utime(path, (old, old))
+
+
+def install_cp(source: Path, target: Path):
+    """Copy everything, the way INSTALL.sh does."""
+    for directory, destination, pattern in (('commands', 'commands', '*.md'),
+                                            ('workflows', 'workflows', '*.md')):
+        (target / destination).mkdir(parents=True, exist_ok=True)
+        for path in (source / directory).glob(pattern):
+            shutil.copyfile(path, target / destination / path.name)
+    shutil.copytree(source / '_archive', target / 'archive', dirs_exist_ok=True)
+
+
+def install_incremental(source: Path, target: Path):
+    install(source, target)
+
+
+def read_tree(root: Path):
+    return {str(p.relative_to(root)): p.read_bytes()
+            for p in root.rglob('*') if p.is_file() and p.name != MANIFEST_NAME}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the incremental installer against copying everything'
+    )
+    parser.add_argument('--commands', type=int, default=500,
+                       help='Files in commands/ (default: 500)')
+    parser.add_argument('--workflows', type=int, default=100,
+                       help='Files in workflows/ (default: 100)')
+    parser.add_argument('--archive', type=int, default=5000,
+                       help='Files in the _archive/ tree (default: 5000)')
+    parser.add_argument('--size', type=int, default=4096,
+                       help='Approximate bytes per file (default: 4096)')
+    parser.add_argument('--change-ratio', type=float, default=0.01,
+                       help='Share of files edited before the last install (default: 0.01)')
+    
+    args = parser.parse_args()
+    total = args.commands + args.workflows + args.archive
+    
+    print("=" * 60)
+    print(f"INSTALLER BENCHMARK ({total:,} files)")
+    print("=" * 60)
+    
+    with tempfile.TemporaryDirectory() as temp:
+        temp = Path(temp)
+        source = temp / 'source'
+        generate_source(source, args.commands, args.workflows, args.archive, args.size)
+        
+        methods = [('cp', install_cp), ('installer', install_incremental)]
+        timings = {name: [] for name, _ in methods}
+        steps = ('first install', 'unchanged', f"{args.change_ratio:.0%} changed")
+        for step in steps:
+            if step == steps[-1]:
+                edit_source(source, args.change_ratio)
+            for name, func in methods:
+                seconds, _ = best_of(1, func, source, temp / name)
+                timings[name].append(seconds)
+                print(f"  {name:<10} {step:<14} {seconds * 1000:9.1f} ms")
+        
+        print("-" * 60)
+        for i, step in enumerate(steps):
+            print(f"  {step:<14} speedup: {timings['cp'][i] / timings['installer'][i]:6.2f}x")
+        same = read_tree(temp / 'cp') == read_tree(temp / 'installer')
+        print(f"  Output: {'identical' if same else 'DIFFERENT'}")
+    print("=" * 60)
+    
+    sys.exit(0 if same else 1)
+
+
+if __name__ == '__main__':
+    main()
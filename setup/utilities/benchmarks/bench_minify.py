@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Prompt Minifier Benchmark
+
+Minify a synthetic prompt tree (benchmarks/corpus.py) that has been
+roughened the way hand-edited prompts are: trailing spaces, doubled
+spaces, runs of blank lines, needless YAML quotes and pasted copies of
+shared components. Three ways:
+
+  uncached    - one process, token counts and scalar checks forgotten
+                after every file
+  cached      - run_minifier() in one process, counts shared across files
+  -j N        - run_minifier() with N worker processes
+
+All runs must produce the same files. Every minified file is then checked:
+YAML must load to the same data, and text, with its references inlined,
+must have the same words in the same order as its source.
+
+Usage:
+    python benchmarks/bench_minify.py
+    python benchmarks/bench_minify.py --files 2000 --jobs 2 4
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+UTILITIES_DIR = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(UTILITIES_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import corpus as corpus_generator
+from corpus import best_of
+from prompt_tools import yaml_io
+from prompt_tools.bundle_prompts import YAML_EXTENSIONS, PromptBundler
+from prompt_tools.minifier import TRANSFORMS, PromptMinifier, run_minifier
+from prompt_tools.references import ComponentIndex, collect_inputs
+
+
+def roughen(corpus, seed: int = 1):
+    """Add the slack a minifier removes to every prompt file."""
+    rng = random.Random(seed)
+    components = PromptMinifier(components=corpus['root'] / 'shared-components.yaml').components
+    for path in corpus['prompt_files']:
+        text = path.read_text(encoding='utf-8')
+        if path.suffix in YAML_EXTENSIONS:
+            text = text.replace('  description: ', '  description: "', 1)
+            text = text.replace('\ncontent:', '"\n\n\n\ncontent:', 1)
+        else:
+            lines = []
+            for line in text.split('\n'):
+                roll = rng.random()
+                if roll < 0.2:
+                    line += '   '
+                elif roll < 0.3:
+                    line = line.replace(' ', '  ', 3)
+                elif roll < 0.35:
+                    line += '\n\n'
+                lines.append(line)
+            for _ in range(2):
+                _, component = rng.choice(components)
+                lines.insert(rng.randrange(2, len(lines)), component)
+            text = '\n'.join(lines)
+        path.write_text(text, encoding='utf-8')
+
+
+def run_uncached(entries, components):
+    """Minify in one process, clearing every memo between files."""
+    minifier = PromptMinifier(components=components)
+    results = []
+    for path, name in entries:
+        minifier.counter.cache.clear()
+        minifier.unquoted.clear()
+        results.append(minifier.process(path, name))
+    return results
+
+
+def check(results, components) -> int:
+    """Return the number of minified files that do not mean the same as their source."""
+    bundler = PromptBundler(ComponentIndex(components.parent))
+    bad = 0
+    for result in results:
+        original = Path(result['path']).read_text(encoding='utf-8')
+        if Path(result['path']).suffix in YAML_EXTENSIONS:
+            same = yaml_io.safe_load(result['minified']) == yaml_io.safe_load(original)
+        else:
+            same = (bundler.inline_text(result['minified']).split()
+                    == bundler.inline_text(original).split())
+        bad += not same
+    return bad
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the token-aware prompt minifier'
+    )
+    parser.add_argument('--files', type=int, default=1000,
+                       help='Prompt files to generate (default: 1000)')
+    parser.add_argument('--size', type=int, default=4096,
+                       help='Approximate bytes per prompt file (default: 4096)')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[2],
+                       help='Worker counts for the parallel runs (default: 2)')
+    
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as temp:
+        corpus = corpus_generator.generate_corpus(Path(temp), files=args.files, size=args.size)
+        components = corpus['root'] / 'shared-components.yaml'
+        roughen(corpus)
+        entries = collect_inputs([corpus['prompts_dir']])
+        
+        print("=" * 60)
+        print(f"PROMPT MINIFIER BENCHMARK ({len(entries)} files)")
+        print("=" * 60)
+        
+        methods = [('uncached', lambda: run_uncached(entries, components)),
+                   ('cached', lambda: run_minifier(entries, components=components))]
+        for jobs in args.jobs:
+            methods.append((f"-j {jobs}", lambda jobs=jobs: run_minifier(entries, components=components,
+                                                                        jobs=jobs)))
+        outputs = []
+        for name, func in methods:
+            seconds, results = best_of(1, func)
+            before = sum(r['tokens']['before'] for r in results)
+            after = sum(r['tokens']['after'] for r in results)
+            print(f"  {name:<10} {seconds:8.3f}s  {before:,} -> {after:,} tokens "
+                  f"(-{(before - after) / before:.1%})")
+            outputs.append([r['minified'] for r in results])
+        
+        print("-" * 60)
+        same = all(output == outputs[0] for output in outputs)
+        print(f"  Output: {'identical' if same else 'DIFFERENT'} across runs")
+        kept = {name: sum(r['transforms'][name] for r in results) for name in TRANSFORMS}
+        print("  Transforms kept: " + ", ".join(f"{name} {count:,}" for name, count in kept.items()))
+        bad = check(results, components)
+        print(f"  Meaning changed: {bad} file(s)")
+        note = PromptMinifier().counter.describe()
+        if note:
+            print(f"  Note: {note}")
+    print("=" * 60)
+    
+    sys.exit(0 if same and not bad else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Prompt Pipeline Benchmark
+
+Process a synthetic tree of prompt files two ways:
+
+  staged    - the interpolator, validator and token counter run one after
+              another, each reading its input from disk and scanning it
+              again, with expanded files written to a temporary directory
+              in between (the separate-scripts build, without process
+              start-up)
+  pipeline  - prompt-pipeline.py's run_pipeline(), one read and one scan
+              per file, everything kept in memory
+
+Error counts and token totals from both are compared.
+
+Usage:
+    python benchmarks/bench_pipeline.py
+    python benchmarks/bench_pipeline.py --files 2000 --jobs 1 2 4
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+UTILITIES_DIR = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(UTILITIES_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import best_of
+from prompt_tools import prompt_pipeline as pipeline
+from prompt_tools import prompt_validator, template_interpolator
+from prompt_tools.references import collect_inputs
+from prompt_tools.tokens import CachedTokenCounter
+
+
+WORDS = ('review', 'the', 'code', 'for', 'errors', 'and', 'report', 'each', 'issue',
+         'with', 'its', 'location', 'suggest', 'a', 'fix', 'keep', 'answers', 'short')
+
+
+def generate_tree(root: Path, file_count: int, seed: int = 42):
+    """Write file_count prompt files under root/prompts and templates under root/templates."""
+    rng = random.Random(seed)
+    templates = root / 'templates'
+    templates.mkdir()
+    for i in range(20):
+        (templates / f"part_{i}.txt").write_text(
+            f"Shared part {i}: " + ' '.join(rng.choice(WORDS) for _ in range(40)) + "\n")
+    prompts = root / 'prompts'
+    for i in range(file_count):
+        folder = prompts / f"group_{i % 20}"
+        folder.mkdir(parents=True, exist_ok=True)
+        lines = [f"# Prompt {i}", ""]
+        for _ in range(rng.randrange(20, 60)):
+            line = ' '.join(rng.choice(WORDS) for _ in range(rng.randrange(5, 15)))
+            roll = rng.random()
+            if roll < 0.1:
+                line += f" {{{{part_{rng.randrange(22)}}}}}"
+            elif roll < 0.2:
+                line += " for $language code"
+            lines.append(line)
+        (folder / f"prompt_{i}.md").write_text('\n'.join(lines) + "\n")
+
+
+def run_staged(entries, template_dir: Path, variables: dict, output_dir: Path):
+    """Interpolate everything to disk, then validate, then count: three passes."""
+    interpolator = template_interpolator.TemplateInterpolator(
+        template_dir=template_dir, warn_missing=False)
+    for path, name in entries:
+        with open(path, 'r', encoding='utf-8') as f:
+            expanded = interpolator.interpolate(f.read(), variables)['content']
+        target = output_dir / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(expanded, encoding='utf-8')
+    
+    validator = prompt_validator.PromptValidator(template_dir=template_dir)
+    errors = 0
+    for path, _ in entries:
+        errors += sum(1 for issue in validator.validate_file(path)
+                      if issue.severity == pipeline.SEVERITY_ERROR)
+    
+    counter = CachedTokenCounter()
+    tokens = 0
+    for _, name in entries:
+        tokens += counter.count((output_dir / name).read_text(encoding='utf-8'))
+    return errors, tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the one-pass prompt pipeline against separate stages'
+    )
+    parser.add_argument('--files', type=int, default=1000,
+                       help='Prompt files to generate (default: 1000)')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1],
+                       help='Worker counts to run the pipeline with (default: 1)')
+    
+    args = parser.parse_args()
+    variables = {'language': 'python'}
+    
+    with tempfile.TemporaryDirectory() as temp:
+        root = Path(temp)
+        generate_tree(root, args.files)
+        entries = collect_inputs([root / 'prompts'])
+        template_dir = root / 'templates'
+        
+        print("=" * 60)
+        print(f"PROMPT PIPELINE BENCHMARK ({len(entries)} files)")
+        print("=" * 60)
+        
+        staged_seconds, (staged_errors, staged_tokens) = best_of(
+            1, run_staged, entries, template_dir, variables, root / 'expanded')
+        print(f"  {'staged':<14} {staged_seconds:8.3f}s  {staged_errors} errors, "
+              f"{staged_tokens:,} tokens")
+        
+        all_same = True
+        for jobs in args.jobs:
+            seconds, results = best_of(
+                1, lambda: pipeline.run_pipeline(entries, template_dir, variables, jobs=jobs))
+            errors = sum(r['errors'] for r in results)
+            tokens = sum(r['tokens']['expanded'] for r in results)
+            same = (errors, tokens) == (staged_errors, staged_tokens)
+            all_same &= same
+            print(f"  {f'pipeline -j {jobs}':<14} {seconds:8.3f}s  {errors} errors, "
+                  f"{tokens:,} tokens  ({staged_seconds / seconds:.2f}x, "
+                  f"{'same' if same else 'DIFFERENT'})")
+        print("=" * 60)
+    
+    sys.exit(0 if all_same else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Structured Template Rendering Benchmark
+
+Render the issues section of code reviews with thousands of issues from
+templates/code-review.yaml two ways:
+  
+  hand loop  - str.replace() of every variable into item_template, per item,
+               which is how callers rendered list sections before
+  plan       - render_items() from a plan compiled once and reused
+
+The two outputs are compared, so the speedup is for the same text. The time
+to render the whole review from the plan and to compile the plan are shown
+too.
+
+Usage:
+    python benchmarks/bench_render.py
+    python benchmarks/bench_render.py --issues 1000 10000 --reviews 20
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+UTILITIES_DIR = Path(__file__).resolve().parent.parent
+SETUP_DIR = UTILITIES_DIR.parent
+
+sys.path.insert(0, str(UTILITIES_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import best_of
+from prompt_tools import rendering, yaml_io
+
+
+def generate_review(issue_count: int, seed: int = 42) -> dict:
+    """Return review parameters with issue_count issues."""
+    rng = random.Random(seed)
+    return {
+        'file_path': '/home/user/project/src/main.py',
+        'overall_assessment': 'The code works but needs attention in several places',
+        'issues_found': [
+            {
+                'severity': rng.choice(['critical', 'major', 'minor', 'info']),
+                'description': f"Issue {i}: unchecked return value from helper {rng.randrange(500)}",
+                'location': f"Lines {i * 3}-{i * 3 + 2}",
+                'suggestion': rng.choice(['Check the result', 'Add a guard clause',
+                                          'Log and re-raise the error']),
+            }
+            for i in range(issue_count)
+        ],
+        'positive_aspects': [f"Aspect {i}" for i in range(issue_count // 10)],
+        'final_remarks': 'Address the critical issues first.',
+        'language': 'python',
+    }
+
+
+def hand_loop(template: dict, variables: dict) -> str:
+    """Render the issues section by replacing each variable, item by item."""
+    item_template = template['structure']['issues']['item_template'].rstrip('\n')
+    scalars = {key: value for key, value in variables.items() if not isinstance(value, list)}
+    lines = []
+    for n, issue in enumerate(variables['issues_found'], 1):
+        text = item_template
+        for key, value in {**scalars, **issue}.items():
+            text = text.replace('{{' + key + '}}', str(value))
+        lines.append(f"{n}. " + text.replace('\n', '\n   '))
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark compiled structured-template rendering'
+    )
+    parser.add_argument('--issues', type=int, nargs='+', default=[100, 1000, 10000],
+                       help='Issues per review (default: 100 1000 10000)')
+    parser.add_argument('--reviews', type=int, default=10,
+                       help='Reviews rendered per measurement (default: 10)')
+    parser.add_argument('--repeat', type=int, default=3,
+                       help='Measurements per method; the best is reported (default: 3)')
+    
+    args = parser.parse_args()
+    
+    with open(SETUP_DIR / 'templates' / 'code-review.yaml', 'r', encoding='utf-8') as f:
+        template = yaml_io.safe_load(f)
+    compile_seconds, plans = best_of(args.repeat, rendering.compile_structure, template)
+    issues_plan = next(plan for plan in plans if plan.name == 'issues')
+    
+    print("=" * 60)
+    print(f"STRUCTURED RENDER BENCHMARK ({args.reviews} reviews, best of {args.repeat})")
+    print("=" * 60)
+    print(f"Compiling code-review.yaml: {compile_seconds * 1000:.3f} ms (once)")
+    
+    all_same = True
+    for issue_count in args.issues:
+        variables = generate_review(issue_count)
+        reviews = range(args.reviews)
+        
+        issues = variables['issues_found']
+        
+        hand_seconds, hand_text = best_of(
+            args.repeat, lambda: [hand_loop(template, variables) for _ in reviews][-1])
+        plan_seconds, plan_text = best_of(
+            args.repeat, lambda: [rendering.render_items(issues_plan, issues, variables, set())
+                                  for _ in reviews][-1])
+        full_seconds, _ = best_of(
+            args.repeat, lambda: [rendering.render_plan(plans, variables) for _ in reviews])
+        
+        same = hand_text == plan_text
+        all_same &= same
+        per_review = 1000 / args.reviews
+        print(f"\n{issue_count:,} issues per review (ms per review):")
+        print(f"  {'hand loop':<12} {hand_seconds * per_review:9.2f}  issues section")
+        print(f"  {'plan':<12} {plan_seconds * per_review:9.2f}  issues section")
+        print(f"  {'plan':<12} {full_seconds * per_review:9.2f}  whole review")
+        print(f"  Speedup: {hand_seconds / plan_seconds:.2f}x  "
+              f"Output: {'identical' if same else 'DIFFERENT'}")
+    
+    print("=" * 60)
+    
+    sys.exit(0 if all_same else 1)
+
+
+if __name__ == '__main__':
+    main()
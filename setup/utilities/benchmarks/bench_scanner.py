@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Reference Scanner Benchmark
+
+Measure throughput (MB/s) of the shared single-pass reference scanner against
+the previous approach of one re.finditer pass per reference pattern, both as
+a raw scan and for the validator's reference check (which also had to rescan
+the text to find a line number for every missing template).
+
+Usage:
+    python benchmarks/bench_scanner.py
+    python benchmarks/bench_scanner.py --size-mb 16 --repeat 5
+"""
+
+import argparse
+import random
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import best_of
+from prompt_tools import scanning
+
+
+PROSE_WORDS = (
+    'analyze the code and report any issues found in the module before '
+    'refactoring ensure tests pass review changes carefully'
+).split()
+
+REFERENCE_SAMPLES = [
+    '{{code_review}}', '${shared_header}', '<template:summary/>',
+    '@include(file_policy)', '[[response_format]]', '{{user.name}}',
+    '$file_path', '%{severity}',
+]
+
+
+def generate_prompt_text(size_bytes: int, reference_ratio: float = 0.05,
+                         seed: int = 42) -> str:
+    """Generate prompt-like text with a given share of reference tokens."""
+    rng = random.Random(seed)
+    parts = []
+    total = 0
+    line_length = 0
+    
+    while total < size_bytes:
+        if rng.random() < reference_ratio:
+            word = rng.choice(REFERENCE_SAMPLES)
+        else:
+            word = rng.choice(PROSE_WORDS)
+        
+        if line_length > 80:
+            parts.append('\n')
+            total += 1
+            line_length = 0
+        
+        parts.append(word + ' ')
+        total += len(word) + 1
+        line_length += len(word) + 1
+    
+    return ''.join(parts)
+
+
+def legacy_scan(content: str) -> int:
+    """Scan with one finditer pass per pattern, as the tools used to."""
+    references = []
+    for pattern, style in scanning.TEMPLATE_PATTERNS + scanning.VAR_PATTERNS:
+        for match in re.finditer(pattern, content):
+            references.append((match.group(0), match.group(1), style))
+    return len(references)
+
+
+def combined_scan(content: str) -> int:
+    """Scan with the shared combined alternation."""
+    return len(list(scanning.scan_references(content)))
+
+
+def legacy_reference_check(content: str) -> int:
+    """Validator reference check as it used to run: 8 passes plus line rescans."""
+    templates = set()
+    for pattern, style in scanning.TEMPLATE_PATTERNS:
+        for match in re.finditer(pattern, content):
+            templates.add(match.group(1))
+    
+    variables = set()
+    for pattern, style in scanning.VAR_PATTERNS:
+        for match in re.finditer(pattern, content):
+            variables.add(match.group(1))
+    
+    # No templates exist in the benchmark, so every one needs a line number
+    lines = []
+    for name in templates:
+        for i, line in enumerate(content.split('\n'), 1):
+            if name in line:
+                lines.append(i)
+                break
+    return len(templates) + len(variables)
+
+
+def combined_reference_check(content: str) -> int:
+    """Validator reference check with one scan and offset-derived lines."""
+    templates = {}
+    variables = set()
+    for token in scanning.scan_references(content):
+        if token.kind == scanning.KIND_TEMPLATE:
+            templates.setdefault(token.name, token.start)
+        else:
+            variables.add(token.name)
+    
+    lines = [scanning.line_number(content, offset) for offset in templates.values()]
+    return len(templates) + len(variables)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark reference scanning throughput per MB of prompt text'
+    )
+    parser.add_argument('--size-mb', type=float, default=4.0,
+                       help='Size of generated prompt text in MB (default: 4)')
+    parser.add_argument('--reference-ratio', type=float, default=0.01,
+                       help='Fraction of words that are references (default: 0.01)')
+    parser.add_argument('--repeat', type=int, default=3,
+                       help='Runs per scanner; the best time is reported (default: 3)')
+    
+    args = parser.parse_args()
+    
+    content = generate_prompt_text(int(args.size_mb * 1024 * 1024), args.reference_ratio)
+    size_mb = len(content.encode('utf-8')) / (1024 * 1024)
+    
+    print("=" * 60)
+    print(f"REFERENCE SCANNER BENCHMARK ({size_mb:.2f} MB, best of {args.repeat})")
+    print("=" * 60)
+    
+    workloads = [
+        ('Raw scan', legacy_scan, combined_scan, 'tokens'),
+        ('Validator reference check', legacy_reference_check,
+         combined_reference_check, 'names'),
+    ]
+    
+    for title, legacy, combined, unit in workloads:
+        print(f"\n{title}:")
+        results = {}
+        for label, scan in [('per-pattern finditer', legacy),
+                            ('combined alternation', combined)]:
+            seconds, count = best_of(args.repeat, scan, content)
+            results[label] = seconds
+            print(f"  {label:<22} {seconds * 1000:9.1f} ms  {size_mb / seconds:8.2f} MB/s  "
+                  f"{count:,} {unit}")
+        
+        speedup = results['per-pattern finditer'] / results['combined alternation']
+        print(f"  Speedup: {speedup:.2f}x")
+    
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+
+Time `--help` for every command, in fresh interpreters, against a bare
+`python -c pass`:
+
+  prompt-tools.py        - the top-level command list
+  <script>.py --help     - each compatibility script
+  -m prompt_tools <cmd>  - each command through the package
+
+Also reports whether answering `--help` imported PyYAML or tiktoken; with
+the implementations loaded lazily neither should be.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 20
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+UTILITIES_DIR = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(UTILITIES_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import best_of
+from prompt_tools.cli import COMMANDS
+
+# Script kept at the old path for each command that had one
+SCRIPTS = {
+    'count': 'token-counter.py',
+    'xml-to-yaml': 'xml-to-yaml.py',
+    'yaml-to-xml': 'yaml-to-xml.py',
+    'interpolate': 'template-interpolator.py',
+    'validate': 'prompt-validator.py',
+    'validate-refs': 'validate-references.py',
+    'bundle': 'bundle-prompts.py',
+    'analyze-usage': 'analyze-usage.py',
+    'find-duplicates': 'find-duplicates.py',
+    'pipeline': 'prompt-pipeline.py',
+}
+
+HEAVY_MODULES = ('yaml', 'tiktoken')
+
+# Answer --help in-process and print which heavy modules got imported
+PROBE = """
+import contextlib, io, sys
+sys.path.insert(0, sys.argv[1])
+from prompt_tools import cli
+with contextlib.redirect_stdout(io.StringIO()):
+    try:
+        cli.main([sys.argv[2], '--help'])
+    except SystemExit:
+        pass
+print(' '.join(m for m in sys.argv[3:] if m in sys.modules))
+"""
+
+
+def run_quiet(command):
+    """Run command from the utilities directory, discarding its output."""
+    subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                   cwd=UTILITIES_DIR)
+
+
+def heavy_imports(name: str) -> str:
+    """Return the heavy modules imported by `<name> --help`."""
+    result = subprocess.run([sys.executable, '-c', PROBE, str(UTILITIES_DIR), name, *HEAVY_MODULES],
+                            capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark command startup time'
+    )
+    parser.add_argument('--repeat', type=int, default=10,
+                       help='Runs per command; the best is reported (default: 10)')
+    
+    args = parser.parse_args()
+    python = sys.executable
+    
+    baseline, _ = best_of(args.repeat, run_quiet, [python, '-c', 'pass'])
+    
+    print("=" * 60)
+    print(f"STARTUP BENCHMARK (--help, best of {args.repeat}, ms above python -c pass)")
+    print("=" * 60)
+    print(f"  python -c pass          {baseline * 1000:7.1f} ms total")
+    seconds, _ = best_of(args.repeat, run_quiet, [python, 'prompt-tools.py', '--help'])
+    print(f"  prompt-tools.py         {(seconds - baseline) * 1000:+7.1f} ms")
+    print("-" * 60)
+    print(f"  {'command':<17} {'script':>8} {'-m':>8}  heavy imports")
+    
+    clean = True
+    for name in COMMANDS:
+        script = '-'
+        if name in SCRIPTS:
+            seconds, _ = best_of(args.repeat, run_quiet, [python, SCRIPTS[name], '--help'])
+            script = f"{(seconds - baseline) * 1000:+.1f}"
+        module, _ = best_of(args.repeat, run_quiet, [python, '-m', 'prompt_tools', name, '--help'])
+        heavy = heavy_imports(name)
+        clean &= not heavy
+        print(f"  {name:<17} {script:>8} {(module - baseline) * 1000:+8.1f}  {heavy or 'none'}")
+    print("=" * 60)
+    
+    sys.exit(0 if clean else 1)
+
+
+if __name__ == '__main__':
+    main()
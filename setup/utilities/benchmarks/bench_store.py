@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Artifact Store Benchmark
+
+Write the same build output repeatedly, the way the utilities write it:
+
+  atomic        - files.atomic_output() for every file, every build
+  store         - ArtifactStore.write(): hash, store new content once, link
+
+Each method runs a first build into an empty directory, a repeat build
+with nothing changed, and a build where --change-ratio of the files
+changed. A --duplicate-ratio share of the files repeat the content of
+another file, as generated prompts that differ only by name do. The
+report gives the time and the bytes written for each build, and checks
+that both methods leave identical files.
+
+Usage:
+    python benchmarks/bench_store.py
+    python benchmarks/bench_store.py --files 5000 --size 8192 --duplicate-ratio 0.5
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+UTILITIES_DIR = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(UTILITIES_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import best_of
+from prompt_tools.files import atomic_output
+from prompt_tools.store import ArtifactStore
+
+WORDS = ('prompt', 'context', 'review', 'agent', 'template', 'section', 'output', 'token')
+
+
+def generate_outputs(files: int, size: int, duplicate_ratio: float, seed: int = 0):
+    """Return {relative path: text}, with duplicate_ratio of the texts repeated."""
+    rng = random.Random(seed)
+    distinct = max(1, round(files * (1 - duplicate_ratio)))
+    texts = []
+    for _ in range(distinct):
+        words = []
+        length = 0
+        while length < size:
+            word = rng.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+        texts.append(' '.join(words) + '\n')
+    return {f"group_{i % 20}/prompt_{i}.md": texts[i % distinct] for i in range(files)}
+
+
+def change(outputs, ratio: float, seed: int = 1):
+    """Return a copy of outputs with ratio of the files edited."""
+    rng = random.Random(seed)
+    changed = dict(outputs)
+    for name in rng.sample(sorted(outputs), round(len(outputs) * ratio)):
+        changed[name] = outputs[name] + f"edited {rng.random()}\n"
+    return changed
+
+
+def build_atomic(outputs, out_dir: Path):
+    written = 0
+    for name, text in outputs.items():
+        target = out_dir / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_output(target) as f:
+            f.write(text)
+        written += len(text.encode('utf-8'))
+    return written
+
+
+def build_store(store: ArtifactStore):
+    def build(outputs, out_dir: Path):
+        before = sum(stat.st_size for _, stat in store.iter_objects())
+        for name, text in outputs.items():
+            target = out_dir / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            store.write(target, text)
+        return sum(stat.st_size for _, stat in store.iter_objects()) - before
+    return build
+
+
+def read_tree(out_dir: Path):
+    return {str(p.relative_to(out_dir)): p.read_text(encoding='utf-8')
+            for p in out_dir.rglob('*') if p.is_file()}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark artifact store writes against plain atomic writes'
+    )
+    parser.add_argument('--files', type=int, default=2000,
+                       help='Output files per build (default: 2000)')
+    parser.add_argument('--size', type=int, default=4096,
+                       help='Approximate bytes per file (default: 4096)')
+    parser.add_argument('--duplicate-ratio', type=float, default=0.3,
+                       help='Share of files that repeat another file (default: 0.3)')
+    parser.add_argument('--change-ratio', type=float, default=0.05,
+                       help='Share of files edited before the last build (default: 0.05)')
+    
+    args = parser.parse_args()
+    
+    outputs = generate_outputs(args.files, args.size, args.duplicate_ratio)
+    edited = change(outputs, args.change_ratio)
+    builds = [('first build', outputs), ('unchanged', outputs),
+              (f"{args.change_ratio:.0%} changed", edited)]
+    
+    print("=" * 60)
+    print(f"ARTIFACT STORE BENCHMARK ({args.files:,} files, "
+          f"{args.duplicate_ratio:.0%} duplicates)")
+    print("=" * 60)
+    
+    with tempfile.TemporaryDirectory() as temp:
+        temp = Path(temp)
+        methods = [('atomic', build_atomic),
+                   ('store', build_store(ArtifactStore(temp / 'artifacts')))]
+        trees = {}
+        for method, build in methods:
+            out_dir = temp / 'out' / method
+            for label, data in builds:
+                seconds, written = best_of(1, build, data, out_dir)
+                print(f"  {method:<7} {label:<13} {seconds * 1000:9.1f} ms  "
+                      f"{written:>12,} bytes written")
+            trees[method] = read_tree(out_dir)
+        print("-" * 60)
+        same = trees['atomic'] == trees['store'] == edited
+        print(f"  Output: {'identical' if same else 'DIFFERENT'}")
+    print("=" * 60)
+    
+    sys.exit(0 if same else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Utility Benchmark Suite
+
+Time the main code path of each utility on synthetic corpora of several
+sizes (see benchmarks/corpus.py):
+
+  template-interpolator  TemplateInterpolator.interpolate() on every prompt
+  prompt-validator       PromptValidator.validate_file() on every prompt
+  token-counter          TokenCounter.count_file_tokens() on every prompt
+  xml-to-yaml            XMLToYAMLConverter.convert_file() on every XML file
+  validate-references    validate_tree() over the prompt tree
+
+Results are saved as JSON together with the commit, Python version and
+corpus settings, so runs on different commits can be compared; --compare
+reports the change against an earlier results file and exits with 1 when a
+benchmark got slower than the tolerance allows.
+
+Usage:
+    python benchmarks/bench_suite.py --output results.json
+    python benchmarks/bench_suite.py --sizes 100 1000 --compare baseline.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+UTILITIES_DIR = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(UTILITIES_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import corpus as corpus_generator
+from corpus import best_of
+from prompt_tools import prompt_validator, template_interpolator, validate_references, xml_to_yaml
+
+RESULTS_FORMAT = 'benchmark-results'
+RESULTS_VERSION = 1
+
+TOOLS = ('template-interpolator', 'prompt-validator', 'token-counter',
+         'xml-to-yaml', 'validate-references')
+
+
+def make_workloads(corpus: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    """Return {tool: function} for the corpus; a tool that cannot run maps to its reason."""
+    workloads = {}
+    prompt_files = corpus['prompt_files']
+    template_dir = corpus['template_dir']
+    
+    def run_interpolator():
+        interpolator = template_interpolator.TemplateInterpolator(template_dir, warn_missing=False)
+        for path in prompt_files:
+            with open(path, 'r', encoding='utf-8') as f:
+                interpolator.interpolate(f.read(), corpus['variables'])
+    
+    workloads['template-interpolator'] = run_interpolator
+    
+    def run_validator():
+        validator = prompt_validator.PromptValidator(template_dir)
+        for path in prompt_files:
+            validator.validate_file(path)
+    
+    workloads['prompt-validator'] = run_validator
+    
+    # The token counter needs tiktoken, and TokenCounter() fails when the
+    # encoding cannot be downloaded
+    try:
+        from prompt_tools.token_counter import TokenCounter
+        counter = TokenCounter()
+    except Exception as e:
+        workloads['token-counter'] = f"unavailable: {type(e).__name__}: {str(e)[:80]}"
+    else:
+        def run_counter():
+            for path in prompt_files:
+                counter.count_file_tokens(path)
+        
+        workloads['token-counter'] = run_counter
+    
+    output_dir = corpus['root'] / 'yaml'
+    output_dir.mkdir(exist_ok=True)
+    
+    def run_converter():
+        converter = xml_to_yaml.XMLToYAMLConverter()
+        for path in corpus['xml_files']:
+            converter.convert_file(path, output_dir / f"{path.stem}.yaml")
+    
+    workloads['xml-to-yaml'] = run_converter
+    
+    def run_references():
+        validate_references.validate_tree(corpus['prompts_dir'], corpus['setup_path'],
+                                          ['shared-components.yaml'])
+    
+    workloads['validate-references'] = run_references
+    return workloads
+
+
+def time_workload(function, repeat: int) -> Dict[str, float]:
+    """Return the best and mean seconds of repeat runs."""
+    times = [best_of(1, function)[0] for _ in range(repeat)]
+    return {'best': round(min(times), 6), 'mean': round(sum(times) / len(times), 6)}
+
+
+def git_commit() -> Optional[str]:
+    """Return the current commit of the repository, or None outside git."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=UTILITIES_DIR,
+                                capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_suite(sizes: List[int], tools: List[str], repeat: int,
+              settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate a corpus per size and time every selected tool on it."""
+    results = []
+    skipped = {}
+    for files in sizes:
+        with tempfile.TemporaryDirectory() as temp:
+            corpus = corpus_generator.generate_corpus(Path(temp) / 'corpus', files=files, **settings)
+            workloads = make_workloads(corpus)
+            for tool in tools:
+                workload = workloads[tool]
+                if isinstance(workload, str):
+                    skipped[tool] = workload
+                    continue
+                timing = time_workload(workload, repeat)
+                count = len(corpus['xml_files']) if tool == 'xml-to-yaml' else files
+                results.append({
+                    'tool': tool,
+                    'files': files,
+                    'inputs': count,
+                    'bytes': corpus['bytes'],
+                    **timing,
+                    'inputs_per_second': round(count / timing['best'], 1) if timing['best'] else None,
+                })
+                print(f"  {tool:<22} {files:>7,} files  {timing['best'] * 1000:10.1f} ms",
+                      flush=True)
+    
+    return {
+        'format': RESULTS_FORMAT,
+        'version': RESULTS_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'corpus': dict(settings, sizes=sizes),
+        'results': results,
+        'skipped': skipped,
+    }
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    """Read a results file written by this script."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('format') != RESULTS_FORMAT or data.get('version') != RESULTS_VERSION:
+        raise ValueError("not a benchmark results file, or written by another version")
+    return data
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    tolerance: float) -> List[Dict[str, Any]]:
+    """Return one row per benchmark present in both runs, with its time ratio."""
+    before = {(r['tool'], r['files']): r for r in baseline['results']}
+    rows = []
+    for result in current['results']:
+        old = before.get((result['tool'], result['files']))
+        if old is None or not old['best']:
+            continue
+        ratio = result['best'] / old['best']
+        rows.append({
+            'tool': result['tool'],
+            'files': result['files'],
+            'before': old['best'],
+            'after': result['best'],
+            'ratio': round(ratio, 3),
+            'regression': ratio > 1 + tolerance,
+        })
+    return rows
+
+
+def print_comparison(rows: List[Dict[str, Any]], baseline: Dict[str, Any],
+                     current: Dict[str, Any], tolerance: float):
+    """Print the comparison table."""
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'} "
+          f"({baseline.get('created')}), tolerance {tolerance:.0%}:")
+    for row in rows:
+        flag = '  REGRESSION' if row['regression'] else ''
+        print(f"  {row['tool']:<22} {row['files']:>7,} files  {row['before'] * 1000:9.1f} -> "
+              f"{row['after'] * 1000:9.1f} ms  ({row['ratio']:.2f}x){flag}")
+    settings = {key: value for key, value in baseline['corpus'].items() if key != 'sizes'}
+    if settings != {key: value for key, value in current['corpus'].items() if key != 'sizes'}:
+        print(f"  Note: the baseline used other corpus settings: {settings}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the setup utilities on synthetic corpora',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Run every benchmark at the default sizes and save the results
+  python benchmarks/bench_suite.py --output results.json
+  
+  # Compare with results saved on another commit
+  python benchmarks/bench_suite.py --compare results.json --tolerance 0.15
+  
+  # Only the validator, on bigger files with deeper template nesting
+  python benchmarks/bench_suite.py --tools prompt-validator --size 16384 --depth 8
+        """
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000],
+                       help='Corpus sizes in prompt files (default: 100 1000)')
+    parser.add_argument('--tools', nargs='+', choices=TOOLS, default=list(TOOLS),
+                       help='Utilities to benchmark (default: all)')
+    parser.add_argument('--repeat', type=int, default=3,
+                       help='Runs per benchmark; best and mean are saved (default: 3)')
+    parser.add_argument('--size', type=int, default=corpus_generator.DEFAULTS['size'],
+                       help='Approximate bytes per prompt file')
+    parser.add_argument('--depth', type=int, default=corpus_generator.DEFAULTS['depth'],
+                       help='Template nesting depth')
+    parser.add_argument('--ref-density', type=float, default=corpus_generator.DEFAULTS['ref_density'],
+                       help='$ref: lines per KB of prompt text')
+    parser.add_argument('--xml-depth', type=int, default=corpus_generator.DEFAULTS['xml_depth'],
+                       help='Nesting depth of XML documents')
+    parser.add_argument('--seed', type=int, default=corpus_generator.DEFAULTS['seed'],
+                       help='Corpus random seed')
+    parser.add_argument('--output', '-o', type=Path, help='Save results as JSON')
+    parser.add_argument('--compare', type=Path, help='Results file to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                       help='Slowdown allowed before --compare reports a regression (default: 0.10)')
+    
+    args = parser.parse_args()
+    
+    baseline = None
+    if args.compare:
+        try:
+            baseline = load_results(args.compare)
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not load {args.compare}: {e}")
+            sys.exit(1)
+    
+    settings = {'size': args.size, 'depth': args.depth, 'ref_density': args.ref_density,
+                'xml_depth': args.xml_depth, 'seed': args.seed}
+    
+    print("=" * 60)
+    print(f"UTILITY BENCHMARK SUITE (best of {args.repeat})")
+    print("=" * 60)
+    try:
+        results = run_suite(args.sizes, args.tools, args.repeat, settings)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    for tool, reason in results['skipped'].items():
+        print(f"  {tool:<22} skipped ({reason})")
+    
+    regressions = 0
+    if baseline is not None:
+        rows = compare_results(baseline, results, args.tolerance)
+        print_comparison(rows, baseline, results, args.tolerance)
+        regressions = sum(row['regression'] for row in rows)
+        results['comparison'] = {'baseline_commit': baseline.get('commit'), 'rows': rows}
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+    print("=" * 60)
+    
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+XML Conversion Benchmark
+
+Compare the two-pass conversion (recursive xml_to_dict, then a cleaning copy
+with clean_yaml_structure, then yaml.dump) against the one-pass
+element_to_yaml with the non-recursive block dumper, on synthetic deep
+(long chain of nested elements) and wide (many siblings) XML documents.
+
+Both stages are timed separately. Where the two-pass version completes, the
+outputs are compared; where it hits the recursion limit, that is reported.
+
+Usage:
+    python benchmarks/bench_xml_convert.py
+    python benchmarks/bench_xml_convert.py --depths 250 5000 --width 200000
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+UTILITIES_DIR = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(UTILITIES_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import best_of
+from prompt_tools import yaml_io
+from prompt_tools.xml_to_yaml import XMLToYAMLConverter
+
+
+def generate_deep_xml(depth: int) -> str:
+    """Return a document whose elements are nested depth levels deep."""
+    opening = [f'<level n="{i}">text {i}<note>at {i}</note>' for i in range(depth)]
+    closing = [f'</level>tail {i}' for i in reversed(range(depth))]
+    return '<root>' + ''.join(opening) + ''.join(closing) + '</root>'
+
+
+def generate_wide_xml(width: int) -> str:
+    """Return a document whose root has width children."""
+    parts = ['<root version="1.0">']
+    for i in range(width):
+        if i % 10 == 0:
+            parts.append(f'<section name="s{i}"><title>Section {i}</title>'
+                         f'<step>one</step><step>two</step></section>')
+        else:
+            parts.append(f'<item id="{i}">Item {i}</item>')
+    parts.append('</root>')
+    return ''.join(parts)
+
+
+def two_pass(converter, root: ET.Element):
+    """Return the structure the way convert_file() used to build it."""
+    return converter.clean_yaml_structure({root.tag: converter.xml_to_dict(root)})
+
+
+def two_pass_dump(data) -> str:
+    """Dump with PyYAML's recursive representer, as dump_yaml() used to."""
+    return yaml_io.safe_dump(data, default_flow_style=False, allow_unicode=True,
+                             sort_keys=False, width=80, indent=2)
+
+
+def one_pass(converter, root: ET.Element):
+    """Return the structure the way convert_file() builds it now."""
+    return {root.tag: converter.element_to_yaml(root)}
+
+
+def one_pass_dump(data) -> str:
+    """Dump with the non-recursive block dumper used by dump_yaml()."""
+    return yaml_io.dump_block(data, sort_keys=False, allow_unicode=True, width=80, indent=2)
+
+
+def attempt(function, *args):
+    """Return function(*args), or the RecursionError it raised."""
+    try:
+        return function(*args)
+    except RecursionError as e:
+        return e
+
+
+def run_workload(converter, title: str, xml: str):
+    """Convert one document both ways and print a comparison."""
+    root = ET.fromstring(xml)
+    print(f"\n{title} ({len(xml) / (1024 * 1024):.2f} MB XML):")
+    
+    outputs = {}
+    for label, build, dump in [('two-pass', two_pass, two_pass_dump),
+                               ('one-pass', one_pass, one_pass_dump)]:
+        build_seconds, data = best_of(1, attempt, build, converter, root)
+        if isinstance(data, RecursionError):
+            print(f"  {label:<9} structure: RecursionError after {build_seconds * 1000:.1f} ms")
+            continue
+        dump_seconds, text = best_of(1, attempt, dump, data)
+        if isinstance(text, RecursionError):
+            print(f"  {label:<9} structure {build_seconds * 1000:9.1f} ms  "
+                  f"dump: RecursionError")
+            continue
+        outputs[label] = text
+        print(f"  {label:<9} structure {build_seconds * 1000:9.1f} ms  "
+              f"dump {dump_seconds * 1000:9.1f} ms  "
+              f"total {(build_seconds + dump_seconds) * 1000:9.1f} ms")
+    
+    if len(outputs) == 2:
+        same = outputs['two-pass'] == outputs['one-pass']
+        print(f"  Output: {'identical' if same else 'DIFFERENT'}")
+        return same
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark two-pass vs one-pass XML to YAML conversion'
+    )
+    parser.add_argument('--depths', type=int, nargs='+', default=[250, 2000],
+                       help='Nesting depths for the deep documents (default: 250 2000)')
+    parser.add_argument('--width', type=int, default=100000,
+                       help='Number of root children for the wide document (default: 100000)')
+    
+    args = parser.parse_args()
+    
+    converter = XMLToYAMLConverter()
+    
+    print("=" * 60)
+    print(f"XML CONVERSION BENCHMARK (libyaml: {'yes' if yaml_io.LIBYAML else 'no'})")
+    print("=" * 60)
+    
+    all_same = True
+    for depth in args.depths:
+        all_same &= run_workload(converter, f"Deep, {depth:,} levels", generate_deep_xml(depth))
+    all_same &= run_workload(converter, f"Wide, {args.width:,} children",
+                             generate_wide_xml(args.width))
+    
+    print("=" * 60)
+    
+    sys.exit(0 if all_same else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+YAML I/O Benchmark
+
+Run each utility's YAML-heavy code path over a representative corpus twice:
+once with the pure-Python SafeLoader/SafeDumper and once with libyaml's
+CSafeLoader/CSafeDumper (see prompt_tools/yaml_io.py). Outputs of the two runs
+are compared so a speedup never comes at the cost of different results.
+
+The corpus is built from the repository's own prompt YAML (templates and
+shared components), copied and scaled up, plus a generated variables file and
+a generated XML prompt archive.
+
+Usage:
+    python benchmarks/bench_yaml_io.py
+    python benchmarks/bench_yaml_io.py --scale 50 --repeat 5
+"""
+
+import argparse
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+UTILITIES_DIR = Path(__file__).resolve().parent.parent
+SETUP_DIR = UTILITIES_DIR.parent
+
+sys.path.insert(0, str(UTILITIES_DIR))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import best_of
+from prompt_tools import (prompt_validator, template_interpolator, validate_references, xml_to_yaml,
+                          yaml_io)
+
+
+def component_refs(data, path: str = ''):
+    """Yield a JSON-pointer path for every mapping value in data."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            child = f"{path}/{key}"
+            yield child
+            yield from component_refs(value, child)
+
+
+def build_corpus(root: Path, scale: int, seed: int = 42) -> dict:
+    """Write the benchmark corpus under root and return its paths."""
+    rng = random.Random(seed)
+    
+    prompts_dir = root / 'prompts'
+    prompts_dir.mkdir()
+    sources = sorted((SETUP_DIR / 'templates').glob('*.yaml'))
+    sources.append(SETUP_DIR / 'shared-components.yaml')
+    prompt_files = []
+    for i in range(scale):
+        for source in sources:
+            target = prompts_dir / f"{source.stem}_{i}.yaml"
+            shutil.copyfile(source, target)
+            prompt_files.append(target)
+    
+    variables = {
+        f"var_{i}": {
+            'name': f"component {i}",
+            'severity': rng.choice(['low', 'medium', 'high']),
+            'description': ' '.join(rng.choice(['check', 'the', 'input', 'before',
+                                                'refactoring', 'module'])
+                                    for _ in range(12)),
+            'tags': [f"tag{rng.randrange(50)}" for _ in range(4)],
+        }
+        for i in range(scale * 100)
+    }
+    variables_file = root / 'variables.yaml'
+    with open(variables_file, 'w', encoding='utf-8') as f:
+        yaml_io.safe_dump(variables, f, default_flow_style=False)
+    
+    shutil.copyfile(SETUP_DIR / 'shared-components.yaml', root / 'shared-components.yaml')
+    with open(root / 'shared-components.yaml', 'r', encoding='utf-8') as f:
+        components = yaml_io.safe_load(f)
+    refs = [f"shared-components.yaml#{path}" for path in component_refs(components)]
+    
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<prompts>']
+    for i in range(scale * 200):
+        lines.append(f'  <!-- prompt {i} -->')
+        lines.append(f'  <prompt id="p{i}" category="{rng.choice(["review", "refactor"])}">')
+        lines.append(f'    <title>{escape(f"Prompt {i} & friends")}</title>')
+        lines.append('    <instructions>')
+        for step in range(3):
+            lines.append(f'      <step order="{step}">Do step {step} for {{{{file_path}}}}</step>')
+        lines.append('    </instructions>')
+        lines.append('  </prompt>')
+    lines.append('</prompts>')
+    xml_file = root / 'prompts.xml'
+    xml_file.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    
+    return {
+        'prompt_files': prompt_files,
+        'variables_file': variables_file,
+        'refs': refs * scale,
+        'xml_file': xml_file,
+        'root': root,
+    }
+
+
+def make_workloads(corpus: dict):
+    """Return [(tool, description, function)]; each function returns its output."""
+    def run_validator():
+        validator = prompt_validator.PromptValidator()
+        return [[issue.to_dict() for issue in validator.validate_file(path)]
+                for path in corpus['prompt_files']]
+    
+    def run_interpolator():
+        return template_interpolator.load_variables_file(corpus['variables_file'])
+    
+    def run_references():
+        return [validate_references.validate_reference(ref, corpus['root'])
+                for ref in corpus['refs']]
+    
+    def run_converter():
+        output = corpus['root'] / 'prompts.yaml'
+        xml_to_yaml.XMLToYAMLConverter().convert_file(corpus['xml_file'], output)
+        return output.read_bytes()
+    
+    return [
+        ('prompt-validator', f"validate {len(corpus['prompt_files'])} files", run_validator),
+        ('template-interpolator', 'load variables file', run_interpolator),
+        ('validate-references', f"check {len(corpus['refs'])} refs", run_references),
+        ('xml-to-yaml', 'convert XML archive', run_converter),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark pure-Python vs libyaml YAML I/O for each utility'
+    )
+    parser.add_argument('--scale', type=int, default=20,
+                       help='Corpus scale factor (default: 20)')
+    parser.add_argument('--repeat', type=int, default=3,
+                       help='Runs per implementation; the best time is reported (default: 3)')
+    
+    args = parser.parse_args()
+    
+    if not yaml_io.LIBYAML_AVAILABLE:
+        print("Error: PyYAML was built without libyaml; nothing to compare")
+        sys.exit(1)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = build_corpus(Path(tmp), args.scale)
+        workloads = make_workloads(corpus)
+        
+        print("=" * 60)
+        print(f"YAML I/O BENCHMARK (scale {args.scale}, best of {args.repeat})")
+        print("=" * 60)
+        
+        mismatches = 0
+        for tool, description, function in workloads:
+            yaml_io.use_libyaml(False)
+            pure_seconds, pure_output = best_of(args.repeat, function)
+            yaml_io.use_libyaml(True)
+            c_seconds, c_output = best_of(args.repeat, function)
+            
+            same = pure_output == c_output
+            mismatches += not same
+            print(f"\n{tool} ({description}):")
+            print(f"  {'pure Python':<14} {pure_seconds * 1000:9.1f} ms")
+            print(f"  {'libyaml':<14} {c_seconds * 1000:9.1f} ms")
+            print(f"  Speedup: {pure_seconds / c_seconds:.2f}x  "
+                  f"Output: {'identical' if same else 'DIFFERENT'}")
+        
+        print("=" * 60)
+    
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Synthetic Prompt Corpus
+
+Generate a reproducible prompt tree for benchmarking the utilities. The
+same arguments and seed always give byte-for-byte the same files.
+
+Layout under the output directory:
+  shared-components.yaml  - component groups; some components $ref: others
+  templates/              - template chains: each level includes the next
+                            through {{name}} or @include(name), alternately,
+                            down to the nesting depth; the last level uses
+                            variables ($language, %{team}, {{project.name}})
+  prompts/group_N/        - prompt files (.md and .yaml) of about the given
+                            size, each including one template chain and
+                            holding $ref: lines at the given density
+  xml/                    - XML prompt documents nested to the given depth
+
+best_of() is the timing loop every benchmark script uses.
+
+Usage:
+    python benchmarks/corpus.py corpus/ --files 1000
+    python benchmarks/corpus.py corpus/ --files 200 --size 8192 --depth 6 --ref-density 2
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+WORDS = (
+    'analyze', 'the', 'code', 'and', 'report', 'every', 'issue', 'with', 'its',
+    'location', 'suggest', 'a', 'clear', 'fix', 'keep', 'answers', 'short', 'focus',
+    'on', 'correctness', 'before', 'style', 'explain', 'why', 'each', 'change', 'matters',
+)
+
+# Shape of shared-components.yaml
+COMPONENT_GROUPS = 10
+COMPONENTS_PER_GROUP = 10
+
+# Independent template chains; every prompt includes the top of one
+TEMPLATE_FAMILIES = 8
+
+# Values for the variables used by the deepest templates
+VARIABLES = {
+    'language': 'python',
+    'team': 'platform',
+    'project': {'name': 'corpus'},
+}
+
+DEFAULTS = {
+    'files': 1000,
+    'size': 4096,
+    'depth': 4,
+    'ref_density': 1.0,
+    'xml_depth': 8,
+    'seed': 42,
+}
+
+
+def sentence(rng: random.Random, low: int = 6, high: int = 16) -> str:
+    """Return one sentence of filler words."""
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(low, high))).capitalize() + '.'
+
+
+def component_ref(rng: random.Random) -> str:
+    """Return a $ref: target for a random component."""
+    group = rng.randrange(COMPONENT_GROUPS)
+    component = rng.randrange(COMPONENTS_PER_GROUP)
+    return f"shared-components.yaml#/group_{group}/component_{component}"
+
+
+def write_components(root: Path, rng: random.Random):
+    """Write shared-components.yaml; components may reference earlier groups."""
+    lines = []
+    for group in range(COMPONENT_GROUPS):
+        lines.append(f"group_{group}:")
+        for component in range(COMPONENTS_PER_GROUP):
+            lines.append(f"  component_{component}:")
+            lines.append(f"    description: {sentence(rng, 3, 6)}")
+            lines.append(f"    content: {sentence(rng)}")
+            if group > 0 and rng.random() < 0.3:
+                target = f"group_{rng.randrange(group)}/component_{rng.randrange(COMPONENTS_PER_GROUP)}"
+                lines.append(f"    extends: \"$ref: shared-components.yaml#/{target}\"")
+    (root / 'shared-components.yaml').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def write_templates(template_dir: Path, depth: int, rng: random.Random):
+    """Write TEMPLATE_FAMILIES chains of depth nested templates."""
+    template_dir.mkdir(parents=True)
+    for family in range(TEMPLATE_FAMILIES):
+        for level in range(depth):
+            lines = [f"Template {family}.{level}: {sentence(rng)}"]
+            if level + 1 < depth:
+                child = f"family_{family}_level_{level + 1}"
+                lines.append(f"{{{{{child}}}}}" if level % 2 == 0 else f"@include({child})")
+            else:
+                lines.append("Write $language for team %{team} in {{project.name}}.")
+            (template_dir / f"family_{family}_level_{level}.txt").write_text(
+                '\n'.join(lines) + '\n', encoding='utf-8')
+
+
+def prompt_body(rng: random.Random, size: int, ref_density: float, family: int) -> list:
+    """Return the lines of a prompt of about size bytes."""
+    lines = [f"{{{{family_{family}_level_0}}}}", ""]
+    total = 0
+    # Expected $ref: lines per line of text, from refs per KB
+    per_line = ref_density / 1024
+    while total < size:
+        line = ' '.join(sentence(rng) for _ in range(rng.randint(1, 3)))
+        if rng.random() < per_line * (len(line) + 1):
+            line = f"$ref: {component_ref(rng)}"
+        lines.append(line)
+        total += len(line) + 1
+    return lines
+
+
+def write_prompts(prompts_dir: Path, files: int, size: int, ref_density: float,
+                  rng: random.Random) -> list:
+    """Write the prompt files; every other file is YAML. Returns their paths."""
+    paths = []
+    for i in range(files):
+        folder = prompts_dir / f"group_{i % 20}"
+        folder.mkdir(parents=True, exist_ok=True)
+        lines = prompt_body(rng, size, ref_density, i % TEMPLATE_FAMILIES)
+        if i % 2:
+            path = folder / f"prompt_{i}.yaml"
+            body = '\n'.join(f"  {line}" if line else '' for line in lines)
+            text = (f"metadata:\n  version: '1.0'\n  description: Prompt {i}\n"
+                    f"content: |\n{body}\n")
+        else:
+            path = folder / f"prompt_{i}.md"
+            text = f"# Prompt {i}\n\n" + '\n'.join(lines) + '\n'
+        path.write_text(text, encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def xml_document(rng: random.Random, depth: int, index: int) -> str:
+    """Return an XML prompt nested depth sections deep, a few siblings per level."""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             f'<!-- Synthetic prompt {index} -->',
+             f'<prompt id="p{index}" version="1.0">']
+    
+    def section(level: int, indent: str):
+        lines.append(f'{indent}<section level="{level}">')
+        lines.append(f'{indent}  <title>{sentence(rng, 2, 5)}</title>')
+        for _ in range(rng.randint(1, 3)):
+            lines.append(f'{indent}  <instruction>{sentence(rng)}</instruction>')
+        if level + 1 < depth:
+            for _ in range(2 if level < 3 else 1):
+                section(level + 1, indent + '  ')
+        lines.append(f'{indent}</section>')
+    
+    section(0, '  ')
+    lines.append('</prompt>')
+    return '\n'.join(lines) + '\n'
+
+
+def write_xml(xml_dir: Path, count: int, depth: int, rng: random.Random) -> list:
+    """Write count XML documents; returns their paths."""
+    xml_dir.mkdir(parents=True)
+    paths = []
+    for i in range(count):
+        path = xml_dir / f"prompt_{i}.xml"
+        path.write_text(xml_document(rng, depth, i), encoding='utf-8')
+        paths.append(path)
+    return paths
+
+
+def generate_corpus(root: Path, files: int = DEFAULTS['files'], size: int = DEFAULTS['size'],
+                    depth: int = DEFAULTS['depth'], ref_density: float = DEFAULTS['ref_density'],
+                    xml_depth: int = DEFAULTS['xml_depth'],
+                    seed: int = DEFAULTS['seed']) -> Dict[str, Any]:
+    """Write a corpus under root and return a description of it.
+    
+    files is the number of prompt files, size their approximate size in
+    bytes, depth the template nesting depth, ref_density the number of
+    $ref: lines per KB of prompt text and xml_depth the nesting of the XML
+    documents (one per ten prompt files).
+    """
+    if files < 1 or size < 1 or depth < 1 or xml_depth < 1 or ref_density < 0:
+        raise ValueError("files, size, depth and xml_depth must be positive, ref_density >= 0")
+    rng = random.Random(seed)
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    
+    write_components(root, rng)
+    write_templates(root / 'templates', depth, rng)
+    prompt_files = write_prompts(root / 'prompts', files, size, ref_density, rng)
+    xml_files = write_xml(root / 'xml', max(1, files // 10), xml_depth, rng)
+    (root / 'variables.json').write_text(json.dumps(VARIABLES, indent=2) + '\n', encoding='utf-8')
+    
+    return {
+        'root': root,
+        'setup_path': root,
+        'template_dir': root / 'templates',
+        'prompts_dir': root / 'prompts',
+        'prompt_files': prompt_files,
+        'xml_files': xml_files,
+        'variables': VARIABLES,
+        'spec': {'files': files, 'size': size, 'depth': depth, 'ref_density': ref_density,
+                 'xml_depth': xml_depth, 'seed': seed},
+        'bytes': sum(path.stat().st_size for path in prompt_files),
+    }
+
+
+def best_of(repeat: int, func, *args):
+    """Return (best seconds, result of the last run) over repeat runs of func(*args)."""
+    best = None
+    result = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = func(*args)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate a reproducible synthetic prompt corpus'
+    )
+    parser.add_argument('output', type=Path, help='Directory to write the corpus to (must not exist)')
+    parser.add_argument('--files', type=int, default=DEFAULTS['files'],
+                       help=f"Prompt files (default: {DEFAULTS['files']})")
+    parser.add_argument('--size', type=int, default=DEFAULTS['size'],
+                       help=f"Approximate bytes per prompt file (default: {DEFAULTS['size']})")
+    parser.add_argument('--depth', type=int, default=DEFAULTS['depth'],
+                       help=f"Template nesting depth (default: {DEFAULTS['depth']})")
+    parser.add_argument('--ref-density', type=float, default=DEFAULTS['ref_density'],
+                       help=f"$ref: lines per KB of prompt text (default: {DEFAULTS['ref_density']})")
+    parser.add_argument('--xml-depth', type=int, default=DEFAULTS['xml_depth'],
+                       help=f"Nesting depth of XML documents (default: {DEFAULTS['xml_depth']})")
+    parser.add_argument('--seed', type=int, default=DEFAULTS['seed'],
+                       help=f"Random seed (default: {DEFAULTS['seed']})")
+    
+    args = parser.parse_args()
+    
+    if args.output.exists():
+        print(f"Error: {args.output} already exists")
+        sys.exit(1)
+    try:
+        corpus = generate_corpus(args.output, args.files, args.size, args.depth,
+                                 args.ref_density, args.xml_depth, args.seed)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    print(f"Wrote {len(corpus['prompt_files'])} prompt files ({corpus['bytes']:,} bytes), "
+          f"{len(corpus['xml_files'])} XML files and {TEMPLATE_FAMILIES * args.depth} templates "
+          f"to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
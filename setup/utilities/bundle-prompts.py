@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Prompt Bundler
+
+Same as `python -m prompt_tools bundle`; the implementation is in
+prompt_tools/bundle_prompts.py.
+"""
+
+from prompt_tools.commands import bundle
+
+if __name__ == '__main__':
+    bundle.main()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Duplicate Block Detector
+
+Same as `python -m prompt_tools find-duplicates`; the implementation is in
+prompt_tools/find_duplicates.py.
+"""
+
+from prompt_tools.commands import find_duplicates
+
+if __name__ == '__main__':
+    find_duplicates.main()
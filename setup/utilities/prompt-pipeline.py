@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Prompt Pipeline
+
+Same as `python -m prompt_tools pipeline`; the implementation is in
+prompt_tools/prompt_pipeline.py.
+"""
+
+from prompt_tools.commands import pipeline
+
+if __name__ == '__main__':
+    pipeline.main()
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Prompt Tools
+
+Run any of the utilities as a subcommand:
+
+    python prompt-tools.py <command> [arguments]
+    python prompt-tools.py --help
+
+See prompt_tools/cli.py for the list of commands.
+"""
+
+from prompt_tools.cli import main
+
+if __name__ == '__main__':
+    main()
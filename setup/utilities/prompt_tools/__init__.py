@@ -0,0 +1,16 @@
+"""
+Shared building blocks for the prompt optimization utilities.
+
+The command-line scripts in setup/utilities import from this package so that
+reference syntax and other common behaviour stay consistent between tools.
+Each utility's implementation is a module here (prompt_validator,
+xml_to_yaml, ...); prompt_tools.cli runs them all as subcommands of one
+entry point, and the hyphenated scripts are kept as shims for it.
+"""
+
+from pathlib import Path
+
+# setup/, which holds shared-components.yaml and the templates, and the
+# project root above it: the default locations the utilities work on
+SETUP_DIR = Path(__file__).resolve().parent.parent.parent
+PROJECT_ROOT = SETUP_DIR.parent
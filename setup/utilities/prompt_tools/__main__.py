@@ -0,0 +1,5 @@
+"""Run the prompt tools command line: python -m prompt_tools <command>."""
+
+from prompt_tools.cli import main
+
+main()
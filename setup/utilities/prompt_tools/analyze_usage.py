@@ -0,0 +1,251 @@
+"""
+Component Usage Analyzer
+
+Walk a project once and build an inverted index of what every prompt file
+uses: $ref: targets (shared components and templates) and template
+references such as {{name}} or @include(name), each mapped to the files
+that use it and how often.
+
+The index can be saved and loaded again, so follow-up questions ("who uses
+this component?", "what does this file reference?") are answered without
+rescanning the tree.
+
+Usage:
+    python analyze-usage.py [root]
+    python analyze-usage.py --save-index usage-index.json
+    python analyze-usage.py --index usage-index.json --query task_focus
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import profiling
+from .references import (canonical_reference, discover_prompt_files, extract_references,
+                         reference_text)
+from .scanning import KIND_TEMPLATE, scan_references
+
+INDEX_FORMAT = 'usage-index'
+INDEX_VERSION = 1
+
+# $ref: targets under this directory are templates, not shared components
+TEMPLATES_PREFIX = 'templates/'
+
+
+class UsageIndex:
+    """Inverted index from referenced names to {file: count}.
+    
+    refs holds $ref: targets in canonical form; templates holds template
+    names found by the reference scanner. File names are relative to root.
+    """
+    
+    def __init__(self, root: str, exclude: List[str]):
+        self.root = root
+        self.exclude = list(exclude)
+        self.files = []
+        self.refs = {}
+        self.templates = {}
+        self.read_errors = []
+        self.created = None
+        self.seconds = 0.0
+    
+    @classmethod
+    def build(cls, root: Path, exclude=()) -> 'UsageIndex':
+        """Scan every prompt file under root once and index its references."""
+        start = time.perf_counter()
+        index = cls(str(Path(root).resolve()), exclude)
+        with profiling.phase('discover'):
+            paths = list(discover_prompt_files(root, exclude))
+        for path in paths:
+            name = Path(path).relative_to(root).as_posix()
+            try:
+                with profiling.phase('read'), open(path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                index.read_errors.append({'file': name, 'message': str(e)})
+                continue
+            profiling.count('bytes_read', len(content))
+            with profiling.phase('scan'):
+                index.add_file(name, content)
+        index.created = time.strftime('%Y-%m-%dT%H:%M:%S')
+        index.seconds = round(time.perf_counter() - start, 3)
+        return index
+    
+    def add_file(self, name: str, content: str):
+        """Index the references in one file's content.
+        
+        $ref: examples in the code of Markdown files are not counted, as
+        validate-references.py and bundle-prompts.py do not count them.
+        """
+        self.files.append(name)
+        if '$ref:' in content:
+            for ref in extract_references(reference_text(name, content)):
+                uses = self.refs.setdefault(canonical_reference(ref), {})
+                uses[name] = uses.get(name, 0) + 1
+        for token in scan_references(content):
+            if token.kind == KIND_TEMPLATE:
+                uses = self.templates.setdefault(token.name, {})
+                uses[name] = uses.get(name, 0) + 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the index as JSON-serializable data."""
+        return {
+            'format': INDEX_FORMAT,
+            'version': INDEX_VERSION,
+            'root': self.root,
+            'exclude': self.exclude,
+            'created': self.created,
+            'seconds': self.seconds,
+            'files': self.files,
+            'read_errors': self.read_errors,
+            'refs': self.refs,
+            'templates': self.templates,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'UsageIndex':
+        """Rebuild an index saved with to_dict()."""
+        if data.get('format') != INDEX_FORMAT or data.get('version') != INDEX_VERSION:
+            raise ValueError("not a usage index, or written by another version")
+        index = cls(data['root'], data['exclude'])
+        index.created = data['created']
+        index.seconds = data['seconds']
+        index.files = data['files']
+        index.read_errors = data['read_errors']
+        index.refs = data['refs']
+        index.templates = data['templates']
+        return index
+    
+    def save(self, path: Path):
+        """Write the index as JSON."""
+        with profiling.phase('write'), open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+    
+    @classmethod
+    def load(cls, path: Path) -> 'UsageIndex':
+        """Read an index written by save()."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+    
+    def file_usage(self, name: str) -> Dict[str, Dict[str, int]]:
+        """Return {'refs': {target: count}, 'templates': {name: count}} for one file."""
+        return {
+            'refs': {target: uses[name] for target, uses in sorted(self.refs.items())
+                     if name in uses},
+            'templates': {template: uses[name] for template, uses in sorted(self.templates.items())
+                          if name in uses},
+        }
+
+
+def usage_rows(entries: Dict[str, Dict[str, int]]) -> List[Dict[str, Any]]:
+    """Return one row per name with total uses and files, most used first."""
+    rows = [{'name': name, 'uses': sum(uses.values()), 'files': dict(sorted(uses.items()))}
+            for name, uses in entries.items()]
+    rows.sort(key=lambda row: (-row['uses'], -len(row['files']), row['name']))
+    return rows
+
+
+def build_report(index: UsageIndex, query: Optional[str] = None) -> Dict[str, Any]:
+    """Return the usage report, limited to names containing query if given."""
+    components = {}
+    templates = {}
+    for target, uses in index.refs.items():
+        if query and query not in target:
+            continue
+        if target.startswith(TEMPLATES_PREFIX):
+            templates[target] = uses
+        else:
+            components[target] = uses
+    template_refs = {name: uses for name, uses in index.templates.items()
+                     if not query or query in name}
+    
+    return {
+        'root': index.root,
+        'created': index.created,
+        'files_scanned': len(index.files),
+        'files_with_refs': len({name for uses in index.refs.values() for name in uses}),
+        'seconds': index.seconds,
+        'query': query,
+        'components': usage_rows(components),
+        'template_refs': usage_rows(templates),
+        'template_references': usage_rows(template_refs),
+        'read_errors': index.read_errors,
+    }
+
+
+def print_rows(title: str, rows: List[Dict[str, Any]], show_files: bool):
+    """Print one section of the text report."""
+    print(f"\n{title}: {len(rows)}")
+    for row in rows:
+        print(f"  {row['uses']:5d} uses in {len(row['files']):3d} files  {row['name']}")
+        if show_files:
+            for name, count in row['files'].items():
+                print(f"          {count:5d}  {name}")
+
+
+def print_report(report: Dict[str, Any], show_files: bool = False):
+    """Print the usage report as text."""
+    print("=" * 60)
+    print("COMPONENT USAGE REPORT")
+    print("=" * 60)
+    print(f"Root: {report['root']}")
+    print(f"Files scanned: {report['files_scanned']} "
+          f"({report['files_with_refs']} with $ref:) in {report['seconds']:.3f}s "
+          f"at {report['created']}")
+    if report['query']:
+        print(f"Query: {report['query']}")
+    
+    print_rows("Shared component references", report['components'], show_files)
+    print_rows("Template $ref: usage", report['template_refs'], show_files)
+    print_rows("Template references ({{name}}, @include(name), ...)",
+               report['template_references'], show_files)
+    
+    if report['read_errors']:
+        print(f"\nUnreadable files: {len(report['read_errors'])}")
+        for entry in report['read_errors']:
+            print(f"  - {entry['file']}: {entry['message']}")
+    print("=" * 60)
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.analyze_usage."""
+    if args.index:
+        try:
+            index = UsageIndex.load(Path(args.index))
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not load index {args.index}: {e}")
+            sys.exit(1)
+    else:
+        root = Path(args.root)
+        if not root.is_dir():
+            print(f"Error: {root} is not a directory")
+            sys.exit(1)
+        index = UsageIndex.build(root, args.exclude)
+        if args.save_index:
+            index.save(Path(args.save_index))
+    
+    if args.file:
+        name = Path(args.file).as_posix()
+        if name not in index.files:
+            print(f"Error: {name} is not in the index")
+            sys.exit(1)
+        usage = index.file_usage(name)
+        if args.format == 'json':
+            print(json.dumps({'file': name, **usage}, indent=2))
+        else:
+            print(f"{name}:")
+            for title, key in [("$ref: targets", 'refs'), ("Template references", 'templates')]:
+                print(f"  {title}: {len(usage[key])}")
+                for target, count in usage[key].items():
+                    print(f"    {count:5d}  {target}")
+        return
+    
+    report = build_report(index, args.query)
+    if args.format == 'json':
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.files)
+        if args.save_index:
+            print(f"Index saved to {args.save_index}")
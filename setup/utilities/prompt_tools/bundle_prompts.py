@@ -0,0 +1,318 @@
+"""
+Prompt Bundler
+
+Resolve every $ref: reference in a set of prompt files and write fully
+inlined copies, so nothing has to re-resolve shared components at runtime.
+Optionally write the whole command set as one compact JSON bundle, so
+loading it is a single file read.
+
+References are found and navigated exactly as validate-references.py
+does (through prompt_tools.references), so $ref: examples in Markdown code
+are left as written. Each distinct target is resolved and rendered once
+per run, however many prompts reference it.
+
+Usage:
+    python bundle-prompts.py <prompt files or directories> --output <dir>
+    python bundle-prompts.py commands/ --bundle commands.json
+"""
+
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from . import SETUP_DIR, profiling
+from . import yaml_io
+from .files import write_artifact
+from .references import (REF_PATTERN, ComponentIndex, canonical_reference,
+                          collect_inputs, reference_matches)
+
+BUNDLE_FORMAT = 'prompt-bundle'
+BUNDLE_VERSION = 1
+
+# Mapping key of a reference written as YAML structure ({$ref: target})
+REF_KEY = '$ref'
+
+# Component fields that describe the component rather than form its body
+DESCRIPTIVE_FIELDS = ('description',)
+
+YAML_EXTENSIONS = {'.yaml', '.yml'}
+
+
+class BundleError(Exception):
+    """A reference that cannot be inlined (broken, cyclic or ill-formed)."""
+
+
+class PromptBundler:
+    """Inline $ref: references, resolving and rendering each target once."""
+    
+    def __init__(self, index: ComponentIndex):
+        self.index = index
+        # canonical reference -> target value with its own references inlined
+        self.values = {}
+        # canonical reference -> target rendered as prompt text
+        self.texts = {}
+        # References being resolved, outermost first, for cycle detection
+        self.active = []
+        self.inlined = 0
+        self.cache_hits = 0
+    
+    def resolve(self, ref: str) -> Any:
+        """Return the value ref points to, with nested references inlined."""
+        key = canonical_reference(ref)
+        self.inlined += 1
+        if key in self.values:
+            self.cache_hits += 1
+            return self.values[key]
+        if key in self.active:
+            cycle = self.active[self.active.index(key):] + [key]
+            raise BundleError(f"Reference cycle: {' -> '.join(cycle)}")
+        
+        try:
+            target = self.index.target(ref)
+        except ValueError as e:
+            raise BundleError(f"{ref}: {e}")
+        
+        self.active.append(key)
+        try:
+            value = self.inline_data(target)
+        finally:
+            self.active.pop()
+        self.values[key] = value
+        return value
+    
+    def render(self, ref: str) -> str:
+        """Return the prompt text that replaces a $ref: line for ref."""
+        key = canonical_reference(ref)
+        text = self.texts.get(key)
+        if text is None:
+            text = render_value(self.resolve(ref)).rstrip('\n')
+            self.texts[key] = text
+        else:
+            self.inlined += 1
+            self.cache_hits += 1
+        return text
+    
+    def inline_text(self, text: str, path: Optional[Path] = None) -> str:
+        """Replace each $ref: in text with its rendered target.
+        
+        Multi-line targets are indented to the column of the reference, so
+        a reference inside a list item or code block stays inside it. When
+        text was read from a Markdown path, references shown in its code
+        spans and fenced blocks are left as written.
+        """
+        if '$ref:' not in text:
+            return text
+        
+        parts = []
+        last = 0
+        for match in reference_matches(path or '', text):
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            prefix = text[line_start:match.start()]
+            indent = prefix if not prefix.strip() else ' ' * len(prefix)
+            lines = self.render(match.group(1)).split('\n')
+            parts.append(text[last:match.start()])
+            parts.append('\n'.join([lines[0]] + [indent + line if line else '' for line in lines[1:]]))
+            last = match.end()
+        parts.append(text[last:])
+        return ''.join(parts)
+    
+    def inline_data(self, data: Any) -> Any:
+        """Return a copy of YAML data with every reference inlined.
+        
+        A mapping {$ref: target} is replaced by the target's value; sibling
+        keys override the target's keys when the target is a mapping. A
+        string that is nothing but a reference becomes the target's value;
+        references inside longer strings are inlined as text.
+        """
+        if isinstance(data, dict):
+            if isinstance(data.get(REF_KEY), str):
+                target = self.resolve(data[REF_KEY])
+                overrides = {key: self.inline_data(value)
+                             for key, value in data.items() if key != REF_KEY}
+                if not overrides:
+                    return target
+                if not isinstance(target, dict):
+                    raise BundleError(f"{data[REF_KEY]}: keys next to {REF_KEY} need a "
+                                      f"mapping target, not {type(target).__name__}")
+                merged = dict(target)
+                merged.update(overrides)
+                return merged
+            return {key: self.inline_data(value) for key, value in data.items()}
+        if isinstance(data, list):
+            return [self.inline_data(item) for item in data]
+        if isinstance(data, str) and '$ref:' in data:
+            match = REF_PATTERN.fullmatch(data.strip())
+            if match:
+                return self.resolve(match.group(1))
+            return self.inline_text(data)
+        return data
+    
+    def bundle_file(self, path: Path) -> Tuple[str, int]:
+        """Return (inlined text, references inlined) for one prompt file.
+        
+        Files without references come back unchanged. YAML files are inlined
+        structurally and re-dumped; other files are inlined as text.
+        """
+        with profiling.phase('read'):
+            content = path.read_text(encoding='utf-8')
+        profiling.count('bytes_read', len(content))
+        before = self.inlined
+        if '$ref' not in content:
+            return content, 0
+        
+        with profiling.phase('render'):
+            return self._bundle_content(path, content, before)
+    
+    def _bundle_content(self, path: Path, content: str, before: int) -> Tuple[str, int]:
+        """Inline the references in content read from path."""
+        if path.suffix in YAML_EXTENSIONS:
+            try:
+                data = yaml_io.safe_load(content)
+            except yaml.YAMLError as e:
+                raise BundleError(f"Failed to parse YAML: {e}")
+            data = self.inline_data(data)
+            if self.inlined == before:
+                # References only in comments: keep the file as written
+                return content, 0
+            text = yaml_io.dump_block(data, sort_keys=False, allow_unicode=True,
+                                      width=80, indent=2)
+        else:
+            text = self.inline_text(content, path)
+        return text, self.inlined - before
+
+
+def render_value(value: Any) -> str:
+    """Render a resolved component as prompt text.
+    
+    Strings are used as they are and lists of strings become bullet lists.
+    For a component mapping, the description is dropped; if one field is
+    left (content, pattern, template, ...), that field is rendered,
+    otherwise the remaining fields are written as YAML.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return '\n'.join(f"- {item}" for item in value)
+    if isinstance(value, dict):
+        body = {key: item for key, item in value.items() if key not in DESCRIPTIVE_FIELDS}
+        if len(body) == 1:
+            field = next(iter(body.values()))
+            if isinstance(field, str) or (isinstance(field, list)
+                                          and all(isinstance(item, str) for item in field)):
+                return render_value(field)
+        if body:
+            value = body
+    return yaml_io.dump_block(value, sort_keys=False, allow_unicode=True, width=80, indent=2)
+
+
+def write_bundle(files: Dict[str, str], bundle_path: Path):
+    """Write {name: text} as one compact JSON document (gzipped for .gz)."""
+    with profiling.phase('encode'):
+        payload = json.dumps({'format': BUNDLE_FORMAT, 'version': BUNDLE_VERSION, 'files': files},
+                             ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    if bundle_path.suffix == '.gz':
+        write_artifact(bundle_path, gzip.compress(payload.encode('utf-8'), mtime=0))
+    else:
+        write_artifact(bundle_path, payload)
+
+
+def load_bundle(bundle_path: Path) -> Dict[str, str]:
+    """Read a bundle written by write_bundle() and return {name: text}."""
+    opener = gzip.open if Path(bundle_path).suffix == '.gz' else open
+    with opener(bundle_path, 'rt', encoding='utf-8') as f:
+        bundle = json.load(f)
+    if bundle.get('format') != BUNDLE_FORMAT:
+        raise ValueError(f"{bundle_path} is not a prompt bundle")
+    return bundle['files']
+
+
+def bundle_prompts(entries: List[Tuple[Path, str]], setup_path: Path,
+                   output_dir: Optional[Path] = None,
+                   bundle_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Inline every entry, write the outputs and return a summary."""
+    start = time.perf_counter()
+    bundler = PromptBundler(ComponentIndex(setup_path))
+    files = {}
+    errors = []
+    
+    for path, name in entries:
+        try:
+            text, count = bundler.bundle_file(path)
+        except (OSError, UnicodeDecodeError, BundleError) as e:
+            errors.append({'source': str(path), 'message': str(e)})
+            continue
+        files[name] = text
+        if output_dir is not None:
+            target = output_dir / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with profiling.phase('write'):
+                write_artifact(target, text)
+    
+    if bundle_path is not None and not errors:
+        with profiling.phase('write'):
+            write_bundle(files, bundle_path)
+    
+    profiling.count('component_resolves', bundler.inlined)
+    profiling.count('bundle_cache_hits', bundler.cache_hits)
+    
+    return {
+        'files': len(entries),
+        'written': len(files) if output_dir is not None else 0,
+        'references_inlined': bundler.inlined,
+        'targets_resolved': len(bundler.values),
+        'cache_hits': bundler.cache_hits,
+        'errors': errors,
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+
+
+def print_summary(summary: Dict[str, Any], output_dir: Optional[Path], bundle_path: Optional[Path]):
+    """Print a bundling summary as text."""
+    print("=" * 60)
+    print("PROMPT BUNDLE SUMMARY")
+    print("=" * 60)
+    print(f"Prompt files: {summary['files']} in {summary['seconds']:.3f}s")
+    print(f"References inlined: {summary['references_inlined']} "
+          f"({summary['targets_resolved']} distinct targets, "
+          f"{summary['cache_hits']} served from cache)")
+    if output_dir is not None:
+        print(f"Inlined files written: {summary['written']} to {output_dir}")
+    if bundle_path is not None:
+        state = 'not written' if summary['errors'] else 'written'
+        print(f"Bundle: {bundle_path} ({state})")
+    
+    if summary['errors']:
+        print(f"\nErrors: {len(summary['errors'])}")
+        for entry in summary['errors']:
+            print(f"  ✗ {entry['source']}: {entry['message']}")
+    print("=" * 60)
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.bundle."""
+    for item in args.inputs:
+        if not Path(item).exists():
+            print(f"Error: {item} does not exist")
+            sys.exit(1)
+    
+    output_dir = Path(args.output) if args.output else None
+    bundle_path = Path(args.bundle) if args.bundle else None
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    
+    with profiling.phase('discover'):
+        entries = collect_inputs(args.inputs, args.exclude)
+    summary = bundle_prompts(entries, SETUP_DIR, output_dir, bundle_path)
+    
+    if args.format == 'json':
+        print(json.dumps(summary, indent=2))
+    else:
+        print_summary(summary, output_dir, bundle_path)
+    
+    if summary['errors']:
+        sys.exit(1)
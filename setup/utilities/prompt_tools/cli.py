@@ -0,0 +1,62 @@
+"""
+Prompt Tools command line
+
+One entry point for every utility:
+
+    python -m prompt_tools <command> [arguments]
+    python prompt-tools.py <command> [arguments]
+
+The command table below is all that is loaded before a command is chosen;
+the command's own module is imported only when it runs, so listing the
+commands costs no more than starting Python.
+"""
+
+import importlib
+import sys
+
+PROG = 'prompt-tools'
+
+# command -> (module in prompt_tools.commands, summary)
+COMMANDS = {
+    'count': ('count', 'Count tokens in prompt files'),
+    'xml-to-yaml': ('xml_to_yaml', 'Convert XML prompts to YAML'),
+    'yaml-to-xml': ('yaml_to_xml', 'Convert YAML prompts back to XML and verify round trips'),
+    'interpolate': ('interpolate', 'Replace template references with their content'),
+    'validate': ('validate', 'Validate prompt files and template contracts'),
+    'validate-refs': ('validate_refs', 'Validate $ref: references to shared components'),
+    'bundle': ('bundle', 'Inline $ref: references into precompiled prompts'),
+    'analyze-usage': ('analyze_usage', 'Report where components and templates are used'),
+    'find-duplicates': ('find_duplicates', 'Find repeated blocks worth extracting'),
+    'pipeline': ('pipeline', 'Interpolate, validate and count tokens in one pass'),
+    'minify': ('minify', 'Rewrite prompts to fewer tokens with verified-safe transforms'),
+    'install': ('install', 'Install commands into ~/.claude, copying only what changed'),
+    'store': ('store', 'Inspect or prune the content-addressed artifact store'),
+}
+
+
+def usage() -> str:
+    """Return the top-level help text."""
+    lines = [f"usage: {PROG} <command> [arguments]", "", "commands:"]
+    width = max(len(name) for name in COMMANDS)
+    for name, (_, summary) in COMMANDS.items():
+        lines.append(f"  {name:<{width}}  {summary}")
+    lines.append("")
+    lines.append(f"Run '{PROG} <command> --help' for a command's arguments.")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Dispatch to the command named by the first argument."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ('-h', '--help'):
+        print(usage())
+        sys.exit(0 if argv else 2)
+    
+    name = argv[0]
+    if name not in COMMANDS:
+        print(usage(), file=sys.stderr)
+        print(f"\n{PROG}: error: unknown command '{name}'", file=sys.stderr)
+        sys.exit(2)
+    
+    module = importlib.import_module(f'prompt_tools.commands.{COMMANDS[name][0]}')
+    module.main(argv[1:], prog=f"{PROG} {name}")
@@ -0,0 +1,26 @@
+"""
+Command-line front ends
+
+One module per subcommand, holding only its argument parser and a main()
+that parses the arguments, imports the implementation module and runs it.
+Nothing here imports PyYAML or tiktoken, so --help and usage errors never
+load them, and a missing dependency stops only the commands that need it.
+"""
+
+import importlib
+import sys
+
+# Package names for pip, where they differ from the import name
+INSTALL_NAMES = {'yaml': 'pyyaml'}
+
+
+def load_implementation(name):
+    """Import prompt_tools.<name>, exiting with an install hint if a dependency is missing."""
+    try:
+        return importlib.import_module(f'prompt_tools.{name}')
+    except ImportError as e:
+        if not e.name or e.name.split('.')[0] == 'prompt_tools':
+            raise
+        package = INSTALL_NAMES.get(e.name, e.name)
+        print(f"Error: {package} not installed. Install with: pip install {package}")
+        sys.exit(1)
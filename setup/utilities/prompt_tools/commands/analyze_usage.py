@@ -0,0 +1,54 @@
+"""Arguments for `prompt-tools analyze-usage` (analyze-usage.py)."""
+
+import argparse
+
+from .. import PROJECT_ROOT, profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Analyze usage of shared components and templates across prompt files',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Scan the project (setup/ excluded) and print the usage report
+  python analyze-usage.py
+  
+  # Scan once and keep the index for later queries
+  python analyze-usage.py --save-index usage-index.json
+  
+  # Who uses task_focus? Answered from the saved index, no rescan
+  python analyze-usage.py --index usage-index.json --query task_focus --files
+  
+  # What does one file reference?
+  python analyze-usage.py --index usage-index.json --file commands/guide.md
+        """
+    )
+    parser.add_argument('root', nargs='?', default=str(PROJECT_ROOT),
+                       help='Directory to scan (default: project root)')
+    parser.add_argument('--exclude', nargs='+', default=['setup'],
+                       help='Paths or patterns to skip (.gitignore syntax, default: setup)')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--index', help='Answer from a saved index instead of scanning')
+    source.add_argument('--save-index', help='Save the index built by this scan')
+    parser.add_argument('--query', '-q', help='Only report names containing this text')
+    parser.add_argument('--file', help='Report what one file (relative to root) references')
+    parser.add_argument('--files', action='store_true',
+                       help='List the files using each name, with counts')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                       help='Output format (default: text)')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    profiling.start_from_args(args, 'analyze-usage')
+    load_implementation('analyze_usage').run(args)
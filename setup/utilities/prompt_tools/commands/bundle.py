@@ -0,0 +1,48 @@
+"""Arguments for `prompt-tools bundle` (bundle-prompts.py)."""
+
+import argparse
+
+from .. import profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Inline $ref: references into precompiled prompt files',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Write inlined copies of every prompt under commands/ to dist/
+  python bundle-prompts.py commands/ --output dist/
+  
+  # Build one JSON bundle of the whole command set
+  python bundle-prompts.py commands/ workflows/ --bundle prompts.json
+  
+  # Both, with a gzipped bundle and a JSON summary
+  python bundle-prompts.py commands/ -o dist/ --bundle prompts.json.gz --format json
+        """
+    )
+    parser.add_argument('inputs', nargs='+', help='Prompt files or directories to bundle')
+    parser.add_argument('--output', '-o', help='Directory for the inlined prompt files')
+    parser.add_argument('--bundle', '-b',
+                       help='Write all inlined prompts to one JSON file (gzipped if it ends in .gz)')
+    parser.add_argument('--exclude', nargs='+', default=[],
+                       help='Paths or patterns to skip in directories (.gitignore syntax)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                       help='Summary format (default: text)')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    if not args.output and not args.bundle:
+        parser.error("Give --output, --bundle or both")
+    profiling.start_from_args(args, 'bundle-prompts')
+    load_implementation('bundle_prompts').run(args)
@@ -0,0 +1,56 @@
+"""Arguments for `prompt-tools count` (token-counter.py)."""
+
+import argparse
+
+from .. import profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Count tokens in prompt files using tiktoken library',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Count tokens in a single file
+  python token-counter.py prompt.txt
+  
+  # Compare before and after files
+  python token-counter.py original.txt optimized.txt --compare
+  
+  # Count tokens in all files in a directory
+  python token-counter.py prompts/ --recursive
+  
+  # Count only specific file types
+  python token-counter.py prompts/ --extensions .txt .md
+        """
+    )
+    
+    parser.add_argument('paths', nargs='+', help='File or directory paths')
+    parser.add_argument('--compare', action='store_true', 
+                       help='Compare two files (requires exactly 2 paths)')
+    parser.add_argument('--recursive', '-r', action='store_true',
+                       help='Recursively scan directories')
+    parser.add_argument('--model', default='gpt-4',
+                       help='Model to use for tokenization (default: gpt-4)')
+    parser.add_argument('--extensions', nargs='+',
+                       help='File extensions to include (default: .txt .md .yaml .yml .json .xml)')
+    parser.add_argument('--exclude', nargs='+', default=[],
+                       help='Paths or patterns to skip in directories (.gitignore syntax)')
+    parser.add_argument('--output', '-o', help='Output file for report')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    if args.compare and len(args.paths) != 2:
+        parser.error("--compare requires exactly 2 file paths")
+    profiling.start_from_args(args, 'token-counter')
+    load_implementation('token_counter').run(args)
@@ -0,0 +1,61 @@
+"""Arguments for `prompt-tools find-duplicates` (find-duplicates.py)."""
+
+import argparse
+import os
+
+from .. import PROJECT_ROOT, profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Find repeated and near-duplicate instruction blocks across prompt files',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Scan the project (setup/ excluded) and show the top candidates
+  python find-duplicates.py
+  
+  # Looser matching, only blocks shared by 3+ files
+  python find-duplicates.py commands/ --threshold 0.7 --min-files 3
+  
+  # Every candidate as JSON
+  python find-duplicates.py --format json --top 0
+        """
+    )
+    parser.add_argument('root', nargs='?', default=str(PROJECT_ROOT),
+                       help='Directory to scan (default: project root)')
+    parser.add_argument('--exclude', nargs='+', default=['setup'],
+                       help='Paths or patterns to skip (.gitignore syntax, default: setup)')
+    parser.add_argument('--threshold', type=float, default=0.8,
+                       help='Jaccard similarity for a near match (default: 0.8)')
+    parser.add_argument('--min-words', type=int, default=8,
+                       help='Ignore blocks shorter than this many words (default: 8)')
+    parser.add_argument('--min-files', type=int, default=2,
+                       help='Only report blocks found in this many files (default: 2)')
+    parser.add_argument('--shingle-size', type=int, default=4,
+                       help='Words per shingle (default: 4)')
+    parser.add_argument('--top', type=int, default=20,
+                       help='Candidates to show in the text report, 0 for all (default: 20)')
+    parser.add_argument('--model', default='gpt-4',
+                       help='Model to use for tokenization (default: gpt-4)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                       help='Worker processes (default: CPU count)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                       help='Output format (default: text)')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    if not 0 < args.threshold <= 1:
+        parser.error("--threshold must be between 0 and 1")
+    profiling.start_from_args(args, 'find-duplicates')
+    load_implementation('find_duplicates').run(args)
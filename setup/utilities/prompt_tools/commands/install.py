@@ -0,0 +1,62 @@
+"""Arguments for `prompt-tools install` (called by INSTALL.sh)."""
+
+import argparse
+from pathlib import Path
+
+from .. import PROJECT_ROOT, profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Install commands, workflows and the archive into ~/.claude, '
+                    'copying only what changed',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Install sets (as in INSTALL.sh):
+  all   - commands/*.md, workflows/*.md and the whole _archive/ tree
+  core  - guide, agents, execute, workflows, senior-engineer and
+          documentation from commands/
+
+Examples:
+  # Install or update everything
+  python -m prompt_tools install
+  
+  # Show what would change without writing anything
+  python -m prompt_tools install --dry-run
+  
+  # Validate and count tokens in the changed files; install only if valid
+  python -m prompt_tools install --validate --count
+        """
+    )
+    parser.add_argument('--set', choices=['all', 'core'], default='all',
+                       help='What to install (default: all)')
+    parser.add_argument('--source', default=str(PROJECT_ROOT),
+                       help='Directory holding commands/, workflows/ and _archive/ '
+                            '(default: project root)')
+    parser.add_argument('--target', default='~/.claude',
+                       help='Directory to install into (default: ~/.claude)')
+    parser.add_argument('--dry-run', '-n', action='store_true',
+                       help='Show the changes without writing anything')
+    parser.add_argument('--validate', action='store_true',
+                       help='Validate the changed files first; install nothing if any has errors')
+    parser.add_argument('--count', action='store_true',
+                       help='Count tokens in the changed files, before and after')
+    parser.add_argument('--template-dir', '-t', type=Path,
+                       help='Template directory for --validate (default: setup/templates)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                       help='Report format (default: text)')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    profiling.start_from_args(args, 'install')
+    load_implementation('installer').run(args)
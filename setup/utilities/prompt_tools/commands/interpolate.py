@@ -0,0 +1,81 @@
+"""Arguments for `prompt-tools interpolate` (template-interpolator.py)."""
+
+import argparse
+from pathlib import Path
+
+from .. import profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Replace template references with actual content',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Basic interpolation
+  python template-interpolator.py template.txt
+  
+  # With variables
+  python template-interpolator.py template.txt --vars name=John age=30
+  
+  # With template directory
+  python template-interpolator.py main.tmpl --template-dir ./templates
+  
+  # Load variables from file
+  python template-interpolator.py template.txt --vars-file config.yaml
+  
+  # Output to file
+  python template-interpolator.py template.txt -o output.txt
+  
+  # Show statistics
+  python template-interpolator.py template.txt --stats
+  
+  # Render a structured template's sections and lists from parameters
+  python template-interpolator.py templates/code-review.yaml --structured --vars-file review.yaml
+
+Template Reference Formats Supported:
+  {{template_name}}     - Double brace style
+  ${template_name}      - Dollar brace style
+  <template:name/>      - XML style
+  @include(name)        - Include style
+  [[template_name]]     - Double bracket style
+
+Variable Reference Formats Supported:
+  {{var.property}}      - Dot notation for nested values
+  $variable             - Dollar sign style
+  %{variable}           - Percent brace style
+        """
+    )
+    
+    parser.add_argument('input_file', help='Template file to process')
+    parser.add_argument('--template-dir', '-t', type=Path,
+                       help='Directory containing template files')
+    parser.add_argument('--vars', '-v', nargs='+', default=[],
+                       help='Variables in key=value format')
+    parser.add_argument('--vars-file', type=Path,
+                       help='JSON or YAML file containing variables')
+    parser.add_argument('--output', '-o', type=Path,
+                       help='Output file (default: stdout)')
+    parser.add_argument('--max-depth', type=int, default=10,
+                       help='Maximum template nesting depth (default: 10)')
+    parser.add_argument('--structured', action='store_true',
+                       help='Render the structure: sections of a YAML template')
+    parser.add_argument('--stats', action='store_true',
+                       help='Show interpolation statistics')
+    parser.add_argument('--debug', action='store_true',
+                       help='Show debug information')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    profiling.start_from_args(args, 'template-interpolator')
+    load_implementation('template_interpolator').run(args)
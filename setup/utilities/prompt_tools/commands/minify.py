@@ -0,0 +1,73 @@
+"""Arguments for `prompt-tools minify`."""
+
+import argparse
+import os
+from pathlib import Path
+
+from .. import profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Rewrite prompt files to fewer tokens, keeping only changes that '
+                    'measurably save tokens',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Transforms (each kept only if the token count drops):
+  whitespace   - trailing spaces, repeated spaces and blank-line runs
+  quotes       - YAML quotes that are not needed (data must load the same)
+  block-style  - YAML re-emitted in compact block style (files without comments)
+  refs         - with --refs, verbatim copies of shared components become
+                 $ref: references (the inlined text must be identical)
+
+Examples:
+  # Report what minifying would save, without writing anything
+  python -m prompt_tools minify commands/
+  
+  # Minify in place, also replacing copied components by references
+  python -m prompt_tools minify commands/ --refs --write
+  
+  # Write minified copies elsewhere and a JSON report
+  python -m prompt_tools minify commands/ --output minified/ --format json > report.json
+  
+--write and --output need exact token counts from tiktoken; without them
+they exit with an error unless --allow-estimates is given.
+        """
+    )
+    parser.add_argument('inputs', nargs='+', help='Prompt files or directories')
+    parser.add_argument('--refs', action='store_true',
+                       help='Replace verbatim copies of shared components with $ref: references')
+    parser.add_argument('--components', type=Path,
+                       help='Components file for --refs (default: setup/shared-components.yaml); '
+                            'references are written relative to its directory')
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--write', '-w', action='store_true',
+                       help='Rewrite changed files in place')
+    output.add_argument('--output', '-o', type=Path,
+                       help='Write minified copies to this directory')
+    parser.add_argument('--allow-estimates', action='store_true',
+                       help='Let --write/--output go ahead when tiktoken is unavailable and '
+                            'token counts are estimated')
+    parser.add_argument('--model', default='gpt-4',
+                       help='Model whose encoding counts tokens (default: gpt-4)')
+    parser.add_argument('--exclude', nargs='+', default=[],
+                       help='Paths or patterns to skip in directories (.gitignore syntax)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                       help='Worker processes (default: CPU count)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                       help='Output format (default: text)')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    profiling.start_from_args(args, 'minify')
+    load_implementation('minifier').run(args)
@@ -0,0 +1,70 @@
+"""Arguments for `prompt-tools pipeline` (prompt-pipeline.py)."""
+
+import argparse
+import os
+from pathlib import Path
+
+from .. import profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Interpolate, validate and count tokens for prompt files in one pass',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Check a directory of prompts against a template directory
+  python prompt-pipeline.py commands/ --template-dir ../templates
+  
+  # Expand with variables and keep the expanded files
+  python prompt-pipeline.py commands/ --vars-file vars.yaml --output expanded/
+  
+  # Use four worker processes and write a JSON report
+  python prompt-pipeline.py commands/ agents/ --jobs 4 --format json > report.json
+
+Stages, per file:
+  read -> scan references -> interpolate templates and variables
+  -> validate the source -> count source and expanded tokens
+  -> write the expanded file (with --output)
+
+Validation checks each source file as written, so line numbers point into
+it. The expanded text is not validated, unlike running the interpolator
+and then validating its output.
+        """
+    )
+    parser.add_argument('inputs', nargs='+', help='Prompt files or directories')
+    parser.add_argument('--template-dir', '-t', type=Path,
+                       help='Directory containing template files (default: current directory)')
+    parser.add_argument('--vars', nargs='*', default=[],
+                       help='Variables in key=value format')
+    parser.add_argument('--vars-file', type=Path,
+                       help='Load variables from JSON/YAML file')
+    parser.add_argument('--strict', action='store_true',
+                       help='Enable strict validation mode')
+    parser.add_argument('--model', default='gpt-4',
+                       help='Model whose encoding counts tokens (default: gpt-4)')
+    parser.add_argument('--exclude', nargs='+', default=[],
+                       help='Paths or patterns to skip in directories (.gitignore syntax)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                       help='Worker processes (default: CPU count)')
+    parser.add_argument('--output', '-o', type=Path,
+                       help='Write expanded files to this directory')
+    parser.add_argument('--errors-only', action='store_true',
+                       help='Only list files with errors in the text report')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                       help='Output format (default: text)')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    profiling.start_from_args(args, 'prompt-pipeline')
+    load_implementation('prompt_pipeline').run(args)
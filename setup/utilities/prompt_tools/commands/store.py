@@ -0,0 +1,48 @@
+"""Arguments for `prompt-tools store`."""
+
+import argparse
+import os
+
+from .. import profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Inspect or prune the content-addressed artifact store',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Route every utility's output through a store
+  export PROMPT_TOOLS_STORE=~/.cache/prompt-tools/store
+  python -m prompt_tools pipeline commands/ --output expanded/
+  
+  # Objects, bytes and how many are still installed somewhere
+  python -m prompt_tools store
+  
+  # Remove objects no output links to any more
+  python -m prompt_tools store --prune
+        """
+    )
+    parser.add_argument('root', nargs='?', default=os.environ.get('PROMPT_TOOLS_STORE'),
+                       help='Store directory (default: $PROMPT_TOOLS_STORE)')
+    parser.add_argument('--prune', action='store_true',
+                       help='Remove objects with no hardlinks outside the store')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                       help='Report format (default: text)')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    if not args.root:
+        parser.error("Give a store directory or set PROMPT_TOOLS_STORE")
+    profiling.start_from_args(args, 'store')
+    load_implementation('store').run(args)
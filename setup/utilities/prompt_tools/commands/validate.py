@@ -0,0 +1,106 @@
+"""Arguments for `prompt-tools validate` (prompt-validator.py)."""
+
+import argparse
+from pathlib import Path
+
+from .. import profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Validate optimized prompts',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Validate a single prompt file
+  python prompt-validator.py prompt.yaml
+  
+  # Validate with template directory
+  python prompt-validator.py prompt.yaml --template-dir ./templates
+  
+  # Validate all YAML files in directory
+  python prompt-validator.py prompts/ --recursive
+  
+  # Strict validation mode
+  python prompt-validator.py prompt.yaml --strict
+  
+  # Output report to file
+  python prompt-validator.py prompt.yaml --output report.txt
+  
+  # Show only errors
+  python prompt-validator.py prompt.yaml --errors-only
+  
+  # Re-validate on every change, streaming JSON Lines diagnostics
+  python prompt-validator.py prompts/ --recursive --watch --format jsonl
+  
+  # Check template {{var}} usages against the manifest's declared parameters
+  python prompt-validator.py --manifest ../template-manifest.yaml
+  
+  # Stream machine-readable results (JSON Lines or SARIF 2.1.0)
+  python prompt-validator.py prompts/ --recursive --format jsonl
+  python prompt-validator.py prompts/ --recursive --format sarif -o results.sarif
+
+Validation Checks:
+  - YAML syntax validation
+  - Template reference existence
+  - Variable reference tracking
+  - Template parameter contracts (with --manifest)
+  - Structure consistency
+  - Formatting issues
+  - Common problems (long lines, mixed indentation, etc.)
+        """
+    )
+    
+    parser.add_argument('path', nargs='?', help='File or directory to validate')
+    parser.add_argument('--template-dir', '-t', type=Path,
+                       help='Directory containing template files')
+    parser.add_argument('--recursive', '-r', action='store_true',
+                       help='Recursively validate directories')
+    parser.add_argument('--exclude', nargs='+', default=[],
+                       help='Paths or patterns to skip in directories (.gitignore syntax)')
+    parser.add_argument('--strict', action='store_true',
+                       help='Enable strict validation mode')
+    parser.add_argument('--output', '-o', type=Path,
+                       help='Output file for validation report')
+    parser.add_argument('--errors-only', action='store_true',
+                       help='Show only errors, not warnings or info')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Minimal output (exit code indicates success)')
+    parser.add_argument('--format', choices=['text', 'json', 'jsonl', 'sarif'], default='text',
+                       help='Output format (default: text). jsonl and sarif stream '
+                            'results per file as they are validated')
+    parser.add_argument('--watch', '-w', action='store_true',
+                       help='Validate once, then re-validate changed files (and files '
+                            'referencing changed templates) until interrupted; '
+                            'reports go to stdout (no --output, --quiet or --manifest)')
+    parser.add_argument('--interval', type=float, default=0.1,
+                       help='Polling interval in seconds for --watch (default: 0.1)')
+    parser.add_argument('--manifest', '-m', type=Path,
+                       help='Template manifest whose declared parameters are checked '
+                            'against each template\'s {{var}} usages')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    if not args.path and not args.manifest:
+        parser.error("A path to validate is required unless using --manifest")
+    if args.watch and not args.path:
+        parser.error("--watch requires a path to validate")
+    if args.watch and args.format not in ('text', 'jsonl'):
+        parser.error("--watch supports only --format text or jsonl")
+    if args.watch:
+        for option, given in (('--output', args.output), ('--quiet', args.quiet),
+                              ('--manifest', args.manifest)):
+            if given:
+                parser.error(f"--watch does not support {option}")
+    profiling.start_from_args(args, 'prompt-validator')
+    load_implementation('prompt_validator').run(args)
@@ -0,0 +1,54 @@
+"""Arguments for `prompt-tools validate-refs` (validate-references.py)."""
+
+import argparse
+import os
+
+from .. import PROJECT_ROOT, profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Validate $ref: references to shared components',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Validate the references in specific prompt files
+  python validate-references.py prompt.md other-prompt.yaml
+  
+  # Validate every prompt file in the project as one reference graph
+  python validate-references.py --tree
+  
+  # Validate a directory tree on 8 cores, as JSON
+  python validate-references.py --tree commands/ --jobs 8 --format json
+        """
+    )
+    parser.add_argument('files', nargs='*', help='Prompt files to validate')
+    parser.add_argument('--tree', nargs='?', const=str(PROJECT_ROOT), metavar='ROOT',
+                       help='Scan every prompt file under ROOT (default: project root) and '
+                            'report broken references, cycles and unused components')
+    parser.add_argument('--components', nargs='+', default=['shared-components.yaml'],
+                       help='Component files checked for unused components, relative to '
+                            'setup/ (default: shared-components.yaml)')
+    parser.add_argument('--exclude', nargs='+', default=[],
+                       help='Paths or patterns to skip in tree mode (.gitignore syntax)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                       help='Worker processes for scanning in tree mode (default: CPU count)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                       help='Tree mode report format (default: text)')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    if not args.tree and not args.files:
+        parser.error("Give prompt files to validate, or use --tree")
+    profiling.start_from_args(args, 'validate-references')
+    load_implementation('validate_references').run(args)
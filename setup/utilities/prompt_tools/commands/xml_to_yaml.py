@@ -0,0 +1,83 @@
+"""Arguments for `prompt-tools xml-to-yaml` (xml-to-yaml.py)."""
+
+import argparse
+
+from .. import profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Convert XML structured prompts to YAML format',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Convert a single XML file
+  python xml-to-yaml.py prompt.xml
+  
+  # Convert and save to specific file
+  python xml-to-yaml.py input.xml output.yaml
+  
+  # Convert all XML files in a directory
+  python xml-to-yaml.py prompts/ --batch
+  
+  # Convert directory and save to output directory
+  python xml-to-yaml.py prompts/ --batch --output converted/
+  
+  # Convert a whole tree on 8 cores, mirroring its layout
+  python xml-to-yaml.py legacy/ --batch --recursive --jobs 8 --output converted/
+  
+  # Stream a very large XML file with bounded memory
+  python xml-to-yaml.py archive.xml archive.yaml --stream
+  
+  # Only reconvert files whose XML changed since the last run
+  python xml-to-yaml.py prompts/ --batch --output converted/ --incremental
+  
+  # Create a sample XML file
+  python xml-to-yaml.py --sample
+        """
+    )
+    
+    parser.add_argument('input_path', nargs='?', help='XML file or directory path')
+    parser.add_argument('output_path', nargs='?', help='Output YAML file or directory')
+    parser.add_argument('--batch', action='store_true',
+                       help='Convert all XML files in directory')
+    parser.add_argument('--output', '-o', help='Output directory for batch conversion')
+    parser.add_argument('--recursive', '-r', action='store_true',
+                       help='Include XML files in subdirectories (batch mode)')
+    parser.add_argument('--exclude', nargs='+', default=[],
+                       help='Paths or patterns to skip in batch mode (.gitignore syntax)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Number of worker processes for batch conversion (default: 1)')
+    parser.add_argument('--no-preserve-order', action='store_true',
+                       help='Do not preserve element order')
+    parser.add_argument('--no-comments', action='store_true',
+                       help='Do not preserve comments')
+    parser.add_argument('--sample', action='store_true',
+                       help='Create a sample XML file')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Pretty print output to console')
+    parser.add_argument('--stream', action='store_true',
+                       help='Convert with iterparse and write YAML incrementally '
+                            '(bounded memory for very large files)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Skip files whose existing YAML output records the same '
+                            'source hash, converter version and options')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    if not args.input_path and not args.sample:
+        parser.error("Input path required unless using --sample")
+    if args.stream and args.pretty:
+        parser.error("--pretty cannot be combined with --stream")
+    profiling.start_from_args(args, 'xml-to-yaml')
+    load_implementation('xml_to_yaml').run(args)
@@ -0,0 +1,64 @@
+"""Arguments for `prompt-tools yaml-to-xml` (yaml-to-xml.py)."""
+
+import argparse
+import os
+
+from .. import profiling
+from . import load_implementation
+
+
+def build_parser(prog=None):
+    """Return the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='Convert YAML prompts back to XML and verify round trips',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Convert a single YAML file back to XML
+  python yaml-to-xml.py prompt.yaml
+  
+  # Convert and save to specific file
+  python yaml-to-xml.py prompt.yaml prompt.xml
+  
+  # Convert all YAML files in a directory tree
+  python yaml-to-xml.py converted/ --batch --recursive --output xml/
+  
+  # Verify conversions against the originals named in _metadata.source
+  python yaml-to-xml.py converted/ --verify --recursive --jobs 8
+  
+  # Verify against an originals tree with the same layout
+  python yaml-to-xml.py converted/ --verify -r --xml-dir legacy/ --format json
+        """
+    )
+    
+    parser.add_argument('input_path', help='YAML file or directory path')
+    parser.add_argument('output_path', nargs='?', help='Output XML file')
+    parser.add_argument('--batch', action='store_true',
+                       help='Convert all YAML files in directory')
+    parser.add_argument('--output', '-o', help='Output directory for batch conversion')
+    parser.add_argument('--verify', action='store_true',
+                       help='Round-trip each YAML file and compare it with its original XML')
+    parser.add_argument('--xml-dir',
+                       help='Directory of original XML files, mirroring the input layout '
+                            '(default: use _metadata.source)')
+    parser.add_argument('--recursive', '-r', action='store_true',
+                       help='Include YAML files in subdirectories')
+    parser.add_argument('--exclude', nargs='+', default=[],
+                       help='Paths or patterns to skip in directories (.gitignore syntax)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                       help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                       help='Verification report format (default: text)')
+    
+    profiling.add_arguments(parser)
+    
+    return parser
+
+
+def main(argv=None, prog=None):
+    """Parse arguments and run the command."""
+    parser = build_parser(prog)
+    args = parser.parse_args(argv)
+    profiling.start_from_args(args, 'yaml-to-xml')
+    load_implementation('yaml_to_xml').run(args)
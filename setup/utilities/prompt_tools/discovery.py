@@ -0,0 +1,334 @@
+"""
+File Discovery
+
+One directory walk shared by every utility. walk_files() reads each
+directory once with os.scandir, prunes excluded directories before
+descending into them, filters by extension and yields paths as it goes.
+
+Excludes use .gitignore syntax: a plain name such as `setup` or `*.bak`
+matches at any depth, a pattern containing a slash is anchored to the
+root, a trailing slash matches directories only, `**` spans directories
+and `!` re-includes. The .gitignore file of every walked directory is
+honoured too, with its patterns relative to that directory; as in git, a
+file inside an excluded directory cannot be re-included.
+
+Listings can be cached. A ListingCache remembers the entries of each
+directory with the directory's mtime, and a later walk reuses an entry
+when the mtime is unchanged (adding, removing or renaming a file changes
+its directory's mtime). Set PROMPT_TOOLS_LISTING_CACHE to a file path to
+give every utility a cache that is loaded on first use and saved at exit.
+"""
+
+import atexit
+import json
+import os
+import re
+import time
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from . import profiling
+from .files import atomic_output
+
+# Directories never walked unless a pattern re-includes them
+DEFAULT_EXCLUDES = ('.git/', '__pycache__/', 'node_modules/', '.venv/', 'venv/', '_archive/')
+
+IGNORE_FILE = '.gitignore'
+
+CACHE_FORMAT = 'listing-cache'
+CACHE_VERSION = 1
+
+# Directories modified this recently are not cached: a change within the
+# same mtime tick would go unnoticed
+RACY_SECONDS = 2.0
+
+
+class IgnoreRule:
+    """One compiled .gitignore pattern."""
+    
+    __slots__ = ('pattern', 'negate', 'dir_only', 'anchored', 'regex')
+    
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.negate = pattern.startswith('!')
+        if self.negate:
+            pattern = pattern[1:]
+        elif pattern.startswith('\\'):
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        self.anchored = '/' in pattern
+        self.regex = re.compile(translate(pattern.lstrip('/')))
+    
+    def matches(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        """Whether the rule matches an entry (rel_path is relative to the rule's base)."""
+        if self.dir_only and not is_dir:
+            return False
+        return self.regex.fullmatch(rel_path if self.anchored else name) is not None
+
+
+def translate(pattern: str) -> str:
+    """Translate a .gitignore glob into a regular expression over '/'-separated paths."""
+    parts = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**', i):
+            at_start = i == 0 or pattern[i - 1] == '/'
+            if at_start and pattern.startswith('**/', i):
+                parts.append('(?:.*/)?')
+                i += 3
+                continue
+            if at_start and i + 2 == n:
+                parts.append('.*')
+                i += 2
+                continue
+            parts.append('[^/]*')
+            i += 2
+        elif c == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif c == '?':
+            parts.append('[^/]')
+            i += 1
+        elif c == '[':
+            start = i + 1
+            if start < n and pattern[start] == '!':
+                start += 1
+            # A ']' straight after the opening bracket is a member, not the end
+            end = pattern.find(']', start + 1)
+            if end == -1:
+                parts.append(re.escape(c))
+                i += 1
+                continue
+            members = ''.join(ch if ch == '-' else re.escape(ch) for ch in pattern[start:end])
+            parts.append(('[^' if start > i + 1 else '[') + members + ']')
+            i = end + 1
+        elif c == '\\' and i + 1 < n:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(c))
+            i += 1
+    return ''.join(parts)
+
+
+def parse_ignore_lines(lines: Iterable[str]) -> List[IgnoreRule]:
+    """Compile .gitignore lines, skipping blanks and comments."""
+    rules = []
+    for line in lines:
+        line = line.rstrip('\n').rstrip('\r')
+        # Trailing spaces are ignored unless escaped
+        stripped = line.rstrip(' ')
+        if stripped.endswith('\\') and len(stripped) < len(line):
+            stripped += ' '
+        if not stripped or stripped.startswith('#'):
+            continue
+        if stripped in ('!', '/'):
+            continue
+        rules.append(IgnoreRule(stripped))
+    return rules
+
+
+class IgnoreRules:
+    """Ordered .gitignore rules from several bases; the last matching rule wins."""
+    
+    def __init__(self, patterns: Iterable[str] = ()):
+        # (base directory relative to the walk root, rules)
+        self.groups: List[Tuple[str, List[IgnoreRule]]] = []
+        # Whether any rule can match a file; directory-only rules cannot
+        self.matches_files = False
+        rules = parse_ignore_lines(patterns)
+        if rules:
+            self.groups.append(('', rules))
+            self.matches_files = any(not rule.dir_only for rule in rules)
+    
+    def extended(self, base: str, rules: List[IgnoreRule]) -> 'IgnoreRules':
+        """Return a copy with rules (relative to base) added after the existing ones."""
+        combined = IgnoreRules()
+        combined.groups = self.groups + [(base, rules)] if rules else self.groups
+        combined.matches_files = self.matches_files or any(not rule.dir_only for rule in rules)
+        return combined
+    
+    def ignored(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        """Whether the entry at rel_path (relative to the walk root) is ignored."""
+        result = False
+        for base, rules in self.groups:
+            if base:
+                if not rel_path.startswith(base + '/'):
+                    continue
+                local = rel_path[len(base) + 1:]
+            else:
+                local = rel_path
+            for rule in rules:
+                if rule.negate == result and rule.matches(local, name, is_dir):
+                    result = not rule.negate
+        return result
+
+
+class ListingCache:
+    """Directory listings keyed by path and mtime, stored as JSON."""
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        # directory path -> [mtime_ns, [subdirectory names], [file names]]
+        self.listings = {}
+        self.dirty = False
+    
+    @classmethod
+    def load(cls, path: str) -> 'ListingCache':
+        """Read a cache written by save(); a missing or unreadable file gives an empty cache."""
+        cache = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cache
+        if data.get('format') == CACHE_FORMAT and data.get('version') == CACHE_VERSION:
+            cache.listings = data['listings']
+        return cache
+    
+    def save(self):
+        """Write the cache back to its file if anything changed."""
+        if not self.path or not self.dirty:
+            return
+        with atomic_output(self.path) as f:
+            json.dump({'format': CACHE_FORMAT, 'version': CACHE_VERSION,
+                       'listings': self.listings}, f, separators=(',', ':'))
+        self.dirty = False
+    
+    def get(self, directory: str, mtime_ns: int) -> Optional[Tuple[List[str], List[str]]]:
+        """Return (subdirectories, files) recorded for directory at mtime_ns, or None."""
+        entry = self.listings.get(directory)
+        if entry is None or entry[0] != mtime_ns:
+            return None
+        return entry[1], entry[2]
+    
+    def put(self, directory: str, mtime_ns: int, dirs: List[str], files: List[str]):
+        """Record a listing, unless the directory changed too recently to trust its mtime."""
+        if time.time() - mtime_ns / 1e9 < RACY_SECONDS:
+            self.listings.pop(directory, None)
+        else:
+            self.listings[directory] = [mtime_ns, dirs, files]
+        self.dirty = True
+
+
+_default_cache = None
+_default_cache_loaded = False
+
+
+def default_cache() -> Optional[ListingCache]:
+    """Return the cache named by PROMPT_TOOLS_LISTING_CACHE, loading it on first use."""
+    global _default_cache, _default_cache_loaded
+    if not _default_cache_loaded:
+        _default_cache_loaded = True
+        path = os.environ.get('PROMPT_TOOLS_LISTING_CACHE')
+        if path:
+            _default_cache = ListingCache.load(path)
+            atexit.register(_save_default_cache)
+    return _default_cache
+
+
+def _save_default_cache():
+    try:
+        _default_cache.save()
+    except OSError:
+        pass
+
+
+def scan_directory(directory: str) -> Tuple[List[str], List[str]]:
+    """Return sorted (subdirectory, file) names in directory.
+    
+    Symlinked directories are left out of both lists, so they are never
+    walked; symlinks to files count as files.
+    """
+    dirs = []
+    files = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry.name)
+            elif not entry.is_symlink():
+                dirs.append(entry.name)
+    dirs.sort()
+    files.sort()
+    return dirs, files
+
+
+def list_directory(directory: str, cache: Optional[ListingCache]) -> Tuple[List[str], List[str]]:
+    """Return sorted (subdirectories to descend into, files) for directory."""
+    if cache is None:
+        return scan_directory(directory)
+    key = os.path.abspath(directory)
+    mtime_ns = os.stat(directory).st_mtime_ns
+    profiling.count('stat_calls')
+    listing = cache.get(key, mtime_ns)
+    if listing is not None:
+        profiling.count('listing_cache_hits')
+        return listing
+    profiling.count('listing_cache_misses')
+    dirs, files = scan_directory(directory)
+    cache.put(key, mtime_ns, dirs, files)
+    return dirs, files
+
+
+def read_ignore_file(path: str) -> List[IgnoreRule]:
+    """Compile a .gitignore file; an unreadable file contributes no rules."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return parse_ignore_lines(f)
+    except (OSError, UnicodeDecodeError):
+        return []
+
+
+def walk_files(root, extensions: Optional[Iterable[str]] = None, exclude: Iterable[str] = (),
+               recursive: bool = True, gitignore: bool = True,
+               cache: Optional[ListingCache] = None) -> Iterator[str]:
+    """Yield the files under root, lazily, in sorted depth-first order.
+    
+    A directory's own files come before its subdirectories, as with
+    os.walk. extensions limits the files to those suffixes (such as
+    '.md'); exclude holds extra .gitignore-style patterns, applied after
+    DEFAULT_EXCLUDES. With gitignore, .gitignore files found while walking
+    are applied as well. Symlinked directories are not followed. cache
+    defaults to the PROMPT_TOOLS_LISTING_CACHE cache, if one is set.
+    """
+    if extensions is not None:
+        extensions = frozenset(extensions)
+    if cache is None:
+        cache = default_cache()
+    root = os.fspath(root)
+    rules = IgnoreRules(list(DEFAULT_EXCLUDES) + list(exclude))
+    
+    # (directory path, path relative to root, rules in force)
+    stack = [(root, '', rules)]
+    while stack:
+        directory, rel_dir, rules = stack.pop()
+        try:
+            dirs, files = list_directory(directory, cache)
+        except OSError:
+            continue
+        profiling.count('directories_walked')
+        if gitignore and IGNORE_FILE in files:
+            local_rules = read_ignore_file(os.path.join(directory, IGNORE_FILE))
+            rules = rules.extended(rel_dir, local_rules)
+        prefix = rel_dir + '/' if rel_dir else ''
+        
+        check_files = rules.matches_files
+        for name in files:
+            if extensions is not None and os.path.splitext(name)[1] not in extensions:
+                continue
+            if check_files and rules.ignored(prefix + name, name, False):
+                continue
+            profiling.count('files_discovered')
+            yield os.path.join(directory, name)
+        
+        if recursive:
+            for name in reversed(dirs):
+                if rules.ignored(prefix + name, name, True):
+                    continue
+                stack.append((os.path.join(directory, name), prefix + name, rules))
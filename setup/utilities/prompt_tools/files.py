@@ -0,0 +1,92 @@
+"""
+File Output Helpers
+
+Shared helpers for writing converted files safely. Generated outputs go
+through write_artifact() or atomic_output(artifact=True), which store
+them in the artifact store when PROMPT_TOOLS_STORE is set (see
+prompt_tools/store.py).
+"""
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from . import profiling
+from .store import default_store
+
+
+_umask = None
+
+
+def default_mode() -> int:
+    """Return the mode open() gives a new file under the process umask."""
+    global _umask
+    if _umask is None:
+        # The umask can only be read by setting it
+        _umask = os.umask(0)
+        os.umask(_umask)
+    return 0o666 & ~_umask
+
+
+def output_mode(path: Path) -> int:
+    """Return the permission bits a file written to path should get.
+    
+    An existing file keeps its mode; a new one gets the umask default, as
+    with a plain open(). mkstemp() creates its files 0600, so the temp file
+    is given this mode before it is renamed into place.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return default_mode()
+
+
+@contextmanager
+def atomic_output(path: Path, binary: bool = False, artifact: bool = False):
+    """Open a temp file next to path for writing and rename it into place.
+    
+    Readers never see a partially written file: the rename happens only
+    after the block completes, and the temp file is removed on failure.
+    The file is opened as UTF-8 text, or for bytes when binary is set.
+    With artifact set and an artifact store configured, the finished file
+    is moved into the store and path is linked to it instead. The file
+    keeps the mode of the file it replaces, or gets the umask default.
+    """
+    path = Path(path)
+    store = default_store() if artifact else None
+    profiling.count('files_written')
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding='utf-8')) as f:
+            yield f
+        if store is None:
+            os.chmod(tmp_name, output_mode(path))
+            os.replace(tmp_name, path)
+        else:
+            store.install(store.adopt(tmp_name), path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def write_artifact(path: Path, data) -> bool:
+    """Write a generated file from str (as UTF-8) or bytes; returns whether it changed.
+    
+    Without an artifact store this is an atomic_output() write. With one,
+    the content is hashed first, so an identical file costs no writes and
+    a destination that already links to it is left alone.
+    """
+    store = default_store()
+    if store is None:
+        with atomic_output(path, binary=isinstance(data, bytes)) as f:
+            f.write(data)
+        return True
+    changed = store.write(path, data)
+    if changed:
+        profiling.count('files_written')
+    return changed
@@ -0,0 +1,451 @@
+"""
+Duplicate Block Detector
+
+Find instruction blocks that are repeated, exactly or nearly, across prompt
+files, and rank them as candidates for extraction into
+shared-components.yaml by the tokens that extraction would save.
+
+Each file is split into paragraphs and lines, which are normalized (case,
+punctuation, list and heading markers, whitespace). Exact repeats are
+grouped by hash. Near repeats are found with word shingles hashed by a
+rolling hash, MinHash signatures and locality-sensitive hashing, so only
+blocks that share an LSH bucket are ever compared; candidate pairs are then
+confirmed with their exact Jaccard similarity.
+
+Usage:
+    python find-duplicates.py [root]
+    python find-duplicates.py commands/ --threshold 0.7 --min-files 3
+"""
+
+import hashlib
+import json
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+from . import profiling
+from .references import discover_prompt_files
+from .tokens import CachedTokenCounter
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# List bullets, numbering, headings and quote markers at the start of a line
+MARKER_PATTERN = re.compile(r'^\s*(?:[-*+>]|#{1,6}|\d+[.)])\s+')
+
+# Rolling hash over word hashes: polynomial base and Mersenne prime modulus
+HASH_BASE = 1_000_003
+HASH_PRIME = (1 << 61) - 1
+
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+
+# Where extracted blocks are suggested to live in shared-components.yaml
+EXTRACT_SECTION = 'extracted'
+COMPONENTS_FILE = 'shared-components.yaml'
+
+
+class Block:
+    """One paragraph or line of a prompt file."""
+    
+    __slots__ = ('file', 'kind', 'line', 'paragraph', 'text', 'normalized')
+    
+    def __init__(self, file: str, kind: str, line: int, paragraph: int, text: str,
+                 normalized: str):
+        self.file = file
+        self.kind = kind
+        self.line = line
+        self.paragraph = paragraph
+        self.text = text
+        self.normalized = normalized
+
+
+def normalize(text: str) -> str:
+    """Return text as lowercase words separated by single spaces."""
+    lines = (MARKER_PATTERN.sub('', line) for line in text.split('\n'))
+    return ' '.join(WORD_PATTERN.findall('\n'.join(lines).lower()))
+
+
+def split_blocks(name: str, content: str, min_words: int) -> List[Block]:
+    """Split content into paragraph blocks and line blocks.
+    
+    Paragraphs are separated by blank lines. Lines are only produced for
+    paragraphs with more than one line; a one-line paragraph is already a
+    paragraph block. Blocks with fewer than min_words words are dropped.
+    """
+    blocks = []
+    paragraph_lines = []
+    paragraph_start = 0
+    paragraph = 0
+    
+    def flush():
+        nonlocal paragraph
+        if not paragraph_lines:
+            return
+        text = '\n'.join(line for _, line in paragraph_lines)
+        normalized = normalize(text)
+        if normalized.count(' ') + 1 >= min_words:
+            blocks.append(Block(name, 'paragraph', paragraph_start, paragraph, text, normalized))
+        if len(paragraph_lines) > 1:
+            for number, line in paragraph_lines:
+                normalized = normalize(line)
+                if normalized.count(' ') + 1 >= min_words:
+                    blocks.append(Block(name, 'line', number, paragraph, line.strip(), normalized))
+        paragraph += 1
+        paragraph_lines.clear()
+    
+    for number, line in enumerate(content.split('\n'), 1):
+        if line.strip():
+            if not paragraph_lines:
+                paragraph_start = number
+            paragraph_lines.append((number, line))
+        else:
+            flush()
+    flush()
+    return blocks
+
+
+def _split_task(task):
+    """Read one file and split it; returns (blocks, error)."""
+    path, name, min_words = task
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return split_blocks(name, f.read(), min_words), None
+    except (OSError, UnicodeDecodeError) as e:
+        return [], f"{name}: {e}"
+
+
+def split_files(tasks, jobs: int = 1):
+    """Return [(blocks, error)] per file, in a process pool when jobs > 1."""
+    if jobs > 1 and len(tasks) > 1:
+        chunksize = max(1, len(tasks) // (jobs * 8))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(_split_task, tasks, chunksize=chunksize))
+    return [_split_task(task) for task in tasks]
+
+
+def word_hash(word: str, cache: Dict[str, int]) -> int:
+    """Return a stable 61-bit hash of a word, memoized in cache."""
+    value = cache.get(word)
+    if value is None:
+        digest = hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest()
+        value = int.from_bytes(digest, 'little') % HASH_PRIME
+        cache[word] = value
+    return value
+
+
+def shingle_hashes(normalized: str, size: int, cache: Dict[str, int]) -> FrozenSet[int]:
+    """Return the hashes of every run of size consecutive words.
+    
+    The polynomial hash of each window is derived from the previous one in
+    constant time (remove the outgoing word, shift, add the incoming word),
+    so a block of n words costs O(n) however large size is.
+    """
+    words = [word_hash(word, cache) for word in normalized.split(' ')]
+    if len(words) <= size:
+        value = 0
+        for word in words:
+            value = (value * HASH_BASE + word) % HASH_PRIME
+        return frozenset([value])
+    
+    top = pow(HASH_BASE, size - 1, HASH_PRIME)
+    value = 0
+    for word in words[:size]:
+        value = (value * HASH_BASE + word) % HASH_PRIME
+    hashes = {value}
+    for i in range(size, len(words)):
+        value = ((value - words[i - size] * top) * HASH_BASE + words[i]) % HASH_PRIME
+        hashes.add(value)
+    return frozenset(hashes)
+
+
+def minhash(shingles: FrozenSet[int], size: int = NUM_PERMUTATIONS) -> Tuple[int, ...]:
+    """Return a MinHash signature of a shingle set in one pass over it.
+    
+    Uses one-permutation hashing: each shingle hash falls into one of size
+    bins and each bin keeps its minimum, so signing costs O(shingles)
+    rather than O(shingles * size). Empty bins borrow the value of the next
+    non-empty bin (with the distance mixed in) so that short blocks still
+    get a full signature.
+    """
+    bins = [None] * size
+    for value in shingles:
+        slot = value % size
+        value //= size
+        current = bins[slot]
+        if current is None or value < current:
+            bins[slot] = value
+    if None not in bins:
+        return tuple(bins)
+    if not shingles:
+        return tuple([0] * size)
+    
+    # Walk twice around the bins backwards, so every empty bin has seen
+    # the nearest filled bin to its right (wrapping around)
+    signature = list(bins)
+    nearest = None
+    for i in range(2 * size - 1, -1, -1):
+        slot = i % size
+        if bins[slot] is not None:
+            nearest = slot
+        elif i < size:
+            signature[slot] = bins[nearest] * size + (nearest - slot) % size
+    return tuple(signature)
+
+
+def _signature_task(task):
+    """Return (shingles, signature) for each normalized text in a chunk."""
+    texts, size = task
+    cache = {}
+    results = []
+    for normalized in texts:
+        shingles = shingle_hashes(normalized, size, cache)
+        results.append((shingles, minhash(shingles)))
+    return results
+
+
+def run_chunks(worker, items: List[Any], extra: Tuple, jobs: int) -> List[Any]:
+    """Apply worker to items in chunks, in a process pool when jobs > 1."""
+    if jobs > 1 and len(items) > 1:
+        size = max(1, len(items) // (jobs * 8))
+        chunks = [(items[i:i + size],) + extra for i in range(0, len(items), size)]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = executor.map(worker, chunks)
+            return [result for chunk in results for result in chunk]
+    return worker((items,) + extra)
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    """Return the Jaccard similarity of two sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class UnionFind:
+    """Disjoint sets over 0..n-1."""
+    
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+    
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+    
+    def union(self, a: int, b: int):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[max(a, b)] = min(a, b)
+
+
+def group_blocks(blocks: List[Block], threshold: float, shingle_size: int,
+                 jobs: int) -> List[List[List[Block]]]:
+    """Group blocks into clusters of exact and near repeats.
+    
+    Returns one entry per cluster: a list of variants, each variant being
+    the blocks that share one normalized text. Clusters are found among
+    distinct texts only, so a block repeated a thousand times is hashed
+    and signed once.
+    """
+    variants = {}
+    for block in blocks:
+        variants.setdefault(block.normalized, []).append(block)
+    texts = list(variants)
+    
+    signed = run_chunks(_signature_task, texts, (shingle_size,), jobs)
+    
+    # LSH: texts whose signatures agree on every row of some band share a
+    # bucket; only bucket mates are compared
+    rows = NUM_PERMUTATIONS // LSH_BANDS
+    buckets = {}
+    for i, (_, signature) in enumerate(signed):
+        for band in range(LSH_BANDS):
+            key = (band,) + signature[band * rows:(band + 1) * rows]
+            buckets.setdefault(key, []).append(i)
+    
+    sets = UnionFind(len(texts))
+    compared = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        # Compare each member with every earlier member it is not yet
+        # joined to; a pair met again in another band is not compared twice
+        for j in range(1, len(members)):
+            other = members[j]
+            for first in members[:j]:
+                pair = (min(first, other), max(first, other))
+                if pair in compared or sets.find(first) == sets.find(other):
+                    continue
+                compared.add(pair)
+                if jaccard(signed[first][0], signed[other][0]) >= threshold:
+                    sets.union(first, other)
+    
+    clusters = {}
+    for i, text in enumerate(texts):
+        clusters.setdefault(sets.find(i), []).append(variants[text])
+    return list(clusters.values())
+
+
+def suggest_key(text: str, taken: set) -> str:
+    """Return an unused snake_case component key from a block's first words."""
+    words = normalize(text).split(' ')[:5]
+    base = '_'.join(words) or 'block'
+    key = base
+    n = 2
+    while key in taken:
+        key = f"{base}_{n}"
+        n += 1
+    taken.add(key)
+    return key
+
+
+def rank_candidates(clusters: List[List[List[Block]]], counter: CachedTokenCounter,
+                    min_files: int) -> List[Dict[str, Any]]:
+    """Turn clusters into extraction candidates, most tokens saved first.
+    
+    Extracting a block keeps one copy in shared-components.yaml and puts a
+    $ref: line at every occurrence, so the saving is the block's tokens for
+    every copy but one, minus the tokens of the references.
+    """
+    candidates = []
+    taken = set()
+    for variants in clusters:
+        occurrences = [block for variant in variants for block in variant]
+        files = sorted({block.file for block in occurrences})
+        if len(occurrences) < 2 or len(files) < min_files:
+            continue
+        # The most repeated variant represents the cluster
+        variants.sort(key=lambda variant: (-len(variant), variant[0].normalized))
+        representative = variants[0][0]
+        key = suggest_key(representative.text, taken)
+        ref = f"$ref: {COMPONENTS_FILE}#/{EXTRACT_SECTION}/{key}"
+        
+        tokens = counter.count(representative.text)
+        copies = sum(counter.count(block.text) for block in occurrences)
+        saved = copies - tokens - len(occurrences) * counter.count(ref)
+        if saved <= 0:
+            continue
+        candidates.append({
+            'kind': representative.kind,
+            'match': 'exact' if len(variants) == 1 else 'near',
+            'variants': len(variants),
+            'occurrences': len(occurrences),
+            'files': len(files),
+            'tokens': tokens,
+            'tokens_saved': saved,
+            'suggested_ref': ref,
+            'text': representative.text,
+            'locations': [f"{block.file}:{block.line}" for block in
+                          sorted(occurrences, key=lambda block: (block.file, block.line))],
+        })
+    candidates.sort(key=lambda c: (-c['tokens_saved'], -c['files'], c['text']))
+    return candidates
+
+
+def find_duplicates(root: Path, exclude=(), min_words: int = 8, threshold: float = 0.8,
+                    shingle_size: int = 4, min_files: int = 2, jobs: int = 1,
+                    model: str = 'gpt-4') -> Dict[str, Any]:
+    """Scan root and return the ranked extraction candidates with run statistics."""
+    start = time.perf_counter()
+    with profiling.phase('discover'):
+        tasks = [(path, Path(path).relative_to(root).as_posix(), min_words)
+                 for path in discover_prompt_files(root, exclude)]
+    
+    blocks = []
+    errors = []
+    with profiling.phase('split'):
+        for file_blocks, error in split_files(tasks, jobs):
+            blocks.extend(file_blocks)
+            if error:
+                errors.append(error)
+    profiling.count('blocks', len(blocks))
+    
+    counter = CachedTokenCounter(model)
+    
+    # Paragraphs first; lines are only considered inside paragraphs that
+    # are not already part of a repeated paragraph
+    paragraphs = [block for block in blocks if block.kind == 'paragraph']
+    with profiling.phase('group'):
+        clusters = group_blocks(paragraphs, threshold, shingle_size, jobs)
+    with profiling.phase('rank'):
+        candidates = rank_candidates(clusters, counter, min_files)
+    covered = set()
+    for variants in clusters:
+        if sum(len(variant) for variant in variants) > 1:
+            covered.update((block.file, block.paragraph) for variant in variants for block in variant)
+    lines = [block for block in blocks
+             if block.kind == 'line' and (block.file, block.paragraph) not in covered]
+    with profiling.phase('group'):
+        clusters = group_blocks(lines, threshold, shingle_size, jobs)
+    with profiling.phase('rank'):
+        candidates += rank_candidates(clusters, counter, min_files)
+    candidates.sort(key=lambda c: (-c['tokens_saved'], -c['files'], c['text']))
+    
+    return {
+        'root': str(root),
+        'files': len(tasks),
+        'blocks': len(blocks),
+        'distinct_blocks': len({block.normalized for block in blocks}),
+        'threshold': threshold,
+        'candidates': candidates,
+        'tokens_saved': sum(c['tokens_saved'] for c in candidates),
+        'token_note': counter.describe(),
+        'errors': errors,
+        'seconds': round(time.perf_counter() - start, 3),
+    }
+
+
+def print_report(report: Dict[str, Any], top: int):
+    """Print the candidates as text."""
+    print("=" * 60)
+    print("DUPLICATE BLOCK REPORT")
+    print("=" * 60)
+    print(f"Files scanned: {report['files']} ({report['blocks']} blocks, "
+          f"{report['distinct_blocks']} distinct) in {report['seconds']:.3f}s")
+    print(f"Candidates: {len(report['candidates'])}, "
+          f"{report['tokens_saved']:,} tokens saved if all are extracted")
+    if report['token_note']:
+        print(f"Note: {report['token_note']}")
+    
+    for rank, candidate in enumerate(report['candidates'][:top], 1):
+        preview = candidate['text'].replace('\n', ' ')
+        if len(preview) > 70:
+            preview = preview[:67] + '...'
+        print(f"\n{rank}. {candidate['tokens_saved']:,} tokens saved - {candidate['kind']}, "
+              f"{candidate['match']} match, {candidate['occurrences']} occurrences "
+              f"in {candidate['files']} files")
+        print(f"   \"{preview}\"")
+        print(f"   Extract as: {candidate['suggested_ref']}")
+        for location in candidate['locations'][:5]:
+            print(f"   - {location}")
+        if len(candidate['locations']) > 5:
+            print(f"   - ... and {len(candidate['locations']) - 5} more")
+    
+    if report['errors']:
+        print(f"\nUnreadable files: {len(report['errors'])}")
+        for error in report['errors']:
+            print(f"  - {error}")
+    print("=" * 60)
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.find_duplicates."""
+    root = Path(args.root)
+    if not root.is_dir():
+        print(f"Error: {root} is not a directory")
+        sys.exit(1)
+    
+    report = find_duplicates(root, args.exclude, args.min_words, args.threshold,
+                             args.shingle_size, args.min_files, args.jobs, args.model)
+    
+    if args.format == 'json':
+        if args.top:
+            report['candidates'] = report['candidates'][:args.top]
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.top or len(report['candidates']))
@@ -0,0 +1,379 @@
+"""
+Incremental Installer
+
+Install the command set into ~/.claude as INSTALL.sh does, but copy only
+what changed. A manifest in the target directory records every installed
+file with its SHA-256, size and mtimes, and each run diffs the source
+tree against it:
+
+  add        - a source file that is not installed yet
+  update     - the source changed, or the installed copy was edited or deleted
+  remove     - installed by an earlier run, and its source is gone
+  unchanged  - nothing to do
+
+A source whose size and mtime match the manifest is not read again, so
+an unchanged reinstall costs one stat per file. Files are replaced with
+an atomic rename (through the artifact store when PROMPT_TOOLS_STORE is
+set). A stale file is removed only while it still matches what was
+installed; an edited one is kept and reported.
+
+Usage:
+    python -m prompt_tools install
+    python -m prompt_tools install --set core --dry-run
+    python -m prompt_tools install --validate --count
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import SETUP_DIR, profiling
+from .discovery import RACY_SECONDS, walk_files
+from .files import atomic_output, write_artifact
+from .store import digest_bytes, digest_file
+
+MANIFEST_NAME = '.prompt-tools-install.json'
+MANIFEST_FORMAT = 'install-manifest'
+MANIFEST_VERSION = 1
+
+# The installation methods of INSTALL.sh: (source directory, target
+# directory, extensions or None for every file, recursive, names or None)
+CORE_COMMANDS = ('guide', 'agents', 'execute', 'workflows', 'senior-engineer', 'documentation')
+INSTALL_SETS = {
+    'all': (
+        ('commands', 'commands', ('.md',), False, None),
+        ('workflows', 'workflows', ('.md',), False, None),
+        ('_archive', 'archive', None, True, None),
+    ),
+    'core': (
+        ('commands', 'commands', ('.md',), False, CORE_COMMANDS),
+    ),
+}
+
+ACTIONS = ('add', 'update', 'remove', 'kept', 'unchanged')
+
+
+def load_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Read the installed files recorded at path; a missing or unreadable manifest is empty."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get('format') != MANIFEST_FORMAT or data.get('version') != MANIFEST_VERSION:
+        return {}
+    return data['files']
+
+
+def save_manifest(path: Path, files: Dict[str, Dict[str, Any]]):
+    """Write the installed files back to the manifest at path."""
+    with atomic_output(path) as f:
+        json.dump({'format': MANIFEST_FORMAT, 'version': MANIFEST_VERSION, 'files': files},
+                  f, indent=1, sort_keys=True)
+
+
+def collect_sources(source_root: Path, install_set: str) -> Dict[str, str]:
+    """Return {path relative to the target: path relative to source_root} for an install set."""
+    sources = {}
+    for source_dir, target_dir, extensions, recursive, names in INSTALL_SETS[install_set]:
+        directory = os.path.join(source_root, source_dir)
+        if not os.path.isdir(directory):
+            continue
+        prefix = len(directory) + 1
+        for path in walk_files(directory, extensions, recursive=recursive):
+            relative = path[prefix:].replace(os.sep, '/')
+            if names is not None and os.path.splitext(relative)[0] not in names:
+                continue
+            sources[f"{target_dir}/{relative}"] = f"{source_dir}/{relative}"
+    return sources
+
+
+def _installed_mtime(path: str, entry: Dict[str, Any]) -> Tuple[bool, Optional[int]]:
+    """Return (exists, mtime_ns) for the file at path; mtime_ns is None unless it holds entry's content.
+    
+    The content is hashed only when the size matches and the mtime does not.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False, None
+    if st.st_size != entry['size']:
+        return True, None
+    if st.st_mtime_ns != entry.get('mtime_ns'):
+        profiling.count('files_hashed')
+        if digest_file(path) != entry['sha256']:
+            return True, None
+    return True, st.st_mtime_ns
+
+
+def plan_install(source_root: Path, target: Path, sources: Dict[str, str],
+                 manifest: Dict[str, Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Diff sources against the manifest and the target; returns items by action."""
+    plan = {action: [] for action in ACTIONS}
+    # Names use '/', which every platform accepts, so paths are joined by
+    # concatenation; os.path.join costs more than the stat on this path
+    source_prefix = os.path.join(source_root, '')
+    target_prefix = os.path.join(target, '')
+    
+    for name, source in sorted(sources.items()):
+        st = os.stat(source_prefix + source)
+        profiling.count('stat_calls')
+        entry = manifest.get(name)
+        if (entry is not None and entry.get('source_mtime_ns') == st.st_mtime_ns
+                and entry['size'] == st.st_size):
+            digest = entry['sha256']
+        else:
+            with profiling.phase('hash'):
+                digest = digest_file(source_prefix + source)
+            profiling.count('files_hashed')
+        item = {'path': name, 'source': source, 'sha256': digest, 'size': st.st_size,
+                'source_mtime_ns': st.st_mtime_ns, 'mtime_ns': None, 'reason': None}
+        
+        # Without an entry, the file may have been installed before there
+        # was a manifest, e.g. by INSTALL.sh's cp
+        exists, item['mtime_ns'] = _installed_mtime(target_prefix + name,
+                                                    entry if entry is not None else item)
+        if entry is None:
+            if item['mtime_ns'] is not None:
+                plan['unchanged'].append(item)
+            else:
+                item['reason'] = 'replaces an unmanaged file' if exists else None
+                plan['add'].append(item)
+        elif entry['sha256'] != digest:
+            plan['update'].append(item)
+        elif item['mtime_ns'] is None:
+            item['reason'] = 'installed copy was edited' if exists else 'installed copy was deleted'
+            plan['update'].append(item)
+        else:
+            plan['unchanged'].append(item)
+    
+    for name, entry in sorted(manifest.items()):
+        if name in sources:
+            continue
+        if os.path.exists(source_prefix + entry['source']):
+            # Still in the source tree, just not part of this install set
+            continue
+        item = {'path': name, 'source': entry['source'], 'sha256': entry['sha256'],
+                'size': entry['size'], 'reason': None}
+        exists, mtime_ns = _installed_mtime(target_prefix + name, entry)
+        if not exists:
+            item['reason'] = 'already deleted'
+            plan['remove'].append(item)
+        elif mtime_ns is not None:
+            plan['remove'].append(item)
+        else:
+            item['reason'] = 'edited since it was installed'
+            plan['kept'].append(item)
+    
+    return plan
+
+
+def check_changes(plan: Dict[str, List[Dict[str, Any]]], source_root: Path, target: Path,
+                  validate: bool, count: bool, template_dir: Path) -> Dict[str, Any]:
+    """Validate and token-count the files that would be added or updated."""
+    changed = plan['add'] + plan['update']
+    result = {'errors': 0, 'warnings': 0, 'issues': {}}
+    validator = None
+    counter = None
+    # Imported only when asked for: installing must not need PyYAML or tiktoken
+    if validate:
+        from .prompt_validator import PromptValidator, ValidationIssue
+        validator = PromptValidator(template_dir=template_dir)
+    if count:
+        from .tokens import CachedTokenCounter
+        counter = CachedTokenCounter()
+        result['tokens'] = {'before': 0, 'after': 0, 'note': counter.describe()}
+    
+    for item in changed:
+        if validator is not None:
+            with profiling.phase('validate'):
+                issues = validator.validate_file(source_root / item['source'])
+            errors = [i for i in issues if i.severity == ValidationIssue.SEVERITY_ERROR]
+            warnings = [i for i in issues if i.severity == ValidationIssue.SEVERITY_WARNING]
+            result['errors'] += len(errors)
+            result['warnings'] += len(warnings)
+            if errors or warnings:
+                result['issues'][item['path']] = [str(i) for i in errors + warnings]
+        if counter is not None:
+            with profiling.phase('read'):
+                after = (source_root / item['source']).read_text(encoding='utf-8', errors='replace')
+                try:
+                    before = (target / item['path']).read_text(encoding='utf-8', errors='replace')
+                except OSError:
+                    before = ''
+            with profiling.phase('count'):
+                item['tokens'] = counter.count(after)
+                item['tokens_before'] = counter.count(before)
+            result['tokens']['before'] += item['tokens_before']
+            result['tokens']['after'] += item['tokens']
+    
+    return result
+
+
+def _remove_empty_parents(path: Path, stop: Path):
+    """Remove path's parent directories up to (not including) stop while they are empty."""
+    parent = path.parent
+    while parent != stop and stop in parent.parents:
+        try:
+            parent.rmdir()
+        except OSError:
+            return
+        parent = parent.parent
+
+
+def apply_plan(plan: Dict[str, List[Dict[str, Any]]], source_root: Path, target: Path,
+               manifest: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Write, remove and record files as planned; returns the new manifest."""
+    files = dict(manifest)
+    now = time.time()
+    
+    for item in plan['add'] + plan['update']:
+        dest = target / item['path']
+        with profiling.phase('read'), open(source_root / item['source'], 'rb') as f:
+            data = f.read()
+        profiling.count('files_read')
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with profiling.phase('write'):
+            write_artifact(dest, data)
+        item['sha256'] = digest_bytes(data)
+        item['size'] = len(data)
+        item['mtime_ns'] = os.stat(dest).st_mtime_ns
+    
+    for item in plan['add'] + plan['update'] + plan['unchanged']:
+        source_mtime_ns = item['source_mtime_ns']
+        if now - source_mtime_ns / 1e9 < RACY_SECONDS:
+            # Modified too recently to trust the mtime; hash it next time
+            source_mtime_ns = None
+        files[item['path']] = {
+            'source': item['source'],
+            'sha256': item['sha256'],
+            'size': item['size'],
+            'source_mtime_ns': source_mtime_ns,
+            'mtime_ns': item['mtime_ns'],
+        }
+    
+    for item in plan['remove']:
+        dest = target / item['path']
+        try:
+            os.unlink(dest)
+            profiling.count('files_removed')
+        except FileNotFoundError:
+            pass
+        _remove_empty_parents(dest, target)
+        del files[item['path']]
+    for item in plan['kept']:
+        del files[item['path']]
+    
+    return files
+
+
+def install(source_root: Path, target: Path, install_set: str = 'all', dry_run: bool = False,
+            validate: bool = False, count: bool = False,
+            template_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Bring target up to date with an install set and return a summary.
+    
+    With validate, nothing is written when a changed file has errors.
+    """
+    start = time.perf_counter()
+    manifest_path = target / MANIFEST_NAME
+    manifest = load_manifest(manifest_path)
+    
+    with profiling.phase('discover'):
+        sources = collect_sources(source_root, install_set)
+    with profiling.phase('plan'):
+        plan = plan_install(source_root, target, sources, manifest)
+    
+    checks = {'errors': 0, 'warnings': 0, 'issues': {}}
+    if validate or count:
+        checks = check_changes(plan, source_root, target, validate, count,
+                               template_dir or SETUP_DIR / 'templates')
+    
+    blocked = validate and checks['errors'] > 0
+    if not dry_run and not blocked:
+        target.mkdir(parents=True, exist_ok=True)
+        files = apply_plan(plan, source_root, target, manifest)
+        if files != manifest:
+            save_manifest(manifest_path, files)
+    
+    return {
+        'source': str(source_root),
+        'target': str(target),
+        'set': install_set,
+        'dry_run': dry_run,
+        'blocked': blocked,
+        'plan': {action: [{k: v for k, v in item.items() if not k.endswith('mtime_ns')}
+                          for item in items]
+                 for action, items in plan.items()},
+        'checks': checks,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def format_report(summary: Dict[str, Any]) -> str:
+    """Format an install summary as text."""
+    plan = summary['plan']
+    checks = summary['checks']
+    report = []
+    report.append("=" * 60)
+    title = "INSTALL PLAN" if summary['dry_run'] else "INSTALL"
+    report.append(f"{title} - {summary['target']} ({summary['set']})")
+    report.append("=" * 60)
+    
+    markers = {'add': '+', 'update': '~', 'remove': '-', 'kept': '!'}
+    for action, marker in markers.items():
+        for item in plan[action]:
+            line = f"  {marker} {item['path']}"
+            if 'tokens' in item:
+                line += f"  {item['tokens']:,} tokens ({item['tokens'] - item['tokens_before']:+,})"
+            if item['reason']:
+                line += f"  ({item['reason']})"
+            report.append(line)
+    
+    if checks['issues']:
+        report.append("-" * 60)
+        for path, issues in checks['issues'].items():
+            report.append(f"{path}:")
+            for issue in issues:
+                report.append(f"  {issue}")
+    
+    report.append("-" * 60)
+    counts = {action: len(items) for action, items in plan.items()}
+    report.append(f"Added: {counts['add']}, updated: {counts['update']}, "
+                  f"removed: {counts['remove']}, kept: {counts['kept']}, "
+                  f"unchanged: {counts['unchanged']} in {summary['seconds']:.3f}s")
+    if 'tokens' in checks:
+        tokens = checks['tokens']
+        report.append(f"Tokens in changed files: {tokens['after']:,} "
+                      f"({tokens['after'] - tokens['before']:+,})")
+        if tokens['note']:
+            report.append(f"Note: {tokens['note']}")
+    if checks['errors'] or checks['warnings']:
+        report.append(f"Validation: {checks['errors']} error(s), {checks['warnings']} warning(s)")
+    if summary['blocked']:
+        report.append("Nothing installed: fix the errors above, or install without --validate")
+    elif summary['dry_run']:
+        report.append("Dry run: nothing was written")
+    report.append("=" * 60)
+    return '\n'.join(report)
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.install."""
+    source_root = Path(args.source)
+    if not source_root.is_dir():
+        print(f"Error: {source_root} is not a directory")
+        sys.exit(1)
+    
+    summary = install(source_root, Path(args.target).expanduser(), args.set,
+                      dry_run=args.dry_run, validate=args.validate, count=args.count,
+                      template_dir=args.template_dir)
+    
+    if args.format == 'json':
+        print(json.dumps(summary, indent=2))
+    else:
+        print(format_report(summary))
+    
+    sys.exit(1 if summary['blocked'] else 0)
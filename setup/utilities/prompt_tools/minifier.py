@@ -0,0 +1,497 @@
+"""
+Prompt Minifier
+
+Rewrite prompt files to fewer tokens with transformations that keep their
+meaning:
+
+  whitespace   - trailing whitespace, runs of spaces between words and runs
+                 of blank lines (fenced code blocks are left as they are, and
+                 spaces are not collapsed in indented code, inline code,
+                 tables or columns aligned across lines)
+  quotes       - quotes around YAML scalars that read the same unquoted
+  block-style  - YAML re-emitted in block style with two-space indentation,
+                 unfolded lines and literal blocks for multi-line strings
+                 (only for files without comments, which it would drop)
+  refs         - with --refs, text that repeats a shared component verbatim
+                 becomes a $ref: to it
+
+Every candidate is counted with the same encoding as the token counter and
+kept only if it has fewer tokens than the text it replaces. YAML candidates
+must also load to the same data, and a refs candidate must inline (as
+bundle-prompts.py does) to exactly the text it replaced. Text files are
+handled paragraph by paragraph and counts are memoized per worker, so a
+paragraph or component that recurs across files is counted once.
+
+Trailing whitespace is dropped even where Markdown would read two spaces
+as a line break: prompts are read as text, not rendered.
+
+When tiktoken or its encoding is unavailable, counts are estimates
+(characters / 4) that do not decide reliably whether a change saves
+tokens, so files are only written with estimates if that is asked for
+explicitly (--allow-estimates).
+
+Usage:
+    python -m prompt_tools minify <prompt files or directories>
+    python -m prompt_tools minify commands/ --refs --write
+"""
+
+import json
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import yaml
+
+from . import SETUP_DIR, profiling
+from . import yaml_io
+from .bundle_prompts import YAML_EXTENSIONS, BundleError, PromptBundler
+from .files import atomic_output, write_artifact
+from .references import ComponentIndex, collect_inputs
+from .tokens import CachedTokenCounter
+
+TRANSFORMS = ('whitespace', 'quotes', 'block-style', 'refs')
+
+# Opening line of a fenced code block: ``` or ~~~, optionally indented
+FENCE_PATTERN = re.compile(r'^\s*(`{3,}|~{3,})')
+
+# Two or more spaces between words (leading indentation is not matched)
+SPACE_RUN = re.compile(r'(?<=\S) {2,}(?=\S)')
+
+# Indentation of a Markdown indented code block: a tab or four spaces
+CODE_INDENT = ('\t', '    ')
+
+# A YAML line whose value is a single-line quoted scalar: indentation,
+# list markers and key, then the quoted scalar
+QUOTED_LINE = re.compile(r'''^(\s*(?:-\s+)*(?:[^\s'"#-][^'"#]*?:\s+)?)'''
+                         r'''("(?:[^"\\]|\\.)*"|'(?:[^']|'')*')\s*$''')
+
+# Components shorter than this are never worth a reference
+MIN_REF_CHARS = 40
+
+# Line width for re-emitted YAML: wide enough that no scalar is folded
+DUMP_WIDTH = 1 << 16
+
+DEFAULT_COMPONENTS = SETUP_DIR / 'shared-components.yaml'
+
+
+class MinifyError(Exception):
+    """A file that cannot be minified (for instance YAML that does not parse)."""
+
+
+def split_segments(lines: List[str]) -> List[Tuple[str, List[str]]]:
+    """Group lines into ('text' | 'blank' | 'fence', lines) runs.
+    
+    A fence run holds a fenced code block from its opening to its closing
+    line; an unclosed fence runs to the end of the file.
+    """
+    segments = []
+    fence = None
+    for line in lines:
+        if fence is not None:
+            segments[-1][1].append(line)
+            if line.strip().startswith(fence) and not line.strip().strip(fence[0]):
+                fence = None
+            continue
+        match = FENCE_PATTERN.match(line)
+        if match:
+            fence = match.group(1)
+            segments.append(('fence', [line]))
+            continue
+        kind = 'text' if line.strip() else 'blank'
+        if segments and segments[-1][0] == kind:
+            segments[-1][1].append(line)
+        else:
+            segments.append((kind, [line]))
+    return segments
+
+
+def aligned_lines(block: List[str]) -> Set[int]:
+    """Return the indexes of lines whose spacing must be kept as it is.
+    
+    That is indented code, inline code, table rows, and lines where a run
+    of spaces lines up the next word with a word at the same column on
+    another line of the paragraph.
+    """
+    keep = set()
+    columns: Dict[int, List[int]] = {}
+    for i, line in enumerate(block):
+        if line.startswith(CODE_INDENT) or '`' in line or '|' in line:
+            keep.add(i)
+            continue
+        for match in SPACE_RUN.finditer(line):
+            columns.setdefault(match.end(), []).append(i)
+    for indexes in columns.values():
+        if len(indexes) > 1:
+            keep.update(indexes)
+    return keep
+
+
+def squeeze_line(line: str, keep_spaces: bool = False) -> str:
+    """Drop trailing whitespace and, unless keep_spaces, repeated spaces."""
+    line = line.rstrip()
+    if keep_spaces:
+        return line
+    return SPACE_RUN.sub(' ', line)
+
+
+def literal_blocks(events):
+    """Ask for literal block style for every multi-line string scalar.
+    
+    The emitter falls back to a quoted style on its own where a literal
+    block could not represent the value.
+    """
+    for event in events:
+        if isinstance(event, yaml.ScalarEvent) and '\n' in event.value and event.implicit[1]:
+            event.style = '|'
+        yield event
+
+
+class PromptMinifier:
+    """Minify one file at a time, remembering token counts and scalar checks."""
+    
+    def __init__(self, model: str = "gpt-4", components: Optional[Path] = None):
+        self.counter = CachedTokenCounter(model)
+        # quoted scalar -> its unquoted spelling, or None if that would differ
+        self.unquoted: Dict[str, Optional[str]] = {}
+        self.bundler = None
+        self.components: List[Tuple[str, str]] = []
+        if components is not None:
+            self.load_components(Path(components))
+    
+    def load_components(self, path: Path):
+        """Render every component in path that is long enough to replace by a reference."""
+        self.bundler = PromptBundler(ComponentIndex(path.parent))
+        _, paths, error = self.bundler.index.load(path.name)
+        if error:
+            raise MinifyError(error)
+        seen = set()
+        for component in sorted(paths):
+            if any(char.isspace() for char in component):
+                continue
+            ref = f"{path.name}#/{component}"
+            try:
+                text = self.bundler.render(ref)
+            except BundleError:
+                continue
+            if len(text) >= MIN_REF_CHARS and text not in seen:
+                seen.add(text)
+                self.components.append((ref, text))
+        # Longest first, so a component is replaced before any part of it
+        self.components.sort(key=lambda item: -len(item[1]))
+    
+    def fewer_tokens(self, candidate: str, current: str) -> bool:
+        """Whether candidate differs from current and has fewer tokens."""
+        if candidate == current:
+            return False
+        profiling.count('minify_candidates')
+        if self.counter.count(candidate) < self.counter.count(current):
+            profiling.count('minify_accepted')
+            return True
+        return False
+    
+    def minify_text(self, text: str, transforms: Dict[str, int]) -> str:
+        """Normalize whitespace in prose, keeping each change only if it saves tokens."""
+        lines = text.split('\n')
+        trailing_newline = text.endswith('\n')
+        if trailing_newline:
+            lines.pop()
+        
+        segments = []
+        for kind, block in split_segments(lines):
+            original = '\n'.join(block)
+            if kind == 'text':
+                keep = aligned_lines(block)
+                candidate = '\n'.join(squeeze_line(line, i in keep) for i, line in enumerate(block))
+                if self.fewer_tokens(candidate, original):
+                    transforms['whitespace'] += 1
+                    original = candidate
+            segments.append((kind, original))
+        
+        end = '\n' if trailing_newline else ''
+        kept = '\n'.join(block for _, block in segments) + end
+        # One empty line between paragraphs, none at the start or the end
+        while segments and segments[0][0] == 'blank':
+            segments.pop(0)
+        while segments and segments[-1][0] == 'blank':
+            segments.pop()
+        collapsed = '\n'.join('' if kind == 'blank' else block for kind, block in segments) + end
+        if self.fewer_tokens(collapsed, kept):
+            transforms['whitespace'] += 1
+            return collapsed
+        return kept
+    
+    def replace_components(self, text: str, transforms: Dict[str, int]) -> str:
+        """Replace verbatim copies of shared components with references to them."""
+        candidates = [(ref, component) for ref, component in self.components if component in text]
+        if not candidates:
+            return text
+        try:
+            expected = self.bundler.inline_text(text)
+        except BundleError:
+            # The file's own references are broken; leave it to validate-refs
+            return text
+        for ref, component in candidates:
+            # A reference runs to the next whitespace, so it must end there
+            pattern = re.compile(re.escape(component) + r'(?=\s|\Z)')
+            candidate, replaced = pattern.subn(lambda _: f"$ref: {ref}", text)
+            if not replaced or not self.fewer_tokens(candidate, text):
+                continue
+            try:
+                same = self.bundler.inline_text(candidate) == expected
+            except BundleError:
+                same = False
+            if same:
+                transforms['refs'] += replaced
+                text = candidate
+        return text
+    
+    def unquote(self, quoted: str) -> Optional[str]:
+        """Return a quoted scalar's plain spelling, or None if it would read differently."""
+        if quoted not in self.unquoted:
+            plain = None
+            try:
+                value = yaml_io.safe_load(quoted)
+                if (isinstance(value, str) and value and '\n' not in value
+                        and yaml_io.safe_load(value) == value):
+                    plain = value
+            except yaml.YAMLError:
+                pass
+            self.unquoted[quoted] = plain
+        return self.unquoted[quoted]
+    
+    def loads_same(self, candidate: str, data: Any) -> bool:
+        """Whether candidate parses to data."""
+        try:
+            return yaml_io.safe_load(candidate) == data
+        except yaml.YAMLError:
+            return False
+    
+    def minify_yaml(self, text: str, transforms: Dict[str, int]) -> str:
+        """Apply the YAML transforms in turn, keeping each that saves tokens and keeps the data."""
+        try:
+            data = yaml_io.safe_load(text)
+        except yaml.YAMLError as e:
+            raise MinifyError(f"Failed to parse YAML: {e}")
+        
+        lines = text.split('\n')
+        candidate = '\n'.join(line.rstrip() for line in lines)
+        candidate = re.sub(r'\n{3,}', '\n\n', candidate)
+        if self.fewer_tokens(candidate, text) and self.loads_same(candidate, data):
+            transforms['whitespace'] += 1
+            text = candidate
+            lines = text.split('\n')
+        
+        unquoted = 0
+        for i, line in enumerate(lines):
+            match = QUOTED_LINE.match(line)
+            if match:
+                plain = self.unquote(match.group(2))
+                if plain is not None:
+                    lines[i] = match.group(1) + plain
+                    unquoted += 1
+        if unquoted:
+            candidate = '\n'.join(lines)
+            if self.fewer_tokens(candidate, text) and self.loads_same(candidate, data):
+                transforms['quotes'] += unquoted
+                text = candidate
+        
+        if '#' not in text and data is not None:
+            events = literal_blocks(yaml_io.iter_block_events(data, sort_keys=False))
+            with profiling.phase('dump'):
+                candidate = yaml.emit(events, Dumper=yaml_io.SafeDumper, allow_unicode=True,
+                                      indent=2, width=DUMP_WIDTH)
+            if self.fewer_tokens(candidate, text) and self.loads_same(candidate, data):
+                transforms['block-style'] += 1
+                text = candidate
+        return text
+    
+    def process(self, path: Path, name: str) -> Dict[str, Any]:
+        """Minify one file and return its JSON-serializable result."""
+        result = {'file': name, 'path': str(path), 'error': None}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                original = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            result['error'] = f"Cannot read file: {e}"
+            return result
+        
+        transforms = dict.fromkeys(TRANSFORMS, 0)
+        try:
+            if path.suffix.lower() in YAML_EXTENSIONS:
+                text = self.minify_yaml(original, transforms)
+            else:
+                text = self.minify_text(original, transforms)
+                if self.components:
+                    text = self.replace_components(text, transforms)
+        except MinifyError as e:
+            result['error'] = str(e)
+            return result
+        
+        before = self.counter.count(original)
+        after = self.counter.count(text)
+        if after >= before:
+            # Paragraph savings can vanish across paragraph boundaries
+            text, after = original, before
+            transforms = dict.fromkeys(TRANSFORMS, 0)
+        result.update({
+            'minified': text,
+            'changed': text != original,
+            'tokens': {'before': before, 'after': after},
+            'bytes': {'before': len(original.encode('utf-8')), 'after': len(text.encode('utf-8'))},
+            'transforms': transforms,
+        })
+        return result
+
+
+# Per-process minifier, set up once by _init_worker
+_minifier = None
+
+
+def _init_worker(model, components):
+    """Create this process's minifier, so counts are shared across its files."""
+    global _minifier
+    _minifier = PromptMinifier(model, components)
+
+
+def _minify_task(task: Tuple[Path, str]) -> Dict[str, Any]:
+    """Minify one (path, name) entry."""
+    return _minifier.process(*task)
+
+
+def run_minifier(entries: List[Tuple[Path, str]], model: str = "gpt-4",
+                 components: Optional[Path] = None, jobs: int = 1) -> List[Dict[str, Any]]:
+    """Minify every entry, in a process pool when jobs > 1; results keep entry order."""
+    settings = (model, components)
+    if jobs > 1 and len(entries) > 1:
+        chunksize = max(1, len(entries) // (jobs * 8))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=settings) as executor:
+            return list(executor.map(_minify_task, entries, chunksize=chunksize))
+    _init_worker(*settings)
+    return [_minify_task(entry) for entry in entries]
+
+
+def build_report(results: List[Dict[str, Any]], seconds: float, jobs: int,
+                 token_note: Optional[str]) -> Dict[str, Any]:
+    """Combine per-file results into one report."""
+    processed = [r for r in results if r['error'] is None]
+    before = sum(r['tokens']['before'] for r in processed)
+    after = sum(r['tokens']['after'] for r in processed)
+    return {
+        'files': len(results),
+        'failed': len(results) - len(processed),
+        'changed': sum(1 for r in processed if r['changed']),
+        'seconds': round(seconds, 3),
+        'jobs': jobs,
+        'tokens': {
+            'before': before,
+            'after': after,
+            'saved': before - after,
+            'note': token_note,
+        },
+        'transforms': {name: sum(r['transforms'][name] for r in processed) for name in TRANSFORMS},
+        'results': [{key: value for key, value in r.items() if key != 'minified'} for r in results],
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    """Print the combined report as text."""
+    print("=" * 60)
+    print("PROMPT MINIFY REPORT")
+    print("=" * 60)
+    print(f"Files: {report['files']} ({report['changed']} changed, {report['failed']} failed) "
+          f"in {report['seconds']:.3f}s with {report['jobs']} job(s)")
+    
+    for result in report['results']:
+        if result['error']:
+            print(f"\n{result['file']}: FAILED - {result['error']}")
+            continue
+        if not result['changed']:
+            continue
+        tokens = result['tokens']
+        applied = ', '.join(f"{name} {count}" for name, count in result['transforms'].items() if count)
+        print(f"\n{result['file']}: {tokens['before']:,} -> {tokens['after']:,} tokens "
+              f"(-{tokens['before'] - tokens['after']:,}; {applied})")
+    
+    print("\n" + "=" * 60)
+    tokens = report['tokens']
+    share = tokens['saved'] / tokens['before'] if tokens['before'] else 0.0
+    print(f"Tokens: {tokens['before']:,} -> {tokens['after']:,} "
+          f"(saved {tokens['saved']:,}, {share:.1%})")
+    print("Transforms kept: " +
+          ", ".join(f"{name} {count}" for name, count in report['transforms'].items()))
+    if tokens['note']:
+        print(f"Note: {tokens['note']}")
+    print("=" * 60)
+
+
+def write_minified(results: List[Dict[str, Any]], output_dir: Optional[Path]) -> int:
+    """Write each changed file in place, or under output_dir by its name; returns the count."""
+    written = 0
+    for result in results:
+        if result['error'] is not None:
+            continue
+        if output_dir is None:
+            if result['changed']:
+                with atomic_output(Path(result['path'])) as f:
+                    f.write(result['minified'])
+                written += 1
+        else:
+            target = output_dir / result['file']
+            target.parent.mkdir(parents=True, exist_ok=True)
+            write_artifact(target, result['minified'])
+            written += 1
+    return written
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.minify."""
+    for item in args.inputs:
+        if not Path(item).exists():
+            print(f"Error: Path '{item}' not found")
+            sys.exit(1)
+    
+    components = None
+    if args.refs:
+        components = args.components or DEFAULT_COMPONENTS
+        components = Path(components)
+        _, _, error = ComponentIndex(components.parent).load(components.name)
+        if error:
+            print(f"Error: {error}")
+            sys.exit(1)
+    
+    with profiling.phase('discover'):
+        entries = collect_inputs(args.inputs, args.exclude)
+    if not entries:
+        print("No prompt files found")
+        sys.exit(0)
+    
+    counter = CachedTokenCounter(args.model)
+    if (args.write or args.output) and not counter.exact and not args.allow_estimates:
+        print(f"Error: Not writing files: {counter.describe()}. "
+              f"Install tiktoken with its encoding, or pass --allow-estimates")
+        sys.exit(1)
+    
+    jobs = max(1, args.jobs)
+    start = time.perf_counter()
+    with profiling.phase('minify'):
+        results = run_minifier(entries, args.model, components, jobs)
+    seconds = time.perf_counter() - start
+    
+    written = None
+    if args.write or args.output:
+        with profiling.phase('write'):
+            written = write_minified(results, args.output)
+    
+    report = build_report(results, seconds, jobs, counter.describe())
+    if args.format == 'json':
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+        if written is not None:
+            print(f"Minified files written to {args.output or 'their sources'}: {written}")
+    
+    sys.exit(1 if report['failed'] else 0)
@@ -0,0 +1,197 @@
+"""
+Profiling
+
+Phase timings and counters for the utilities, switched on by --profile.
+
+Code marks its phases and counts events with module-level calls:
+
+    with profiling.phase('read'):
+        content = f.read()
+    profiling.count('bytes_read', len(content))
+
+Until a profile is started, phase() returns a shared do-nothing context
+manager and count() returns at once, so instrumented code pays one global
+lookup per call. Once started, phases accumulate seconds and calls by name
+(a phase's time includes any phases nested in it), counters are summed,
+and the profile is written when the process exits:
+
+    --profile FILE        JSON summary of phases and counters ('-' for stderr)
+    --profile-pstats FILE cProfile statistics, readable with pstats
+    --profile-trace FILE  Chrome trace-event JSON (chrome://tracing, Perfetto)
+
+Only the main process is profiled; work done in --jobs worker processes is
+included in the phase that waits for it.
+"""
+
+import atexit
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+PROFILE_FORMAT = 'profile'
+PROFILE_VERSION = 1
+
+
+class Profile:
+    """Phase timings, counters and optional trace events for one run."""
+    
+    def __init__(self, tool: str, trace: bool = False, pstats: bool = False):
+        self.tool = tool
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.events = [] if trace else None
+        self.started = time.perf_counter()
+        self.profiler = cProfile.Profile() if pstats else None
+        if self.profiler is not None:
+            self.profiler.enable()
+    
+    def add_phase(self, name: str, start: float, end: float):
+        """Record one completed phase."""
+        entry = self.phases.get(name)
+        if entry is None:
+            entry = self.phases[name] = {'seconds': 0.0, 'calls': 0}
+        entry['seconds'] += end - start
+        entry['calls'] += 1
+        if self.events is not None:
+            self.events.append({
+                'name': name, 'ph': 'X', 'pid': os.getpid(), 'tid': threading.get_ident(),
+                'ts': round((start - self.started) * 1e6, 3),
+                'dur': round((end - start) * 1e6, 3),
+            })
+    
+    def stop(self):
+        """Stop the cProfile profiler, if one is running."""
+        if self.profiler is not None:
+            self.profiler.disable()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the JSON summary."""
+        return {
+            'format': PROFILE_FORMAT,
+            'version': PROFILE_VERSION,
+            'tool': self.tool,
+            'argv': sys.argv[1:],
+            'wall_seconds': round(time.perf_counter() - self.started, 6),
+            'phases': {name: {'seconds': round(entry['seconds'], 6), 'calls': entry['calls']}
+                       for name, entry in sorted(self.phases.items(),
+                                                 key=lambda item: -item[1]['seconds'])},
+            'counters': dict(sorted(self.counters.items())),
+        }
+    
+    def trace(self) -> Dict[str, Any]:
+        """Return the Chrome trace-event document, with counters as a final sample."""
+        events = list(self.events or [])
+        if self.counters:
+            events.append({
+                'name': 'counters', 'ph': 'C', 'pid': os.getpid(), 'tid': threading.get_ident(),
+                'ts': round((time.perf_counter() - self.started) * 1e6, 3),
+                'args': self.counters,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': {'tool': self.tool}}
+
+
+class _Phase:
+    """Context manager timing one phase of the active profile."""
+    
+    __slots__ = ('profile', 'name', 'start')
+    
+    def __init__(self, profile: Profile, name: str):
+        self.profile = profile
+        self.name = name
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.profile.add_phase(self.name, self.start, time.perf_counter())
+        return False
+
+
+class _NullPhase:
+    """Context manager that does nothing; used while profiling is off."""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+# The profile being recorded, or None while profiling is off
+_active: Optional[Profile] = None
+
+
+def phase(name: str):
+    """Return a context manager that times the enclosed code as phase name."""
+    if _active is None:
+        return _NULL_PHASE
+    return _Phase(_active, name)
+
+
+def count(name: str, amount: int = 1):
+    """Add amount to counter name."""
+    if _active is not None:
+        _active.counters[name] = _active.counters.get(name, 0) + amount
+
+
+def add_arguments(parser):
+    """Add the --profile options to an argparse parser."""
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', metavar='FILE',
+                       help="Write phase timings and counters as JSON ('-' for stderr)")
+    group.add_argument('--profile-pstats', metavar='FILE',
+                       help='Also write cProfile statistics (read with python -m pstats)')
+    group.add_argument('--profile-trace', metavar='FILE',
+                       help='Also write a Chrome trace-event file (chrome://tracing, Perfetto)')
+
+
+def start(tool: str, output: Optional[str] = None, pstats_path: Optional[str] = None,
+          trace_path: Optional[str] = None) -> Profile:
+    """Start profiling and write the requested files when the process exits."""
+    global _active
+    _active = Profile(tool, trace=trace_path is not None, pstats=pstats_path is not None)
+    atexit.register(finish, _active, output, pstats_path, trace_path)
+    return _active
+
+
+def start_from_args(args, tool: str) -> Optional[Profile]:
+    """Start profiling if any --profile option was given; returns the profile or None."""
+    output = getattr(args, 'profile', None)
+    pstats_path = getattr(args, 'profile_pstats', None)
+    trace_path = getattr(args, 'profile_trace', None)
+    if output is None and pstats_path is None and trace_path is None:
+        return None
+    return start(tool, output, pstats_path, trace_path)
+
+
+def finish(profile: Profile, output: Optional[str], pstats_path: Optional[str],
+           trace_path: Optional[str]):
+    """Stop profile and write its outputs."""
+    global _active
+    profile.stop()
+    if _active is profile:
+        _active = None
+    
+    try:
+        if pstats_path:
+            profile.profiler.dump_stats(pstats_path)
+        if trace_path:
+            with open(trace_path, 'w', encoding='utf-8') as f:
+                json.dump(profile.trace(), f)
+        if output == '-':
+            json.dump(profile.to_dict(), sys.stderr, indent=2)
+            sys.stderr.write('\n')
+        elif output:
+            with open(output, 'w', encoding='utf-8') as f:
+                json.dump(profile.to_dict(), f, indent=2)
+    except OSError as e:
+        print(f"Error: Could not write profile: {e}", file=sys.stderr)
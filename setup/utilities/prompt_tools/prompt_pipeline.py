@@ -0,0 +1,247 @@
+"""
+Prompt Pipeline
+
+Run template interpolation, validation and token counting over a set of
+prompt files in one process instead of three. Each file is read and
+scanned for references once; the scan is shared by the interpolator and
+the validator, expanded text stays in memory for the token counter, and
+templates found while expanding are not looked up again by the validator.
+Files are spread over a worker pool; each worker writes its expanded files
+itself, so only the per-file results, not the expanded text, come back to
+be combined into one report.
+
+Validation runs on each source file, so issue line numbers point into the
+file as written. Unlike interpolating to files and validating those, the
+expanded text is not validated. Tokens are counted for both the source
+and the expanded text.
+
+Usage:
+    python prompt-pipeline.py <prompt files or directories> --template-dir <dir>
+    python prompt-pipeline.py commands/ --vars-file vars.yaml --output expanded/
+"""
+
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import profiling
+from . import prompt_validator
+from . import scanning
+from . import template_interpolator
+from .files import write_artifact
+from .references import collect_inputs
+from .tokens import CachedTokenCounter
+
+# Pipeline stages, in order, as reported in the timing breakdown
+STAGES = ('read', 'scan', 'interpolate', 'validate', 'count', 'write')
+
+
+SEVERITY_ERROR = prompt_validator.ValidationIssue.SEVERITY_ERROR
+SEVERITY_WARNING = prompt_validator.ValidationIssue.SEVERITY_WARNING
+
+
+class PromptPipeline:
+    """Interpolate, validate and count one document at a time, in memory."""
+    
+    def __init__(self, template_dir: Optional[Path] = None, variables: Dict[str, Any] = None,
+                 strict: bool = False, model: str = "gpt-4", output_dir: Optional[Path] = None):
+        self.variables = variables or {}
+        self.output_dir = output_dir
+        self.interpolator = template_interpolator.TemplateInterpolator(
+            template_dir=template_dir, warn_missing=False)
+        self.validator = prompt_validator.PromptValidator(template_dir=template_dir, strict=strict)
+        self.counter = CachedTokenCounter(model)
+    
+    def process(self, path: Path, name: str) -> Dict[str, Any]:
+        """Run every stage on one file and return its JSON-serializable result."""
+        timings = dict.fromkeys(STAGES, 0.0)
+        result = {'file': name, 'path': str(path), 'error': None, 'timings': timings}
+        
+        start = time.perf_counter()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            result['error'] = f"Cannot read file: {e}"
+            return result
+        now = time.perf_counter()
+        timings['read'] = now - start
+        
+        start = now
+        tokens = list(scanning.scan_references(content))
+        now = time.perf_counter()
+        timings['scan'] = now - start
+        
+        start = now
+        try:
+            expansion = self.interpolator.interpolate(content, self.variables, tokens)
+        except RecursionError as e:
+            result['error'] = str(e)
+            return result
+        expanded = expansion['content']
+        now = time.perf_counter()
+        timings['interpolate'] = now - start
+        
+        # Templates the interpolator loaded are known to exist
+        start = now
+        self.validator.checked_templates.update(self.interpolator.template_cache)
+        issues = self.validator.validate_content(content, path, tokens)
+        now = time.perf_counter()
+        timings['validate'] = now - start
+        
+        start = now
+        source_tokens = self.counter.count(content)
+        expanded_tokens = source_tokens if expanded == content else self.counter.count(expanded)
+        now = time.perf_counter()
+        timings['count'] = now - start
+        
+        if self.output_dir is not None:
+            start = now
+            target = self.output_dir / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            write_artifact(target, expanded)
+            result['written'] = True
+            timings['write'] = time.perf_counter() - start
+        
+        result.update({
+            'templates_used': sorted(expansion['used_templates']),
+            'missing_templates': expansion['missing_templates'],
+            'issues': [issue.to_dict() for issue in issues],
+            'errors': sum(1 for issue in issues if issue.severity == SEVERITY_ERROR),
+            'tokens': {'source': source_tokens, 'expanded': expanded_tokens},
+        })
+        return result
+
+
+# Per-process pipeline, set up once by _init_worker
+_pipeline = None
+
+
+def _init_worker(template_dir, variables, strict, model, output_dir):
+    """Create this process's pipeline, so templates are cached across its files."""
+    global _pipeline
+    _pipeline = PromptPipeline(template_dir, variables, strict, model, output_dir)
+
+
+def _process_task(task: Tuple[Path, str]) -> Dict[str, Any]:
+    """Run the pipeline on one (path, name) entry."""
+    return _pipeline.process(*task)
+
+
+def run_pipeline(entries: List[Tuple[Path, str]], template_dir: Optional[Path] = None,
+                 variables: Dict[str, Any] = None, strict: bool = False,
+                 model: str = "gpt-4", jobs: int = 1,
+                 output_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """Process every entry, in a process pool when jobs > 1; results keep entry order.
+    
+    With output_dir, each expanded document is written under it by its name.
+    """
+    settings = (template_dir, variables or {}, strict, model, output_dir)
+    if jobs > 1 and len(entries) > 1:
+        chunksize = max(1, len(entries) // (jobs * 8))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=settings) as executor:
+            return list(executor.map(_process_task, entries, chunksize=chunksize))
+    _init_worker(*settings)
+    return [_process_task(entry) for entry in entries]
+
+
+def build_report(results: List[Dict[str, Any]], seconds: float, jobs: int,
+                 token_note: Optional[str]) -> Dict[str, Any]:
+    """Combine per-file results into one report."""
+    processed = [r for r in results if r['error'] is None]
+    timings = {stage: round(sum(r['timings'][stage] for r in results), 4) for stage in STAGES}
+    return {
+        'files': len(results),
+        'failed': len(results) - len(processed),
+        'seconds': round(seconds, 3),
+        'jobs': jobs,
+        'stage_seconds': timings,
+        'errors': sum(r['errors'] for r in processed),
+        'warnings': sum(1 for r in processed for issue in r['issues']
+                        if issue['severity'] == SEVERITY_WARNING),
+        'tokens': {
+            'source': sum(r['tokens']['source'] for r in processed),
+            'expanded': sum(r['tokens']['expanded'] for r in processed),
+            'note': token_note,
+        },
+        'results': [dict(r, timings={stage: round(t, 6) for stage, t in r['timings'].items()})
+                    for r in results],
+    }
+
+
+def print_report(report: Dict[str, Any], errors_only: bool = False):
+    """Print the combined report as text."""
+    print("=" * 60)
+    print("PROMPT PIPELINE REPORT")
+    print("=" * 60)
+    print(f"Files: {report['files']} ({report['failed']} failed) in {report['seconds']:.3f}s "
+          f"with {report['jobs']} job(s)")
+    
+    for result in report['results']:
+        if result['error']:
+            print(f"\n{result['file']}: FAILED - {result['error']}")
+            continue
+        issues = result['issues']
+        if errors_only:
+            issues = [issue for issue in issues if issue['severity'] == SEVERITY_ERROR]
+            if not issues and not result['missing_templates']:
+                continue
+        tokens = result['tokens']
+        print(f"\n{result['file']}: {tokens['source']:,} -> {tokens['expanded']:,} tokens, "
+              f"{len(result['templates_used'])} template(s), {result['errors']} error(s)")
+        if result['missing_templates']:
+            print(f"  Not expanded (template not found): {', '.join(result['missing_templates'])}")
+        for issue in issues:
+            print(f"  {prompt_validator.ValidationIssue(**issue)}")
+    
+    print("\n" + "=" * 60)
+    tokens = report['tokens']
+    print(f"Tokens: {tokens['source']:,} source, {tokens['expanded']:,} expanded")
+    if tokens['note']:
+        print(f"Note: {tokens['note']}")
+    print("Stage time (summed over workers): " +
+          ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in report['stage_seconds'].items()))
+    print(f"Summary: {report['files']} files, {report['errors']} error(s), "
+          f"{report['warnings']} warning(s)")
+    print("=" * 60)
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.pipeline."""
+    for item in args.inputs:
+        if not Path(item).exists():
+            print(f"Error: Path '{item}' not found")
+            sys.exit(1)
+    
+    variables = {}
+    if args.vars_file:
+        variables.update(template_interpolator.load_variables_file(args.vars_file))
+    variables.update(template_interpolator.parse_variables(args.vars))
+    
+    with profiling.phase('discover'):
+        entries = collect_inputs(args.inputs, args.exclude)
+    if not entries:
+        print("No prompt files found")
+        sys.exit(0)
+    
+    jobs = max(1, args.jobs)
+    start = time.perf_counter()
+    with profiling.phase('process'):
+        results = run_pipeline(entries, args.template_dir, variables, args.strict, args.model,
+                               jobs, args.output)
+    seconds = time.perf_counter() - start
+    
+    report = build_report(results, seconds, jobs, CachedTokenCounter(args.model).describe())
+    if args.format == 'json':
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.errors_only)
+        if args.output:
+            written = sum(1 for result in results if result.get('written'))
+            print(f"Expanded files written to {args.output}: {written}")
+    
+    sys.exit(1 if report['errors'] or report['failed'] else 0)
@@ -0,0 +1,1104 @@
+"""
+Prompt Validator
+
+Validate optimized prompts for:
+- Missing template references
+- Template existence verification
+- YAML syntax validation
+- Structure consistency
+- Reference integrity
+
+Usage:
+    python prompt-validator.py <prompt_file>
+    python prompt-validator.py <directory> --recursive
+"""
+
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Set, Tuple, Any, TextIO
+import json
+
+import yaml
+
+from . import profiling
+from . import rendering
+from . import scanning
+from . import yaml_io
+from . import yaml_nodes
+from .discovery import ListingCache, walk_files
+
+# File types validated when walking a directory
+VALIDATED_EXTENSIONS = ('.yaml', '.yml')
+
+
+class ValidationIssue:
+    """Represents a validation issue found in a prompt."""
+    
+    SEVERITY_ERROR = 'ERROR'
+    SEVERITY_WARNING = 'WARNING'
+    SEVERITY_INFO = 'INFO'
+    
+    def __init__(self, severity: str, category: str, message: str, 
+                 line: int = None, column: int = None, context: str = None):
+        self.severity = severity
+        self.category = category
+        self.message = message
+        self.line = line
+        self.column = column
+        self.context = context
+    
+    def __str__(self):
+        location = f" (line {self.line}" if self.line else ""
+        location += f", col {self.column})" if self.column else ")" if self.line else ""
+        
+        result = f"[{self.severity}] {self.category}: {self.message}{location}"
+        if self.context:
+            result += f"\n    Context: {self.context}"
+        return result
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the issue as a JSON-serializable dictionary."""
+        return {
+            'severity': self.severity,
+            'category': self.category,
+            'message': self.message,
+            'line': self.line,
+            'column': self.column,
+            'context': self.context
+        }
+
+
+class TemplateManifest:
+    """Index of the templates and parameters declared in template-manifest.yaml.
+    
+    The manifest is parsed once. ``templates`` maps each template name to its
+    resolved location and declared parameters, and ``parameter_index`` is the
+    inverted index of parameter name to the templates that declare it.
+    """
+    
+    def __init__(self, manifest_path: Path):
+        self.path = manifest_path
+        self.base_dir = manifest_path.parent
+        self.templates = {}
+        self.parameter_index = {}
+        self.load()
+    
+    def load(self):
+        """Parse the manifest and build the template and parameter indexes."""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = yaml_io.safe_load(f) or {}
+        
+        templates = data.get('templates') if isinstance(data, dict) else None
+        if not isinstance(templates, dict):
+            raise ValueError(f"No 'templates' mapping in manifest {self.path}")
+        
+        for name, entry in templates.items():
+            entry = entry or {}
+            parameters = set()
+            for param in entry.get('parameters') or []:
+                # Parameters are declared as single-key mappings or plain names
+                if isinstance(param, dict):
+                    parameters.update(param.keys())
+                else:
+                    parameters.add(str(param))
+            
+            location = entry.get('location')
+            self.templates[name] = {
+                'location': self.base_dir / location if location else None,
+                'parameters': parameters
+            }
+            
+            for param in parameters:
+                self.parameter_index.setdefault(param, set()).add(name)
+
+
+def item_template_spans(content: str) -> Tuple[List[Tuple[int, int]], Dict[str, int]]:
+    """Find the list sections of a structured template.
+    
+    Returns the (start, end) offsets of every item template (any *_template
+    key of a structure: section), whose placeholders are fields of each item
+    rather than template parameters, and the variable each list renders its
+    items from, mapped to the offset of its section, chosen as the renderer
+    chooses it. Content that is not a structured template gives neither.
+    """
+    spans = []
+    variables = {}
+    try:
+        root = yaml_io.compose(content)
+        data = yaml_io.construct(root)
+    except yaml.YAMLError:
+        return spans, variables
+    if not isinstance(root, yaml.MappingNode) or not isinstance(data.get('structure'), dict):
+        return spans, variables
+    
+    parameters = rendering.declared_parameters(data)
+    for key_node, value_node in root.value:
+        if key_node.value != 'structure' or not isinstance(value_node, yaml.MappingNode):
+            continue
+        for name_node, section_node in value_node.value:
+            section = data['structure'].get(name_node.value)
+            if not isinstance(section, dict) or not isinstance(section_node, yaml.MappingNode):
+                continue
+            key = rendering.item_template_key(section)
+            if key is None:
+                continue
+            for field_node, template_node in section_node.value:
+                if field_node.value == key:
+                    spans.append((template_node.start_mark.index, template_node.end_mark.index))
+            variable = rendering.items_variable(name_node.value, section, parameters)
+            variables.setdefault(variable, name_node.start_mark.index)
+    return spans, variables
+
+
+class PromptValidator:
+    """Validate prompt files for various issues."""
+    
+    # Template and variable reference patterns (shared with the interpolator)
+    TEMPLATE_PATTERNS = scanning.TEMPLATE_PATTERNS
+    VAR_PATTERNS = scanning.VAR_PATTERNS
+    
+    # Common prompt structure keys
+    EXPECTED_KEYS = {
+        'metadata', 'version', 'description', 'author',
+        'content', 'templates', 'variables', 'sections'
+    }
+    
+    # Reference styles checked against the manifest: {{name}} and {{name.field}}
+    CONTRACT_STYLES = {'double_braces', 'dot_notation'}
+    
+    def __init__(self, template_dir: Path = None, strict: bool = False):
+        """Initialize validator with options."""
+        self.template_dir = template_dir or Path.cwd()
+        self.strict = strict
+        self.issues = []
+        self.checked_templates = set()
+        # Template names referenced by the most recently validated file
+        self.template_references = set()
+    
+    def add_issue(self, severity: str, category: str, message: str, **kwargs):
+        """Add a validation issue."""
+        self.issues.append(ValidationIssue(severity, category, message, **kwargs))
+    
+    def validate_yaml_syntax(self, file_path: Path) -> bool:
+        """Validate YAML syntax."""
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+                yaml_io.safe_load(content)
+            return True
+        except yaml.YAMLError as e:
+            # Extract line/column from error if available
+            line = getattr(e, 'problem_mark', None)
+            if line:
+                self.add_issue(
+                    ValidationIssue.SEVERITY_ERROR,
+                    'YAML Syntax',
+                    f"Invalid YAML syntax: {e.problem}",
+                    line=line.line + 1,
+                    column=line.column + 1
+                )
+            else:
+                self.add_issue(
+                    ValidationIssue.SEVERITY_ERROR,
+                    'YAML Syntax',
+                    f"Invalid YAML syntax: {str(e)}"
+                )
+            return False
+        except Exception as e:
+            self.add_issue(
+                ValidationIssue.SEVERITY_ERROR,
+                'File Read',
+                f"Cannot read file: {str(e)}"
+            )
+            return False
+    
+    def find_template_references(self, content: str) -> Set[str]:
+        """Find all template references in content."""
+        return scanning.find_template_references(content)
+    
+    def find_variable_references(self, content: str) -> Set[str]:
+        """Find all variable references in content."""
+        return scanning.find_variable_references(content)
+    
+    def check_template_exists(self, template_name: str) -> bool:
+        """Check if a template file exists."""
+        if template_name in self.checked_templates:
+            profiling.count('template_cache_hits')
+            return True
+        profiling.count('template_cache_misses')
+        
+        search_paths = [
+            self.template_dir / f"{template_name}",
+            self.template_dir / f"{template_name}.txt",
+            self.template_dir / f"{template_name}.tmpl",
+            self.template_dir / f"{template_name}.template",
+            self.template_dir / f"{template_name}.yaml",
+            self.template_dir / f"{template_name}.yml",
+        ]
+        
+        for path in search_paths:
+            profiling.count('stat_calls')
+            if path.exists():
+                self.checked_templates.add(template_name)
+                return True
+        
+        return False
+    
+    def compose_yaml(self, content: str):
+        """Compose YAML content into a node tree, reporting syntax errors.
+        
+        Returns (True, node) on success and (False, None) on invalid syntax.
+        """
+        try:
+            return True, yaml_nodes.compose_document(content)
+        except yaml.YAMLError as e:
+            mark = getattr(e, 'problem_mark', None)
+            if mark:
+                self.add_issue(
+                    ValidationIssue.SEVERITY_ERROR,
+                    'YAML Syntax',
+                    f"Invalid YAML syntax: {e.problem}",
+                    **yaml_nodes.mark_location(mark)
+                )
+            else:
+                self.add_issue(
+                    ValidationIssue.SEVERITY_ERROR,
+                    'YAML Syntax',
+                    f"Invalid YAML syntax: {str(e)}"
+                )
+            return False, None
+    
+    def validate_structure(self, data: Dict[str, Any], file_path: Path, node=None):
+        """Validate the structure of parsed YAML data.
+        
+        When the composed node tree is given, issues are located at the
+        offending key or value node.
+        """
+        def location(target):
+            return yaml_nodes.mark_location(target.start_mark) if target is not None else {}
+        
+        items = yaml_nodes.mapping_items(node) if node is not None else {}
+        
+        # Check for recommended top-level keys
+        missing_keys = []
+        for key in ['metadata', 'content']:
+            if key not in data and self.strict:
+                missing_keys.append(key)
+        
+        if missing_keys:
+            self.add_issue(
+                ValidationIssue.SEVERITY_WARNING,
+                'Structure',
+                f"Missing recommended top-level keys: {', '.join(missing_keys)}",
+                **location(node)
+            )
+        
+        # Validate metadata if present
+        if 'metadata' in data:
+            metadata = data['metadata']
+            metadata_node = items.get('metadata', (None, None))[1]
+            if not isinstance(metadata, dict):
+                self.add_issue(
+                    ValidationIssue.SEVERITY_ERROR,
+                    'Structure',
+                    "Metadata should be a dictionary/object",
+                    **location(metadata_node)
+                )
+            else:
+                # Check for version
+                if 'version' not in metadata and self.strict:
+                    self.add_issue(
+                        ValidationIssue.SEVERITY_INFO,
+                        'Structure',
+                        "No version specified in metadata",
+                        **location(metadata_node)
+                    )
+        
+        # Check for unused keys
+        all_keys = set(data.keys())
+        known_keys = self.EXPECTED_KEYS | {'_metadata', '_comments'}
+        unknown_keys = all_keys - known_keys
+        
+        if unknown_keys and self.strict:
+            first_key = min(
+                (items[k][0] for k in unknown_keys if k in items),
+                key=lambda key_node: key_node.start_mark.index,
+                default=None
+            )
+            self.add_issue(
+                ValidationIssue.SEVERITY_INFO,
+                'Structure',
+                f"Unknown top-level keys: {', '.join(unknown_keys)}",
+                **location(first_key)
+            )
+    
+    def validate_references(self, content: str, file_path: Path, node=None, tokens=None):
+        """Validate template and variable references.
+        
+        Locations come from the scanned token offsets. When the composed YAML
+        node tree is given, the YAML path of the scalar holding the reference
+        is reported as well. tokens, if given, is the list of reference
+        tokens already scanned from content.
+        """
+        # One scan finds both kinds of reference, with offsets
+        template_refs = {}
+        var_refs = set()
+        
+        if tokens is None:
+            tokens = scanning.scan_references(content)
+        with profiling.phase('scan'):
+            for token in tokens:
+                if token.kind == scanning.KIND_TEMPLATE:
+                    template_refs.setdefault(token.name, token.start)
+                else:
+                    var_refs.add(token.name)
+        
+        self.template_references = set(template_refs)
+        
+        missing = [(name, offset) for name, offset in template_refs.items()
+                   if not self.check_template_exists(name)]
+        if missing:
+            lines = yaml_nodes.LineIndex(content)
+            spans = yaml_nodes.ScalarSpanIndex(node) if node is not None else None
+            
+            for template_name, offset in missing:
+                context = f"Searched in: {self.template_dir}"
+                yaml_path = spans.path_at(offset) if spans else None
+                if yaml_path:
+                    context = f"At {yaml_path}; searched in: {self.template_dir}"
+                
+                self.add_issue(
+                    ValidationIssue.SEVERITY_ERROR,
+                    'Template Reference',
+                    f"Template '{template_name}' not found",
+                    context=context,
+                    **lines.location(offset)
+                )
+        
+        if var_refs:
+            self.add_issue(
+                ValidationIssue.SEVERITY_INFO,
+                'Variables',
+                f"Found {len(var_refs)} variable reference(s): {', '.join(sorted(var_refs))}"
+            )
+    
+    def validate_file(self, file_path: Path) -> List[ValidationIssue]:
+        """Validate a single prompt file."""
+        self.issues = []
+        self.template_references = set()
+        
+        # Check file exists
+        profiling.count('stat_calls')
+        if not file_path.exists():
+            self.add_issue(
+                ValidationIssue.SEVERITY_ERROR,
+                'File',
+                f"File not found: {file_path}"
+            )
+            return self.issues
+        
+        # Read file content
+        try:
+            with profiling.phase('read'), open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            self.add_issue(
+                ValidationIssue.SEVERITY_ERROR,
+                'File Read',
+                f"Cannot read file: {str(e)}"
+            )
+            return self.issues
+        profiling.count('files_read')
+        profiling.count('bytes_read', len(content))
+        
+        return self.validate_content(content, file_path)
+    
+    def validate_content(self, content: str, file_path: Path, tokens=None) -> List[ValidationIssue]:
+        """Validate a prompt file's content that has already been read.
+        
+        tokens, if given, is the list of reference tokens already scanned
+        from content, so callers that scanned it for another stage do not
+        scan it twice.
+        """
+        self.issues = []
+        self.template_references = set()
+        
+        # Validate based on file type. YAML is composed once; the node tree
+        # is reused for structure checks and for issue locations.
+        node = None
+        if file_path.suffix in ['.yaml', '.yml']:
+            valid, node = self.compose_yaml(content)
+            if valid:
+                try:
+                    data = yaml_nodes.construct_document(node)
+                    
+                    if isinstance(data, dict):
+                        self.validate_structure(data, file_path, node)
+                
+                except Exception as e:
+                    mark = getattr(e, 'problem_mark', None)
+                    self.add_issue(
+                        ValidationIssue.SEVERITY_ERROR,
+                        'Parse',
+                        f"Error parsing file: {str(e)}",
+                        **(yaml_nodes.mark_location(mark) if mark else {})
+                    )
+        
+        # Always validate references
+        self.validate_references(content, file_path, node, tokens)
+        
+        # Check for common issues
+        with profiling.phase('lint'):
+            self.check_common_issues(content, file_path)
+        
+        return self.issues
+    
+    def check_common_issues(self, content: str, file_path: Path):
+        """Check for common prompt issues."""
+        lines = content.split('\n')
+        
+        # Check for very long lines
+        for i, line in enumerate(lines, 1):
+            if len(line) > 120:
+                self.add_issue(
+                    ValidationIssue.SEVERITY_INFO,
+                    'Formatting',
+                    f"Line exceeds 120 characters ({len(line)} chars)",
+                    line=i
+                )
+        
+        # Check for tabs vs spaces
+        has_tabs = '\t' in content
+        has_spaces = '    ' in content  # 4 spaces
+        
+        if has_tabs and has_spaces:
+            self.add_issue(
+                ValidationIssue.SEVERITY_WARNING,
+                'Formatting',
+                "Mixed tabs and spaces for indentation"
+            )
+        
+        # Check for trailing whitespace
+        for i, line in enumerate(lines, 1):
+            if line.endswith(' ') or line.endswith('\t'):
+                self.add_issue(
+                    ValidationIssue.SEVERITY_INFO,
+                    'Formatting',
+                    "Trailing whitespace",
+                    line=i
+                )
+        
+        # Check for TODO/FIXME comments
+        todo_pattern = re.compile(r'(TODO|FIXME|XXX|HACK|BUG):', re.IGNORECASE)
+        for i, line in enumerate(lines, 1):
+            if todo_pattern.search(line):
+                self.add_issue(
+                    ValidationIssue.SEVERITY_INFO,
+                    'Comments',
+                    f"Found TODO/FIXME comment",
+                    line=i,
+                    context=line.strip()
+                )
+    
+    def check_manifest_contracts(self, manifest: TemplateManifest) -> Dict[Path, List[ValidationIssue]]:
+        """Check every manifest template's {{var}} usages against its declared parameters.
+        
+        Each template file is read and scanned once to build an inverted index
+        of variable name to the templates (and first offset) that use it. The
+        index is then compared with the manifest's parameter index in a single
+        pass, so no file is rescanned per parameter.
+        
+        Returns issues keyed by resolved template path.
+        """
+        results = {}
+        usage_index = {}
+        contents = {}
+        
+        for name, entry in manifest.templates.items():
+            location = entry['location']
+            key = location.resolve() if location else manifest.path.resolve()
+            issues = results.setdefault(key, [])
+            
+            if location is None:
+                issues.append(ValidationIssue(
+                    ValidationIssue.SEVERITY_ERROR,
+                    'Manifest',
+                    f"Template '{name}' has no location in manifest"
+                ))
+                continue
+            
+            try:
+                with open(location, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except OSError as e:
+                issues.append(ValidationIssue(
+                    ValidationIssue.SEVERITY_ERROR,
+                    'Manifest',
+                    f"Template '{name}' file not readable: {e.strerror}",
+                    context=f"Declared location: {location}"
+                ))
+                continue
+            
+            contents[name] = content
+            # Item template placeholders are per-item fields; a declared
+            # items variable is used by the list it fills
+            spans, items_variables = item_template_spans(content)
+            for token in scanning.scan_references(content):
+                if token.style not in self.CONTRACT_STYLES:
+                    continue
+                if any(start <= token.start < end for start, end in spans):
+                    continue
+                users = usage_index.setdefault(token.name.split('.', 1)[0], {})
+                users.setdefault(name, token.start)
+            for variable, offset in items_variables.items():
+                if name in manifest.parameter_index.get(variable, ()):
+                    usage_index.setdefault(variable, {}).setdefault(name, offset)
+        
+        # Undeclared usages: walk the usage index once
+        for var_name, users in sorted(usage_index.items()):
+            declared_by = manifest.parameter_index.get(var_name, set())
+            for name, offset in users.items():
+                if name in declared_by:
+                    continue
+                content = contents[name]
+                line = scanning.line_number(content, offset)
+                column = offset - (content.rfind('\n', 0, offset) + 1) + 1
+                results[manifest.templates[name]['location'].resolve()].append(ValidationIssue(
+                    ValidationIssue.SEVERITY_WARNING,
+                    'Parameter Contract',
+                    f"Variable '{var_name}' used by template '{name}' is not declared in the manifest",
+                    line=line,
+                    column=column
+                ))
+        
+        # Unused declarations: walk the manifest's parameter index once
+        for param, declared_by in sorted(manifest.parameter_index.items()):
+            used_by = usage_index.get(param, {})
+            for name in sorted(declared_by):
+                if name in contents and name not in used_by:
+                    results[manifest.templates[name]['location'].resolve()].append(ValidationIssue(
+                        ValidationIssue.SEVERITY_WARNING,
+                        'Parameter Contract',
+                        f"Parameter '{param}' declared for template '{name}' is never used",
+                        context=f"Declared in: {manifest.path}"
+                    ))
+        
+        return results
+
+
+def format_validation_report(file_path: Path, issues: List[ValidationIssue]) -> str:
+    """Format a validation report."""
+    report = []
+    report.append("=" * 60)
+    report.append(f"VALIDATION REPORT: {file_path}")
+    report.append("=" * 60)
+    
+    if not issues:
+        report.append("✓ No issues found!")
+    else:
+        # Count by severity
+        error_count = sum(1 for i in issues if i.severity == ValidationIssue.SEVERITY_ERROR)
+        warning_count = sum(1 for i in issues if i.severity == ValidationIssue.SEVERITY_WARNING)
+        info_count = sum(1 for i in issues if i.severity == ValidationIssue.SEVERITY_INFO)
+        
+        report.append(f"Found {len(issues)} issue(s):")
+        report.append(f"  - Errors: {error_count}")
+        report.append(f"  - Warnings: {warning_count}")
+        report.append(f"  - Info: {info_count}")
+        report.append("-" * 60)
+        
+        # Group issues by category
+        by_category = {}
+        for issue in issues:
+            if issue.category not in by_category:
+                by_category[issue.category] = []
+            by_category[issue.category].append(issue)
+        
+        for category, category_issues in sorted(by_category.items()):
+            report.append(f"\n{category}:")
+            for issue in category_issues:
+                report.append(f"  {issue}")
+    
+    report.append("=" * 60)
+    return '\n'.join(report)
+
+
+class JSONLReportWriter:
+    """Stream validation results as JSON Lines, one record per issue.
+    
+    Each file produces its issue records as soon as it has been validated,
+    followed by a ``file`` record, and the stream ends with a ``summary``
+    record. Nothing is buffered between files.
+    """
+    
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+    
+    def begin(self):
+        """Start the report (nothing to write for JSON Lines)."""
+    
+    def write_file(self, file_path: Path, issues: List[ValidationIssue]):
+        """Write the issues for a single validated file."""
+        for issue in issues:
+            record = {'type': 'issue', 'file': str(file_path)}
+            record.update(issue.to_dict())
+            self.stream.write(json.dumps(record) + '\n')
+        
+        errors = sum(1 for i in issues if i.severity == ValidationIssue.SEVERITY_ERROR)
+        self.stream.write(json.dumps({
+            'type': 'file',
+            'file': str(file_path),
+            'issues': len(issues),
+            'errors': errors
+        }) + '\n')
+        self.stream.flush()
+    
+    def end(self, files_validated: int, total_errors: int):
+        """Write the closing summary record."""
+        self.stream.write(json.dumps({
+            'type': 'summary',
+            'files_validated': files_validated,
+            'total_errors': total_errors
+        }) + '\n')
+        self.stream.flush()
+
+
+class SARIFReportWriter:
+    """Stream validation results as a SARIF 2.1.0 log.
+    
+    Results are written incrementally inside the ``results`` array. The tool
+    descriptor (with the rules actually seen) is written after the results,
+    which JSON object ordering permits, so only the small set of rule ids is
+    kept in memory.
+    """
+    
+    SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+    
+    LEVELS = {
+        ValidationIssue.SEVERITY_ERROR: 'error',
+        ValidationIssue.SEVERITY_WARNING: 'warning',
+        ValidationIssue.SEVERITY_INFO: 'note',
+    }
+    
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self.rules = {}
+        self.first_result = True
+    
+    @staticmethod
+    def rule_id(category: str) -> str:
+        """Derive a stable SARIF rule id from an issue category."""
+        return re.sub(r'[^a-z0-9]+', '-', category.lower()).strip('-')
+    
+    def begin(self):
+        """Write the SARIF envelope up to the start of the results array."""
+        self.stream.write(
+            '{"version": "2.1.0", '
+            f'"$schema": {json.dumps(self.SARIF_SCHEMA)}, '
+            '"runs": [{"results": ['
+        )
+    
+    def write_file(self, file_path: Path, issues: List[ValidationIssue]):
+        """Write SARIF results for a single validated file."""
+        uri = file_path.as_posix()
+        
+        for issue in issues:
+            rule_id = self.rule_id(issue.category)
+            self.rules.setdefault(rule_id, issue.category)
+            
+            location = {'artifactLocation': {'uri': uri}}
+            if issue.line:
+                region = {'startLine': issue.line}
+                if issue.column:
+                    region['startColumn'] = issue.column
+                location['region'] = region
+            
+            message = issue.message
+            if issue.context:
+                message += f" ({issue.context})"
+            
+            result = {
+                'ruleId': rule_id,
+                'level': self.LEVELS.get(issue.severity, 'none'),
+                'message': {'text': message},
+                'locations': [{'physicalLocation': location}]
+            }
+            
+            if not self.first_result:
+                self.stream.write(', ')
+            self.stream.write(json.dumps(result))
+            self.first_result = False
+        
+        self.stream.flush()
+    
+    def end(self, files_validated: int, total_errors: int):
+        """Close the results array and write the tool descriptor."""
+        driver = {
+            'name': 'prompt-validator',
+            'informationUri': 'https://github.com/GGPrompts/ClaudeGlobalCommands',
+            'rules': [
+                {'id': rule_id, 'name': category, 'shortDescription': {'text': category}}
+                for rule_id, category in sorted(self.rules.items())
+            ]
+        }
+        self.stream.write(f'], "tool": {{"driver": {json.dumps(driver)}}}}}]}}\n')
+        self.stream.flush()
+
+
+def iter_validation_results(validator: PromptValidator, files: List[Path],
+                            extra_issues: Dict[Path, List[ValidationIssue]] = None,
+                            errors_only: bool = False):
+    """Yield (file_path, issues) for each file as soon as it is validated.
+    
+    extra_issues (keyed by resolved path, e.g. manifest contract issues) are
+    merged into the matching file's results; entries for files that were not
+    validated are yielded on their own afterwards.
+    """
+    extra_issues = dict(extra_issues or {})
+    
+    for file_path in files:
+        issues = validator.validate_file(file_path)
+        issues.extend(extra_issues.pop(file_path.resolve(), []))
+        
+        if errors_only:
+            issues = [i for i in issues if i.severity == ValidationIssue.SEVERITY_ERROR]
+        
+        yield file_path, issues
+    
+    for file_path, issues in sorted(extra_issues.items()):
+        if errors_only:
+            issues = [i for i in issues if i.severity == ValidationIssue.SEVERITY_ERROR]
+        
+        yield file_path, issues
+
+
+def stream_validation(validator: PromptValidator, files: List[Path], writer,
+                      errors_only: bool = False,
+                      extra_issues: Dict[Path, List[ValidationIssue]] = None) -> int:
+    """Validate files one at a time, handing each result straight to writer.
+    
+    Returns the total number of errors found.
+    """
+    total_errors = 0
+    files_validated = 0
+    writer.begin()
+    
+    for file_path, issues in iter_validation_results(validator, files, extra_issues, errors_only):
+        writer.write_file(file_path, issues)
+        files_validated += 1
+        total_errors += sum(1 for i in issues if i.severity == ValidationIssue.SEVERITY_ERROR)
+    
+    writer.end(files_validated, total_errors)
+    return total_errors
+
+
+class PromptWatcher:
+    """Keep a tree validated, re-validating only what changes.
+    
+    The tree is validated once up front. Afterwards the watcher polls file
+    stats and re-validates only files that were added or modified, plus every
+    file that references a template whose file changed. That second set comes
+    from a reverse dependency index of template name to referencing files,
+    kept up to date as files are re-validated. Each re-validated file's full
+    issue set is handed to the writer as soon as it is ready, replacing the
+    previously reported diagnostics for that file.
+    """
+    
+    TEMPLATE_SUFFIXES = ('', '.txt', '.tmpl', '.template', '.yaml', '.yml')
+    
+    def __init__(self, validator: PromptValidator, root: Path, writer,
+                 recursive: bool = False, errors_only: bool = False,
+                 interval: float = 0.1, exclude: List[str] = ()):
+        self.validator = validator
+        self.root = root
+        self.writer = writer
+        self.recursive = recursive
+        self.errors_only = errors_only
+        self.interval = interval
+        self.exclude = exclude
+        # Directory listings reused between polls while their mtime is unchanged
+        self.listings = ListingCache()
+        
+        self.issues = {}
+        self.references = {}
+        self.dependents = {}
+        self.file_stats = {}
+        self.template_stats = {}
+    
+    def discover_files(self) -> Dict[Path, Tuple[int, int]]:
+        """Return (mtime_ns, size) for every prompt file under the root."""
+        if self.root.is_file():
+            paths = [self.root]
+        else:
+            paths = [Path(p) for p in walk_files(self.root, VALIDATED_EXTENSIONS, self.exclude,
+                                                 recursive=self.recursive, cache=self.listings)]
+        
+        stats = {}
+        for path in paths:
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            stats[path] = (st.st_mtime_ns, st.st_size)
+        return stats
+    
+    def discover_templates(self) -> Dict[str, Tuple[int, int]]:
+        """Return (mtime_ns, size) keyed by template name for the template dir."""
+        stats = {}
+        try:
+            entries = list(os.scandir(self.validator.template_dir))
+        except OSError:
+            return stats
+        
+        for entry in entries:
+            name, ext = os.path.splitext(entry.name)
+            if ext not in self.TEMPLATE_SUFFIXES or not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                # Deleted since the directory was listed
+                continue
+            # A name can resolve through several files; any change counts
+            previous = stats.get(name, (0, 0))
+            stats[name] = (max(previous[0], st.st_mtime_ns), previous[1] + st.st_size)
+        return stats
+    
+    def validate(self, file_path: Path):
+        """Re-validate one file, update the indexes and emit its diagnostics."""
+        issues = self.validator.validate_file(file_path)
+        if self.errors_only:
+            issues = [i for i in issues if i.severity == ValidationIssue.SEVERITY_ERROR]
+        
+        for name in self.references.get(file_path, set()):
+            self.dependents.get(name, set()).discard(file_path)
+        
+        references = set(self.validator.template_references)
+        for name in references:
+            self.dependents.setdefault(name, set()).add(file_path)
+        
+        self.references[file_path] = references
+        self.issues[file_path] = issues
+        self.writer.write_file(file_path, issues)
+    
+    def forget(self, file_path: Path):
+        """Drop a deleted file from the indexes and clear its diagnostics."""
+        for name in self.references.pop(file_path, set()):
+            self.dependents.get(name, set()).discard(file_path)
+        self.issues.pop(file_path, None)
+        self.writer.write_file(file_path, [])
+    
+    def total_errors(self) -> int:
+        """Return the number of errors currently reported across the tree."""
+        return sum(
+            1 for issues in self.issues.values() for i in issues
+            if i.severity == ValidationIssue.SEVERITY_ERROR
+        )
+    
+    def initial_pass(self):
+        """Validate the whole tree once."""
+        self.file_stats = self.discover_files()
+        self.template_stats = self.discover_templates()
+        for file_path in sorted(self.file_stats):
+            self.validate(file_path)
+    
+    def poll(self) -> int:
+        """Re-validate whatever changed since the last poll.
+        
+        Returns the number of files re-validated or cleared.
+        """
+        file_stats = self.discover_files()
+        template_stats = self.discover_templates()
+        
+        changed = {path for path, stat in file_stats.items()
+                   if self.file_stats.get(path) != stat}
+        removed = set(self.file_stats) - set(file_stats)
+        
+        changed_templates = {
+            name for name in set(template_stats) | set(self.template_stats)
+            if template_stats.get(name) != self.template_stats.get(name)
+        }
+        for name in changed_templates:
+            # Existence results are cached; a template may have appeared or gone
+            self.validator.checked_templates.discard(name)
+            changed.update(self.dependents.get(name, set()))
+        
+        self.file_stats = file_stats
+        self.template_stats = template_stats
+        
+        for file_path in sorted(removed):
+            self.forget(file_path)
+        for file_path in sorted(changed - removed):
+            self.validate(file_path)
+        
+        return len(removed) + len(changed - removed)
+    
+    def run(self):
+        """Validate once, then keep polling until interrupted."""
+        self.writer.begin()
+        self.initial_pass()
+        
+        try:
+            while True:
+                time.sleep(self.interval)
+                self.poll()
+        except KeyboardInterrupt:
+            pass
+        
+        self.writer.end(len(self.issues), self.total_errors())
+        return self.total_errors()
+
+
+class TextReportWriter:
+    """Write the plain-text report for each file as soon as it is validated."""
+    
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+    
+    def begin(self):
+        """Start the report (nothing to write for text)."""
+    
+    def write_file(self, file_path: Path, issues: List[ValidationIssue]):
+        """Write the text report for a single validated file."""
+        self.stream.write(format_validation_report(file_path, issues) + '\n\n')
+        self.stream.flush()
+    
+    def end(self, files_validated: int, total_errors: int):
+        """Write the closing summary line."""
+        self.stream.write(f"Summary: {files_validated} files validated, {total_errors} error(s) found\n")
+        self.stream.flush()
+
+
+STREAMING_WRITERS = {
+    'jsonl': JSONLReportWriter,
+    'sarif': SARIFReportWriter,
+}
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.validate."""
+    path = Path(args.path) if args.path else None
+    if path and not path.exists():
+        print(f"Error: Path '{path}' not found")
+        sys.exit(1)
+    
+    # Initialize validator
+    validator = PromptValidator(
+        template_dir=args.template_dir,
+        strict=args.strict
+    )
+    
+    # Check template parameter contracts against the manifest
+    contract_issues = {}
+    if args.manifest:
+        try:
+            manifest = TemplateManifest(args.manifest)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            print(f"Error loading manifest: {e}")
+            sys.exit(1)
+        contract_issues = validator.check_manifest_contracts(manifest)
+    
+    # Watch mode streams diagnostics per file until interrupted
+    if args.watch:
+        writer_class = JSONLReportWriter if args.format == 'jsonl' else TextReportWriter
+        watcher = PromptWatcher(
+            validator, path, writer_class(sys.stdout),
+            recursive=args.recursive,
+            errors_only=args.errors_only,
+            interval=args.interval,
+            exclude=args.exclude
+        )
+        total_errors = watcher.run()
+        sys.exit(1 if total_errors > 0 else 0)
+    
+    # Collect files to validate
+    files_to_validate = []
+    
+    if path is None:
+        pass
+    elif path.is_file():
+        files_to_validate.append(path)
+    elif path.is_dir():
+        with profiling.phase('discover'):
+            files_to_validate.extend(Path(p) for p in walk_files(
+                path, VALIDATED_EXTENSIONS, args.exclude, recursive=args.recursive))
+    
+    if not files_to_validate and not contract_issues:
+        print(f"No files to validate in {path}")
+        sys.exit(0)
+    
+    # Streaming formats write each file's results as soon as they are computed
+    if args.format in STREAMING_WRITERS:
+        if args.quiet:
+            stream = open(os.devnull, 'w', encoding='utf-8')
+        elif args.output:
+            stream = open(args.output, 'w', encoding='utf-8')
+        else:
+            stream = sys.stdout
+        
+        try:
+            writer = STREAMING_WRITERS[args.format](stream)
+            total_errors = stream_validation(
+                validator, sorted(files_to_validate), writer, args.errors_only,
+                extra_issues=contract_issues
+            )
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+        
+        if args.output and not args.quiet:
+            print(f"Validation report saved to: {args.output}")
+        
+        sys.exit(1 if total_errors > 0 else 0)
+    
+    # Validate all files
+    all_issues = {}
+    total_errors = 0
+    
+    results = iter_validation_results(
+        validator, sorted(files_to_validate), contract_issues, args.errors_only
+    )
+    for file_path, issues in results:
+        all_issues[str(file_path)] = issues
+        total_errors += sum(1 for i in issues if i.severity == ValidationIssue.SEVERITY_ERROR)
+    
+    # Generate output
+    if args.format == 'json':
+        # JSON output
+        output = {
+            'files_validated': len(all_issues),
+            'total_errors': total_errors,
+            'issues': {}
+        }
+        
+        for file_path, issues in all_issues.items():
+            output['issues'][file_path] = [i.to_dict() for i in issues]
+        
+        report = json.dumps(output, indent=2)
+    else:
+        # Text output
+        reports = []
+        for file_path, issues in all_issues.items():
+            if issues or not args.errors_only:
+                reports.append(format_validation_report(Path(file_path), issues))
+        
+        report = '\n\n'.join(reports)
+        
+        # Add summary
+        if len(all_issues) > 1:
+            report += f"\n\nSummary: {len(all_issues)} files validated, {total_errors} error(s) found"
+    
+    # Output report
+    if not args.quiet:
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(report)
+            print(f"Validation report saved to: {args.output}")
+        else:
+            print(report)
+    
+    # Exit with error code if errors found
+    sys.exit(1 if total_errors > 0 else 0)
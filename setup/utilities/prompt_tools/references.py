@@ -0,0 +1,194 @@
+"""
+Component References
+
+Parsing and navigation of `$ref:` references such as
+`shared-components.yaml#/common_instructions/task_focus`. The reference
+validator and the prompt bundler both resolve references through
+ComponentIndex, so they always agree on what a reference points to.
+"""
+
+import re
+from pathlib import Path
+
+from . import profiling, yaml_io
+from .discovery import walk_files
+
+REF_PATTERN = re.compile(r'\$ref:\s*([^\s\n]+)')
+
+# Markdown code, where a $ref: is an example rather than a reference: a
+# fenced block up to its closing fence (or the end of the file), or an
+# inline code span on one line
+MARKDOWN_CODE = re.compile(r'^[ \t]*(`{3,}|~{3,})[^\n]*\n.*?(?:^[ \t]*\1[ \t]*$|\Z)'
+                           r'|(`+)[^\n]+?(?<!`)\2(?!`)', re.MULTILINE | re.DOTALL)
+
+MARKDOWN_EXTENSIONS = {'.md'}
+
+# File types scanned for references when walking a tree
+PROMPT_EXTENSIONS = {'.md', '.yaml', '.yml', '.txt'}
+
+
+def extract_references(content):
+    """Extract all $ref: references from content."""
+    return REF_PATTERN.findall(content)
+
+
+def parse_reference(ref):
+    """Parse a reference into file and path components."""
+    if '#' in ref:
+        file_part, path_part = ref.split('#', 1)
+        return file_part, path_part
+    return ref, None
+
+
+def canonical_reference(ref):
+    """Return one spelling for a reference, so '#a/b' and '#/a/b/' compare equal."""
+    file_part, path_part = parse_reference(ref)
+    path = (path_part or '').strip('/')
+    return f"{file_part}#/{path}" if path else file_part
+
+
+def index_paths(data):
+    """Return every path a reference can navigate to in data.
+    
+    Paths are mapping keys joined with '/' (no leading slash), one for each
+    nested mapping entry. Keys that are not strings or that contain '/'
+    cannot be reached by a reference and are left out.
+    """
+    paths = set()
+    stack = [(None, data, frozenset())]
+    while stack:
+        prefix, node, ancestors = stack.pop()
+        if not isinstance(node, dict) or id(node) in ancestors:
+            # Recursive YAML aliases would otherwise loop forever
+            continue
+        ancestors = ancestors | {id(node)}
+        for key, value in node.items():
+            if isinstance(key, str) and '/' not in key:
+                path = key if prefix is None else f"{prefix}/{key}"
+                paths.add(path)
+                stack.append((path, value, ancestors))
+    return paths
+
+
+class ComponentIndex:
+    """Per-run cache of parsed component files and their valid paths.
+    
+    Each referenced file is read, parsed and indexed once; after that every
+    reference check is a dictionary lookup plus a set lookup.
+    """
+    
+    def __init__(self, base_path):
+        self.base_path = Path(base_path)
+        # file_part -> (data, paths, error message or None)
+        self.documents = {}
+    
+    def load(self, file_part):
+        """Return (data, paths, error) for a component file, parsing it once."""
+        entry = self.documents.get(file_part)
+        if entry is None:
+            profiling.count('component_cache_misses')
+            entry = self._load(file_part)
+            self.documents[file_part] = entry
+        else:
+            profiling.count('component_cache_hits')
+        return entry
+    
+    def _load(self, file_part):
+        file_path = self.base_path / file_part
+        profiling.count('stat_calls')
+        if not file_path.exists():
+            return None, set(), f"File not found: {file_path}"
+        try:
+            with open(file_path, 'r') as f:
+                data = yaml_io.safe_load(f)
+        except Exception as e:
+            return None, set(), f"Failed to parse YAML: {e}"
+        return data, index_paths(data), None
+    
+    def validate(self, ref):
+        """Validate that a reference points to an existing component."""
+        file_part, path_part = parse_reference(ref)
+        data, paths, error = self.load(file_part)
+        if error:
+            return False, error
+        
+        # If no path part, reference is valid
+        if not path_part:
+            return True, "Valid file reference"
+        
+        if path_part.strip('/') not in paths:
+            return False, f"Path not found: {path_part}"
+        return True, "Valid reference"
+    
+    def target(self, ref):
+        """Return the value a reference points to.
+        
+        Raises ValueError with the validation message if the reference is
+        broken. The value is the cached data itself, not a copy.
+        """
+        valid, message = self.validate(ref)
+        if not valid:
+            raise ValueError(message)
+        file_part, path_part = parse_reference(ref)
+        value = self.load(file_part)[0]
+        if path_part and path_part.strip('/'):
+            for key in path_part.strip('/').split('/'):
+                value = value[key]
+        return value
+
+
+def reference_text(path, content):
+    """Return content with Markdown code blanked out in .md files.
+    
+    Code spans and fenced blocks in Markdown show references rather than
+    make them, so they are replaced by spaces; newlines are kept, so line
+    numbers still match the file.
+    """
+    if Path(path).suffix.lower() not in MARKDOWN_EXTENSIONS:
+        return content
+    if '`' not in content and '~~~' not in content:
+        return content
+    return MARKDOWN_CODE.sub(lambda match: re.sub(r'[^\n]', ' ', match.group(0)), content)
+
+
+def reference_matches(path, content):
+    """Return the REF_PATTERN matches that are references in content read from path.
+    
+    The matches are found in reference_text(), which keeps every character
+    at its position, so their spans can be used to edit content itself.
+    """
+    return list(REF_PATTERN.finditer(reference_text(path, content)))
+
+
+def extract_located_references(content):
+    """Return [(line, ref)] for every $ref: reference in content."""
+    references = []
+    line = 1
+    last = 0
+    for match in REF_PATTERN.finditer(content):
+        line += content.count('\n', last, match.start())
+        last = match.start()
+        references.append((line, match.group(1)))
+    return references
+
+
+def discover_prompt_files(root, exclude=()):
+    """Yield the prompt files under root, skipping .gitignore-style exclude patterns."""
+    return walk_files(root, PROMPT_EXTENSIONS, exclude)
+
+
+def collect_inputs(inputs, exclude=()):
+    """Return [(path, name)] for the given files and directory trees.
+    
+    Files under a directory are named relative to it; files given directly
+    are named by their file name.
+    """
+    entries = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            for file_path in discover_prompt_files(path, exclude):
+                entries.append((Path(file_path), Path(file_path).relative_to(path).as_posix()))
+        else:
+            entries.append((path, path.name))
+    return entries
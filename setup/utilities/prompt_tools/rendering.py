@@ -0,0 +1,356 @@
+"""
+Structured Template Rendering
+
+Render YAML templates with a `structure:` section, such as
+templates/code-review.yaml, into finished text. Each template is compiled
+once into a render plan: every text fragment becomes a format string with
+its {{placeholders}} resolved to positional fields, and every list section
+knows its item template, list format and the variable holding its items.
+Rendering a plan is then one str.format() call per fragment or list item,
+with no rescanning of template text; list markers and indentation are
+worked out at compile time too.
+
+Section forms understood inside `structure:`:
+    name: "text"                    - Text with placeholders
+    name:
+      header: "## Title"            - Optional heading
+      content: "text"               - Optional body text
+      subsections: {a: "text", ...} - Optional bodies, in order
+      format: numbered_list         - List format for the items
+      item_template: "text"         - Template for each item (any *_template key)
+      items: variable_name          - Optional; which variable holds the items
+"""
+
+from itertools import chain
+from operator import itemgetter, methodcaller
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from . import scanning
+
+# Scanner styles that are placeholders in structured templates
+PLACEHOLDER_STYLES = {'double_braces', 'dot_notation'}
+
+# List formats: the marker put in front of each item ('{n}' is its number),
+# and whether items are separated by a blank line
+LIST_FORMATS = {
+    'numbered_list': ('{n}. ', False),
+    'bullet_list': ('- ', False),
+    'checklist': ('- [ ] ', False),
+    'numbered_checklist': ('{n}. [ ] ', False),
+    'phased_list': ('', True),
+}
+
+# Markers an item template may already start with; they are replaced by the
+# section's marker rather than doubled up
+EXISTING_MARKERS = ('- [ ] ', '- ', '* ')
+
+
+class TextPlan(NamedTuple):
+    """A text fragment compiled to a format string and its placeholder paths.
+    
+    named is the same format string with {name} fields instead of positional
+    ones, for use with str.format_map(); it is None when a placeholder is a
+    dotted path or not an identifier.
+    """
+    
+    format: str
+    fields: Tuple[Tuple[str, ...], ...]
+    named: Optional[str] = None
+    
+    @property
+    def names(self) -> Set[str]:
+        """Top-level variable names the fragment uses."""
+        return {path[0] for path in self.fields}
+
+
+class SectionPlan(NamedTuple):
+    """One compiled entry of a template's structure."""
+    
+    name: str
+    header: Optional[str]
+    bodies: Tuple[TextPlan, ...]
+    item: Optional[TextPlan]
+    items_variable: Optional[str]
+    marker: str
+    indent: str
+    spaced: bool
+
+
+class RenderResult(NamedTuple):
+    """Rendered text plus the placeholders that had no value."""
+    
+    content: str
+    missing: Set[str]
+
+
+def compile_text(text: str) -> TextPlan:
+    """Compile text with {{name}} / {{a.b}} placeholders into a TextPlan."""
+    text = text.rstrip('\n')
+    parts = []
+    named = []
+    fields = []
+    last = 0
+    for token in scanning.scan_references(text):
+        if token.style not in PLACEHOLDER_STYLES:
+            continue
+        literal = text[last:token.start].replace('{', '{{').replace('}', '}}')
+        parts.extend((literal, f"{{{len(fields)}}}"))
+        named.extend((literal, f"{{{token.name}}}"))
+        fields.append(tuple(token.name.split('.')))
+        last = token.end
+    literal = text[last:].replace('{', '{{').replace('}', '}}')
+    parts.append(literal)
+    named.append(literal)
+    simple = all(len(path) == 1 and path[0].isidentifier() for path in fields)
+    return TextPlan(''.join(parts), tuple(fields), ''.join(named) if simple else None)
+
+
+def item_template_key(section: Dict[str, Any]) -> Optional[str]:
+    """Return the key holding a section's item template, if it has one."""
+    for key in section:
+        if isinstance(key, str) and key.endswith('_template'):
+            return key
+    return None
+
+
+def items_variable(name: str, section: Dict[str, Any], parameters: Iterable[str]) -> str:
+    """Pick the variable that holds a list section's items.
+    
+    An explicit `items:` wins. Otherwise the section name is used, unless
+    the template declares exactly one parameter named after the section
+    with a suffix (issues -> issues_found).
+    """
+    if isinstance(section.get('items'), str):
+        return section['items']
+    parameters = list(parameters)
+    if name in parameters:
+        return name
+    prefixed = [p for p in parameters if p.startswith(f"{name}_")]
+    return prefixed[0] if len(prefixed) == 1 else name
+
+
+def declared_parameters(template: Dict[str, Any]) -> List[str]:
+    """Return the parameter names a template declares under parameters:."""
+    names = []
+    parameters = template.get('parameters')
+    if isinstance(parameters, dict):
+        for group in parameters.values():
+            for entry in group or []:
+                if isinstance(entry, dict):
+                    names.extend(entry)
+                elif isinstance(entry, str):
+                    names.append(entry)
+    return names
+
+
+def strip_marker(text: str, marker: str) -> Tuple[str, str]:
+    """Prepare an item template for a list marker.
+    
+    A marker the template already starts with is removed, since the
+    section's marker replaces it. Returns the template and the indent for
+    its continuation lines: the marker's width, less the width of the
+    removed marker, so nesting written in the template is kept.
+    """
+    width = len(marker.format(n=1))
+    for existing in EXISTING_MARKERS:
+        if text.startswith(existing):
+            return text[len(existing):], ' ' * max(0, width - len(existing))
+    return text, ' ' * width
+
+
+def compile_structure(template: Dict[str, Any]) -> List[SectionPlan]:
+    """Compile a loaded template's structure: section into section plans.
+    
+    Raises ValueError if the template has no structure mapping or a section
+    has a form the renderer does not understand.
+    """
+    structure = template.get('structure') if isinstance(template, dict) else None
+    if not isinstance(structure, dict):
+        raise ValueError("template has no 'structure' mapping")
+    parameters = declared_parameters(template)
+    
+    plans = []
+    for name, section in structure.items():
+        if isinstance(section, str):
+            plans.append(SectionPlan(name, None, (compile_text(section),), None, None, '', '', False))
+            continue
+        if not isinstance(section, dict):
+            raise ValueError(f"section '{name}' must be text or a mapping")
+        
+        bodies = []
+        if isinstance(section.get('content'), str):
+            bodies.append(compile_text(section['content']))
+        for text in (section.get('subsections') or {}).values():
+            bodies.append(compile_text(str(text)))
+        
+        item = None
+        variable = None
+        marker, indent, spaced = '', '', False
+        key = item_template_key(section)
+        if key is not None:
+            item_text = str(section[key])
+            variable = items_variable(name, section, parameters)
+            list_format = section.get('format')
+            if list_format is not None:
+                if list_format not in LIST_FORMATS:
+                    raise ValueError(f"section '{name}' has unknown format '{list_format}'")
+                marker, spaced = LIST_FORMATS[list_format]
+            if marker:
+                item_text, indent = strip_marker(item_text, marker)
+            item = compile_text(item_text)
+        
+        header = section.get('header')
+        plans.append(SectionPlan(name, str(header) if header is not None else None,
+                                 tuple(bodies), item, variable, marker, indent, spaced))
+    return plans
+
+
+def format_value(value: Any) -> str:
+    """Turn a variable value into text: lists become bullet lines."""
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value.rstrip('\n')
+    if isinstance(value, list):
+        return '\n'.join(f"- {format_value(item)}" for item in value)
+    return str(value)
+
+
+def lookup(path: Tuple[str, ...], scopes: Tuple[Dict[str, Any], ...]) -> Tuple[bool, Any]:
+    """Return (found, value) for a placeholder path, innermost scope first."""
+    for scope in scopes:
+        if path[0] in scope:
+            value = scope[path[0]]
+            for part in path[1:]:
+                if not isinstance(value, dict) or part not in value:
+                    return False, None
+                value = value[part]
+            return True, value
+    return False, None
+
+
+def render_text(plan: TextPlan, scopes: Tuple[Dict[str, Any], ...],
+                missing: Set[str]) -> Tuple[str, bool]:
+    """Render a TextPlan; returns (text, whether any placeholder had a value)."""
+    values = []
+    any_found = not plan.fields
+    for path in plan.fields:
+        found, value = lookup(path, scopes)
+        if found and value is not None:
+            any_found = True
+        else:
+            missing.add('.'.join(path))
+        values.append(format_value(value))
+    return plan.format.format(*values), any_found
+
+
+_ends_with_newline = methodcaller('endswith', '\n')
+
+
+def _fast_texts(plan: TextPlan, items: List[Any], variables: Dict[str, Any]) -> Optional[List[str]]:
+    """Render dict items with format_map() over the whole list, if possible.
+    
+    Works when every item is a dict holding each item field as a string
+    without a trailing newline. Fields no item defines are filled in from
+    variables once, up front. Returns None when the list does not qualify,
+    so the caller falls back to rendering item by item.
+    """
+    fmt = plan.named
+    if fmt is None or not plan.fields or set(map(type, items)) != {dict}:
+        return None
+    first = items[0]
+    outer = [name for name in plan.names if name not in first]
+    for name in outer:
+        value = variables.get(name)
+        if value is None or any(name in item for item in items):
+            return None
+        text = format_value(value).replace('{', '{{').replace('}', '}}')
+        fmt = fmt.replace(f"{{{name}}}", text)
+    names = plan.names.difference(outer)
+    if names:
+        getter = itemgetter(*names)
+        try:
+            if len(names) == 1:
+                values = list(map(getter, items))
+            else:
+                values = list(chain.from_iterable(map(getter, items)))
+        except KeyError:
+            return None
+        if set(map(type, values)) != {str} or any(map(_ends_with_newline, values)):
+            return None
+    return list(map(fmt.format_map, items))
+
+
+def render_items(section: SectionPlan, items: List[Any], variables: Dict[str, Any],
+                 missing: Set[str]) -> str:
+    """Render every item of a list section.
+    
+    Lists of dicts whose fields are plain strings are rendered with one
+    str.format_map() call per item, and markers and indentation are applied
+    over the whole list with map(), so the per-item work stays in C. Any
+    other list (missing fields, lists or numbers as values, dotted paths,
+    phased lists that number their items) goes through the general lookup.
+    """
+    plan = section.item
+    texts = None if section.spaced else _fast_texts(plan, items, variables)
+    if texts is None:
+        single = plan.fields[0][0] if len(plan.names) == 1 else None
+        texts = []
+        for n, item in enumerate(items, 1):
+            if isinstance(item, dict):
+                scope = item
+            elif single is not None:
+                # A plain item fills the template's only placeholder
+                scope = {single: item}
+            else:
+                scope = {'item': item}
+            if section.spaced and 'phase_number' not in scope:
+                scope = dict(scope, phase_number=n)
+            texts.append(render_text(plan, (scope, variables), missing)[0])
+    
+    marker = section.marker
+    if marker:
+        if section.indent:
+            texts = map(methodcaller('replace', '\n', '\n' + section.indent), texts)
+        before, numbered, after = marker.partition('{n}')
+        if numbered:
+            texts = map(f"{before}{{}}{after}{{}}".format, range(1, len(items) + 1), texts)
+        else:
+            texts = map(marker.__add__, texts)
+    return ('\n\n' if section.spaced else '\n').join(texts)
+
+
+def render_plan(plans: List[SectionPlan], variables: Dict[str, Any]) -> RenderResult:
+    """Render compiled section plans with variables.
+    
+    A section is left out when none of its placeholders have a value and,
+    for list sections, its items variable is missing or empty; the same
+    goes for each content or subsection body within a section. Other
+    placeholders without a value render as empty text. Every placeholder
+    without a value is reported in the result's missing set.
+    """
+    scopes = (variables,)
+    missing = set()
+    sections = []
+    for section in plans:
+        parts = []
+        has_value = False
+        for body in section.bodies:
+            text, found = render_text(body, scopes, missing)
+            if found:
+                has_value = True
+                parts.append(text)
+        if section.item is not None:
+            items = variables.get(section.items_variable)
+            if isinstance(items, list) and items:
+                parts.append(render_items(section, items, variables, missing))
+                has_value = True
+            elif items:
+                parts.append(render_items(section, [items], variables, missing))
+                has_value = True
+        if not has_value:
+            continue
+        if section.header is not None:
+            parts.insert(0, section.header)
+        sections.append('\n\n'.join(part for part in parts if part))
+    return RenderResult('\n\n'.join(sections) + '\n', missing)
@@ -0,0 +1,103 @@
+"""
+Reference Scanner
+
+Single-pass scanner for template and variable references in prompt text.
+
+All supported reference syntaxes are compiled into one alternation, so a
+document is scanned once and every match comes back as a typed token with
+its offsets. Both the prompt validator and the template interpolator use this
+module, which keeps the two tools in agreement about what a reference is.
+
+Template reference formats:
+    {{template_name}}     - Double brace style
+    ${template_name}      - Dollar brace style
+    <template:name/>      - XML style
+    @include(name)        - Include style
+    [[template_name]]     - Double bracket style
+
+Variable reference formats:
+    {{var.property}}      - Dot notation for nested values
+    $variable             - Dollar sign style
+    %{variable}           - Percent brace style
+"""
+
+import re
+from typing import Iterator, List, NamedTuple, Set, Tuple
+
+KIND_TEMPLATE = 'template'
+KIND_VARIABLE = 'variable'
+
+# Template reference patterns: (pattern, style). Each pattern has one group
+# holding the template name.
+TEMPLATE_PATTERNS = [
+    (r'\{\{(\w+)\}\}', 'double_braces'),           # {{template_name}}
+    (r'\$\{(\w+)\}', 'dollar_braces'),             # ${template_name}
+    (r'<template:(\w+)/>', 'xml_style'),           # <template:name/>
+    (r'@include\((\w+)\)', 'include_style'),       # @include(name)
+    (r'\[\[(\w+)\]\]', 'double_brackets'),         # [[template_name]]
+]
+
+# Variable patterns: (pattern, style). Each pattern has one group holding the
+# variable name; dot notation captures the full dotted path.
+VAR_PATTERNS = [
+    (r'\{\{(\w+\.\w+)\}\}', 'dot_notation'),       # {{var.property}}
+    (r'\$(\w+)', 'dollar_sign'),                   # $variable
+    (r'%\{(\w+)\}', 'percent_braces'),             # %{variable}
+]
+
+STYLE_KINDS = dict(
+    [(style, KIND_TEMPLATE) for _, style in TEMPLATE_PATTERNS] +
+    [(style, KIND_VARIABLE) for _, style in VAR_PATTERNS]
+)
+
+
+def _compile_combined(patterns: List[Tuple[str, str]]) -> re.Pattern:
+    """Join patterns into one alternation, naming each capture group by style."""
+    alternatives = []
+    for pattern, style in patterns:
+        # Name the first unescaped group after the style
+        alternatives.append(re.sub(r'(?<!\\)\(', f'(?P<{style}>', pattern, count=1))
+    return re.compile('|'.join(alternatives))
+
+
+# One automaton for every reference syntax. No two syntaxes can match the
+# same text, so leftmost-first alternation finds exactly the matches the
+# individual patterns would.
+REFERENCE_PATTERN = _compile_combined(TEMPLATE_PATTERNS + VAR_PATTERNS)
+
+
+class ReferenceToken(NamedTuple):
+    """A template or variable reference found in prompt text."""
+    
+    kind: str
+    style: str
+    name: str
+    start: int
+    end: int
+    text: str
+
+
+def scan_references(content: str) -> Iterator[ReferenceToken]:
+    """Yield every template and variable reference in content, in order."""
+    for match in REFERENCE_PATTERN.finditer(content):
+        style = match.lastgroup
+        start, end = match.span()
+        yield ReferenceToken(STYLE_KINDS[style], style, match.group(style),
+                             start, end, content[start:end])
+
+
+def find_template_references(content: str) -> Set[str]:
+    """Return the names of all templates referenced in content."""
+    return {token.name for token in scan_references(content)
+            if token.kind == KIND_TEMPLATE}
+
+
+def find_variable_references(content: str) -> Set[str]:
+    """Return the names of all variables referenced in content."""
+    return {token.name for token in scan_references(content)
+            if token.kind == KIND_VARIABLE}
+
+
+def line_number(content: str, offset: int) -> int:
+    """Return the 1-based line number of an offset in content."""
+    return content.count('\n', 0, offset) + 1
@@ -0,0 +1,323 @@
+"""
+Artifact Store
+
+Content-addressed storage for generated files. Each distinct output is
+kept once, under objects/<first two hex digits>/<rest> of its SHA-256,
+and the file a utility writes becomes a hardlink to that object (or a
+reflink, or as a last resort a copy, where hardlinks are not possible).
+Identical outputs share one object, and rewriting a destination that
+already links to the right object costs a stat and no writes (a
+destination holding a copy of it, where links were not possible, costs a
+hash and no writes).
+
+Objects are read-only, so an in-place edit of a hardlinked output fails
+instead of changing every file that shares the object; editors that save
+by writing a new file and renaming it are unaffected. An object whose
+only link is the store's own is no longer installed anywhere and can be
+pruned.
+
+Set PROMPT_TOOLS_STORE to a directory to route the output of every
+utility through a store, and PROMPT_TOOLS_STORE_LINK to hardlink (the
+default), reflink or copy to choose how outputs are linked.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from . import profiling
+
+LINK_MODES = ('hardlink', 'reflink', 'copy')
+
+# ioctl that clones a file's extents on Linux (btrfs, XFS, bcachefs, ...)
+FICLONE = 0x40049409
+
+READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+CHUNK_SIZE = 1 << 20
+
+
+def digest_bytes(data: bytes) -> str:
+    """Return the hex SHA-256 of data."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def digest_file(path) -> str:
+    """Return the hex SHA-256 of the file at path."""
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def reflink(source, target):
+    """Create target as a copy-on-write clone of source, or raise OSError."""
+    if fcntl is None or not sys.platform.startswith('linux'):
+        raise OSError(errno.EOPNOTSUPP, 'reflinks are not supported on this platform')
+    with open(source, 'rb') as src, open(target, 'xb') as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
+def _unlink_quietly(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class ArtifactStore:
+    """SHA-256 addressed objects under root, installed by link or copy."""
+    
+    def __init__(self, root, link: str = 'hardlink'):
+        if link not in LINK_MODES:
+            raise ValueError(f"Unknown link mode {link!r}; expected one of {', '.join(LINK_MODES)}")
+        self.root = Path(root)
+        self.objects = self.root / 'objects'
+        self.link = link
+    
+    def object_path(self, digest: str) -> Path:
+        """Return where the object for digest is (or would be) kept."""
+        return self.objects / digest[:2] / digest[2:]
+    
+    def has(self, digest: str) -> bool:
+        """Whether the store holds digest."""
+        return self.object_path(digest).is_file()
+    
+    def put(self, data: bytes) -> str:
+        """Store data unless an identical object exists; returns its digest."""
+        digest = digest_bytes(data)
+        target = self.object_path(digest)
+        if target.is_file():
+            profiling.count('store_hits')
+            return digest
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(tmp_name, READ_ONLY)
+            os.replace(tmp_name, target)
+        except BaseException:
+            _unlink_quietly(tmp_name)
+            raise
+        profiling.count('store_objects_written')
+        profiling.count('store_bytes_written', len(data))
+        return digest
+    
+    def adopt(self, path) -> str:
+        """Move a finished file into the store and return its digest.
+        
+        The file is renamed into place when it is on the store's file
+        system and copied otherwise. If the store already holds the
+        content, the file is simply removed.
+        """
+        digest = digest_file(path)
+        target = self.object_path(digest)
+        if target.is_file():
+            profiling.count('store_hits')
+            os.unlink(path)
+            return digest
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(path, READ_ONLY)
+        try:
+            os.replace(path, target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix='.', suffix='.tmp')
+            os.close(fd)
+            try:
+                shutil.copyfile(path, tmp_name)
+                os.chmod(tmp_name, READ_ONLY)
+                os.replace(tmp_name, target)
+            except BaseException:
+                _unlink_quietly(tmp_name)
+                raise
+            os.unlink(path)
+        profiling.count('store_objects_written')
+        profiling.count('store_bytes_written', target.stat().st_size)
+        return digest
+    
+    def installed(self, digest: str, dest) -> bool:
+        """Whether dest already holds the object for digest.
+        
+        A hardlink to the object is recognised from its inode alone. Any
+        other file of the right size is hashed, so a copy left by a
+        fallback (the store on another file system, say) is not rewritten
+        on every run, whatever the link mode.
+        """
+        try:
+            dest_stat = os.stat(dest)
+            object_stat = os.stat(self.object_path(digest))
+        except OSError:
+            return False
+        if (dest_stat.st_dev, dest_stat.st_ino) == (object_stat.st_dev, object_stat.st_ino):
+            return True
+        if dest_stat.st_size != object_stat.st_size:
+            return False
+        return digest_file(dest) == digest
+    
+    def install(self, digest: str, dest) -> bool:
+        """Make dest hold the object for digest; returns False if it already did.
+        
+        dest is replaced atomically. Where the configured link cannot be
+        made (another file system, no reflink support, a link limit), the
+        next mode in LINK_MODES is tried.
+        """
+        dest = Path(dest)
+        if self.installed(digest, dest):
+            profiling.count('store_installs_unchanged')
+            return False
+        source = self.object_path(digest)
+        # link and clone need a name that does not exist yet: make it in a
+        # fresh private directory, which no other process can be using
+        tmp_dir = tempfile.mkdtemp(dir=dest.parent, prefix=f".{dest.name}.", suffix='.tmp')
+        tmp_name = os.path.join(tmp_dir, dest.name)
+        try:
+            method = self._materialize(source, tmp_name)
+            os.replace(tmp_name, dest)
+        except BaseException:
+            _unlink_quietly(tmp_name)
+            raise
+        finally:
+            os.rmdir(tmp_dir)
+        profiling.count(f'store_installs_{method}')
+        return True
+    
+    def _materialize(self, source: Path, target: str) -> str:
+        """Create target from source with the best available mode; returns the mode used."""
+        start = LINK_MODES.index(self.link)
+        if start == 0:
+            try:
+                os.link(source, target)
+                return 'hardlink'
+            except OSError:
+                pass
+        if start <= 1:
+            try:
+                reflink(source, target)
+                return 'reflink'
+            except OSError:
+                _unlink_quietly(target)
+        shutil.copyfile(source, target)
+        return 'copy'
+    
+    def write(self, dest, data) -> bool:
+        """Store data (str as UTF-8, or bytes) and install it at dest.
+        
+        Returns whether dest changed.
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return self.install(self.put(data), dest)
+    
+    def iter_objects(self) -> Iterator[Tuple[str, os.stat_result]]:
+        """Yield (digest, stat) for every object in the store."""
+        try:
+            fans = sorted(os.scandir(self.objects), key=lambda entry: entry.name)
+        except FileNotFoundError:
+            return
+        for fan in fans:
+            if not fan.is_dir(follow_symlinks=False):
+                continue
+            for entry in sorted(os.scandir(fan.path), key=lambda entry: entry.name):
+                if entry.name.startswith('.') or not entry.is_file(follow_symlinks=False):
+                    continue
+                yield fan.name + entry.name, entry.stat(follow_symlinks=False)
+    
+    def stats(self) -> Dict[str, int]:
+        """Count objects and bytes, and how many objects are still linked elsewhere."""
+        result = {'objects': 0, 'bytes': 0, 'linked': 0, 'linked_bytes': 0, 'links': 0}
+        for _, object_stat in self.iter_objects():
+            result['objects'] += 1
+            result['bytes'] += object_stat.st_size
+            if object_stat.st_nlink > 1:
+                result['linked'] += 1
+                result['linked_bytes'] += object_stat.st_size
+                result['links'] += object_stat.st_nlink - 1
+        return result
+    
+    def prune(self) -> Dict[str, int]:
+        """Remove objects with no hardlinks outside the store.
+        
+        Only outputs installed as hardlinks keep an object alive, so with
+        reflink or copy installs every object is pruned and the next run
+        stores it again. Returns the number of objects and bytes removed.
+        """
+        removed = {'objects': 0, 'bytes': 0}
+        for digest, object_stat in self.iter_objects():
+            if object_stat.st_nlink == 1:
+                os.unlink(self.object_path(digest))
+                removed['objects'] += 1
+                removed['bytes'] += object_stat.st_size
+        return removed
+
+
+_default_store = None
+_default_store_loaded = False
+
+
+def default_store() -> Optional[ArtifactStore]:
+    """Return the store named by PROMPT_TOOLS_STORE, or None when it is unset."""
+    global _default_store, _default_store_loaded
+    if not _default_store_loaded:
+        _default_store_loaded = True
+        root = os.environ.get('PROMPT_TOOLS_STORE')
+        if root:
+            _default_store = ArtifactStore(root, os.environ.get('PROMPT_TOOLS_STORE_LINK') or 'hardlink')
+    return _default_store
+
+
+def format_report(store: ArtifactStore, stats: Dict[str, int],
+                  removed: Optional[Dict[str, int]] = None) -> str:
+    """Format store statistics, and what a prune removed, as text."""
+    report = []
+    report.append("=" * 60)
+    report.append(f"ARTIFACT STORE - {store.root}")
+    report.append("=" * 60)
+    report.append(f"Objects: {stats['objects']:,} ({stats['bytes']:,} bytes)")
+    report.append(f"Installed: {stats['linked']:,} objects ({stats['linked_bytes']:,} bytes) "
+                  f"behind {stats['links']:,} hardlinks")
+    unlinked = stats['objects'] - stats['linked']
+    report.append(f"Not linked: {unlinked:,} objects ({stats['bytes'] - stats['linked_bytes']:,} bytes)")
+    if removed is not None:
+        report.append("-" * 60)
+        report.append(f"Pruned: {removed['objects']:,} objects ({removed['bytes']:,} bytes)")
+    report.append("=" * 60)
+    return '\n'.join(report)
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.store."""
+    store = ArtifactStore(args.root)
+    if not store.objects.is_dir():
+        print(f"Error: {args.root} is not an artifact store (no objects/ directory)")
+        sys.exit(1)
+    
+    removed = None
+    if args.prune:
+        with profiling.phase('prune'):
+            removed = store.prune()
+    with profiling.phase('scan'):
+        stats = store.stats()
+    
+    if args.format == 'json':
+        result: Dict[str, Any] = {'root': str(store.root), **stats}
+        if removed is not None:
+            result['pruned'] = removed
+        print(json.dumps(result, indent=2))
+    else:
+        print(format_report(store, stats, removed))
@@ -0,0 +1,357 @@
+"""
+Template Interpolator
+
+Replace template references with actual content.
+Supports parameter substitution and handles nested template references.
+With --structured, renders a YAML template's structure: sections (headers,
+content and list items) from a compiled render plan.
+
+Usage:
+    python template-interpolator.py <template_file> [--vars key=value ...]
+    python template-interpolator.py <template_file> --template-dir <dir>
+    python template-interpolator.py <template.yaml> --structured --vars-file <params>
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Any, Tuple
+import json
+
+import yaml
+
+from . import profiling
+from . import rendering
+from . import scanning
+from . import yaml_io
+from .files import write_artifact
+
+
+class TemplateInterpolator:
+    """Interpolate template references and variables in text files."""
+    
+    # Template and variable reference patterns (shared with the validator)
+    TEMPLATE_PATTERNS = scanning.TEMPLATE_PATTERNS
+    VAR_PATTERNS = scanning.VAR_PATTERNS
+    
+    def __init__(self, template_dir: Path = None, max_depth: int = 10, warn_missing: bool = True):
+        """Initialize with template directory and maximum recursion depth.
+        
+        Templates that cannot be found are left unexpanded and recorded in
+        missing_templates; warn_missing also prints a warning for each.
+        """
+        self.template_dir = template_dir or Path.cwd()
+        self.max_depth = max_depth
+        self.warn_missing = warn_missing
+        self.template_cache = {}
+        self.plan_cache = {}
+        self.processed_templates = set()
+        self.missing_templates = set()
+    
+    def load_template(self, template_name: str) -> str:
+        """Load a template file by name."""
+        if template_name in self.template_cache:
+            profiling.count('template_cache_hits')
+            return self.template_cache[template_name]
+        profiling.count('template_cache_misses')
+        
+        # Search for template file
+        search_paths = [
+            self.template_dir / f"{template_name}",
+            self.template_dir / f"{template_name}.txt",
+            self.template_dir / f"{template_name}.tmpl",
+            self.template_dir / f"{template_name}.template",
+            self.template_dir / f"{template_name}.yaml",
+            self.template_dir / f"{template_name}.yml",
+        ]
+        
+        for path in search_paths:
+            profiling.count('stat_calls')
+            if path.exists():
+                try:
+                    with profiling.phase('read'), open(path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                    profiling.count('bytes_read', len(content))
+                    self.template_cache[template_name] = content
+                    return content
+                except Exception as e:
+                    raise RuntimeError(f"Error loading template {path}: {e}")
+        
+        raise FileNotFoundError(f"Template '{template_name}' not found in {self.template_dir}")
+    
+    def find_template_references(self, content: str, tokens=None) -> List[Tuple[str, str, str]]:
+        """Find all template references in content (or in tokens already scanned from it)."""
+        if tokens is None:
+            tokens = scanning.scan_references(content)
+        with profiling.phase('scan'):
+            return [(token.text, token.name, token.style)
+                    for token in tokens
+                    if token.kind == scanning.KIND_TEMPLATE]
+    
+    def find_variables(self, content: str, tokens=None) -> List[Tuple[str, str, str]]:
+        """Find all variable references in content (or in tokens already scanned from it)."""
+        if tokens is None:
+            tokens = scanning.scan_references(content)
+        with profiling.phase('scan'):
+            return [(token.text, token.name, token.style)
+                    for token in tokens
+                    if token.kind == scanning.KIND_VARIABLE]
+    
+    def interpolate_variables(self, content: str, variables: Dict[str, Any], tokens=None) -> str:
+        """Replace variable references with values."""
+        result = content
+        
+        for full_match, var_name, style in self.find_variables(content, tokens):
+            value = None
+            
+            # Handle dot notation
+            if '.' in var_name:
+                parts = var_name.split('.')
+                value = variables
+                for part in parts:
+                    if isinstance(value, dict) and part in value:
+                        value = value[part]
+                    else:
+                        value = None
+                        break
+            else:
+                value = variables.get(var_name)
+            
+            if value is not None:
+                result = result.replace(full_match, str(value))
+        
+        return result
+    
+    def interpolate_templates(self, content: str, depth: int = 0, tokens=None) -> Tuple[str, Set[str]]:
+        """Recursively interpolate template references."""
+        if depth >= self.max_depth:
+            raise RecursionError(f"Maximum template nesting depth ({self.max_depth}) exceeded")
+        
+        used_templates = set()
+        result = content
+        
+        # Find and replace template references
+        references = self.find_template_references(content, tokens)
+        
+        for full_match, template_name, style in references:
+            if template_name in self.processed_templates:
+                # Circular reference detected
+                raise RecursionError(f"Circular template reference detected: {template_name}")
+            
+            try:
+                # Mark as being processed
+                self.processed_templates.add(template_name)
+                
+                # Load template content
+                template_content = self.load_template(template_name)
+                
+                # Recursively process the template
+                processed_content, nested_templates = self.interpolate_templates(
+                    template_content, depth + 1
+                )
+                
+                # Replace reference with processed content
+                result = result.replace(full_match, processed_content)
+                
+                # Track used templates
+                used_templates.add(template_name)
+                used_templates.update(nested_templates)
+            
+            except FileNotFoundError:
+                self.missing_templates.add(template_name)
+                if self.warn_missing:
+                    print(f"Warning: Template '{template_name}' not found, leaving reference unchanged")
+            finally:
+                # Unmark after processing
+                self.processed_templates.discard(template_name)
+        
+        return result, used_templates
+    
+    def compile_structured(self, template_name: str) -> List[rendering.SectionPlan]:
+        """Load a structured YAML template and compile it once into a render plan."""
+        plans = self.plan_cache.get(template_name)
+        if plans is None:
+            plans = rendering.compile_structure(yaml_io.safe_load(self.load_template(template_name)))
+            self.plan_cache[template_name] = plans
+        return plans
+    
+    def render_structured(self, template_name: str, variables: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Render a structured YAML template (header/content/item_template sections)."""
+        variables = variables or {}
+        with profiling.phase('compile'):
+            plans = self.compile_structured(template_name)
+        with profiling.phase('render'):
+            result = rendering.render_plan(plans, variables)
+        return {
+            'content': result.content,
+            'missing': sorted(result.missing),
+            'variables': variables,
+            'stats': {
+                'sections': len(plans),
+                'final_length': len(result.content),
+                'variables_used': len(variables)
+            }
+        }
+    
+    def interpolate(self, content: str, variables: Dict[str, Any] = None, tokens=None) -> Dict[str, Any]:
+        """Perform full interpolation of templates and variables.
+        
+        tokens, if given, is the list of reference tokens already scanned
+        from content; it is reused instead of scanning content again.
+        """
+        variables = variables or {}
+        
+        # Reset state
+        self.processed_templates.clear()
+        self.missing_templates = set()
+        
+        with profiling.phase('render'):
+            # First, interpolate templates
+            result, used_templates = self.interpolate_templates(content, tokens=tokens)
+            
+            # Then, interpolate variables. The scan of the original content is
+            # still valid if no template was expanded into it.
+            if result is not content:
+                tokens = None
+            result = self.interpolate_variables(result, variables, tokens)
+        
+        return {
+            'content': result,
+            'used_templates': list(used_templates),
+            'missing_templates': sorted(self.missing_templates),
+            'variables': variables,
+            'stats': {
+                'original_length': len(content),
+                'final_length': len(result),
+                'templates_used': len(used_templates),
+                'variables_used': len(variables)
+            }
+        }
+
+
+def parse_variables(var_strings: List[str]) -> Dict[str, Any]:
+    """Parse variable assignments from command line."""
+    variables = {}
+    
+    for var_string in var_strings:
+        if '=' not in var_string:
+            print(f"Warning: Invalid variable format '{var_string}', expected 'key=value'")
+            continue
+        
+        key, value = var_string.split('=', 1)
+        
+        # Try to parse value as JSON first
+        try:
+            parsed_value = json.loads(value)
+            variables[key] = parsed_value
+        except json.JSONDecodeError:
+            # If not JSON, treat as string
+            variables[key] = value
+    
+    return variables
+
+
+def load_variables_file(file_path: Path) -> Dict[str, Any]:
+    """Load variables from a JSON or YAML file."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            if file_path.suffix in ['.yaml', '.yml']:
+                return yaml_io.safe_load(f)
+            elif file_path.suffix == '.json':
+                return json.load(f)
+            else:
+                print(f"Warning: Unknown file type {file_path.suffix}, trying JSON")
+                return json.load(f)
+    except Exception as e:
+        print(f"Error loading variables file: {e}")
+        return {}
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.interpolate."""
+    # Validate input file
+    input_path = Path(args.input_file)
+    if not input_path.exists():
+        print(f"Error: Input file '{input_path}' not found")
+        sys.exit(1)
+    
+    # Set template directory
+    template_dir = args.template_dir or input_path.parent
+    
+    # Initialize interpolator
+    interpolator = TemplateInterpolator(
+        template_dir=template_dir,
+        max_depth=args.max_depth
+    )
+    
+    # Load variables
+    variables = {}
+    
+    # From command line
+    if args.vars:
+        variables.update(parse_variables(args.vars))
+    
+    # From file
+    if args.vars_file:
+        file_vars = load_variables_file(args.vars_file)
+        variables.update(file_vars)
+    
+    try:
+        # Read input file
+        with profiling.phase('read'), open(input_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        profiling.count('bytes_read', len(content))
+        
+        # Perform interpolation
+        if args.structured:
+            result = interpolator.render_structured(str(input_path.resolve()), variables)
+        else:
+            result = interpolator.interpolate(content, variables)
+        
+        # Output result
+        if args.output:
+            with profiling.phase('write'):
+                write_artifact(Path(args.output), result['content'])
+            print(f"Output written to: {args.output}")
+        else:
+            print(result['content'])
+        
+        # Show statistics if requested
+        if args.stats and args.structured:
+            print("\n" + "=" * 60)
+            print("RENDER STATISTICS")
+            print("=" * 60)
+            print(f"Sections: {result['stats']['sections']}")
+            print(f"Final length: {result['stats']['final_length']:,} chars")
+            print(f"Variables provided: {result['stats']['variables_used']}")
+            print(f"Placeholders without a value: {len(result['missing'])}")
+            if result['missing']:
+                print(f"  - {', '.join(result['missing'])}")
+        elif args.stats:
+            print("\n" + "=" * 60)
+            print("INTERPOLATION STATISTICS")
+            print("=" * 60)
+            print(f"Original length: {result['stats']['original_length']:,} chars")
+            print(f"Final length: {result['stats']['final_length']:,} chars")
+            print(f"Templates used: {result['stats']['templates_used']}")
+            if result['used_templates']:
+                print(f"  - {', '.join(result['used_templates'])}")
+            print(f"Variables provided: {result['stats']['variables_used']}")
+            if variables:
+                print(f"  - {', '.join(variables.keys())}")
+        
+        # Debug information
+        if args.debug:
+            print("\n" + "=" * 60)
+            print("DEBUG INFORMATION")
+            print("=" * 60)
+            print(f"Template directory: {template_dir}")
+            print(f"Max depth: {args.max_depth}")
+            print(f"Variables: {json.dumps(variables, indent=2)}")
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        if args.debug:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
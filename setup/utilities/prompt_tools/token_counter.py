@@ -0,0 +1,175 @@
+"""
+Token Counter Utility
+
+Count tokens in prompt files using tiktoken library.
+Supports before/after comparison and generates reduction percentage reports.
+
+Usage:
+    python token-counter.py <file_path>
+    python token-counter.py <before_file> <after_file> --compare
+    python token-counter.py <directory> --recursive
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import tiktoken
+
+from . import profiling
+from .discovery import walk_files
+
+
+class TokenCounter:
+    """Count tokens in text files using tiktoken."""
+    
+    def __init__(self, model: str = "gpt-4"):
+        """Initialize with encoding for specified model."""
+        try:
+            self.encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Fallback to cl100k_base encoding
+            self.encoding = tiktoken.get_encoding("cl100k_base")
+    
+    def count_tokens(self, text: str) -> int:
+        """Count tokens in a given text."""
+        with profiling.phase('encode'):
+            return len(self.encoding.encode(text))
+    
+    def count_file_tokens(self, file_path: Path) -> int:
+        """Count tokens in a file."""
+        try:
+            with profiling.phase('read'), open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+            profiling.count('files_read')
+            profiling.count('bytes_read', len(content))
+            return self.count_tokens(content)
+        except Exception as e:
+            print(f"Error reading {file_path}: {e}")
+            return 0
+    
+    def compare_files(self, before_path: Path, after_path: Path) -> Dict[str, any]:
+        """Compare token counts between two files."""
+        before_tokens = self.count_file_tokens(before_path)
+        after_tokens = self.count_file_tokens(after_path)
+        
+        reduction = before_tokens - after_tokens
+        reduction_pct = (reduction / before_tokens * 100) if before_tokens > 0 else 0
+        
+        return {
+            'before_file': str(before_path),
+            'after_file': str(after_path),
+            'before_tokens': before_tokens,
+            'after_tokens': after_tokens,
+            'reduction': reduction,
+            'reduction_percentage': reduction_pct,
+            'increase': reduction < 0
+        }
+    
+    def count_directory_tokens(self, directory: Path, recursive: bool = False, 
+                             extensions: List[str] = None, exclude: List[str] = ()) -> Dict[str, int]:
+        """Count tokens in all files in a directory."""
+        if extensions is None:
+            extensions = ['.txt', '.md', '.yaml', '.yml', '.json', '.xml']
+        
+        results = {}
+        for file_path in walk_files(directory, extensions, exclude, recursive=recursive):
+            tokens = self.count_file_tokens(Path(file_path))
+            results[file_path] = tokens
+        
+        return results
+
+
+def format_report(comparison: Dict[str, any]) -> str:
+    """Format a comparison report."""
+    report = []
+    report.append("=" * 60)
+    report.append("TOKEN COMPARISON REPORT")
+    report.append("=" * 60)
+    report.append(f"Before: {comparison['before_file']}")
+    report.append(f"After:  {comparison['after_file']}")
+    report.append("-" * 60)
+    report.append(f"Before tokens: {comparison['before_tokens']:,}")
+    report.append(f"After tokens:  {comparison['after_tokens']:,}")
+    report.append("-" * 60)
+    
+    if comparison['increase']:
+        report.append(f"Token INCREASE: {abs(comparison['reduction']):,} tokens")
+        report.append(f"Increase percentage: {abs(comparison['reduction_percentage']):.2f}%")
+    else:
+        report.append(f"Token reduction: {comparison['reduction']:,} tokens")
+        report.append(f"Reduction percentage: {comparison['reduction_percentage']:.2f}%")
+    
+    report.append("=" * 60)
+    return '\n'.join(report)
+
+
+def format_directory_report(results: Dict[str, int], directory: str) -> str:
+    """Format a directory scan report."""
+    report = []
+    report.append("=" * 60)
+    report.append(f"TOKEN COUNT REPORT - {directory}")
+    report.append("=" * 60)
+    
+    total_tokens = 0
+    for file_path, tokens in sorted(results.items()):
+        report.append(f"{file_path}: {tokens:,} tokens")
+        total_tokens += tokens
+    
+    report.append("-" * 60)
+    report.append(f"Total files: {len(results)}")
+    report.append(f"Total tokens: {total_tokens:,}")
+    report.append("=" * 60)
+    return '\n'.join(report)
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.count."""
+    # Initialize token counter
+    counter = TokenCounter(model=args.model)
+    
+    # Handle comparison mode
+    if args.compare:
+        before_path = Path(args.paths[0])
+        after_path = Path(args.paths[1])
+        
+        if not before_path.exists() or not after_path.exists():
+            print("Error: Both files must exist for comparison")
+            sys.exit(1)
+        
+        comparison = counter.compare_files(before_path, after_path)
+        report = format_report(comparison)
+    
+    # Handle single file or directory
+    else:
+        path = Path(args.paths[0])
+        
+        if path.is_file():
+            tokens = counter.count_file_tokens(path)
+            report = f"{path}: {tokens:,} tokens"
+        
+        elif path.is_dir():
+            results = counter.count_directory_tokens(
+                path, 
+                recursive=args.recursive,
+                extensions=args.extensions,
+                exclude=args.exclude
+            )
+            report = format_directory_report(results, str(path))
+        
+        else:
+            print(f"Error: {path} is not a valid file or directory")
+            sys.exit(1)
+    
+    # Output report
+    print(report)
+    
+    if args.output:
+        profiling.count('files_written')
+        try:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(report)
+            print(f"\nReport saved to: {args.output}")
+        except Exception as e:
+            print(f"Error saving report: {e}")
@@ -0,0 +1,62 @@
+"""
+Token Counting
+
+Memoized token counts for utilities that rank or check changes by tokens.
+Uses tiktoken with the same model fallback as token_counter.py when it is
+installed and its encoding can be loaded. Otherwise counts are estimated at
+four characters per token, and `exact` is False so reports can say so.
+"""
+
+import math
+from typing import Dict, Optional
+
+from . import profiling
+
+CHARS_PER_TOKEN = 4
+
+
+def load_encoding(model: str = "gpt-4"):
+    """Return the tiktoken encoding for model, or None if it is unavailable."""
+    # Imported on first use: it is slow to import and most runs never count
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encodings are downloaded on first use, which fails offline
+        return None
+
+
+class CachedTokenCounter:
+    """Count tokens, remembering the count for every distinct text."""
+    
+    def __init__(self, model: str = "gpt-4", encoding=None):
+        self.encoding = encoding if encoding is not None else load_encoding(model)
+        self.exact = self.encoding is not None
+        self.cache: Dict[str, int] = {}
+    
+    def count(self, text: str) -> int:
+        """Return the token count of text."""
+        tokens = self.cache.get(text)
+        if tokens is None:
+            profiling.count('token_cache_misses')
+            with profiling.phase('encode'):
+                if self.exact:
+                    tokens = len(self.encoding.encode(text))
+                else:
+                    tokens = math.ceil(len(text) / CHARS_PER_TOKEN)
+            self.cache[text] = tokens
+        else:
+            profiling.count('token_cache_hits')
+        return tokens
+    
+    def describe(self) -> Optional[str]:
+        """Return a note for reports when counts are estimates."""
+        if self.exact:
+            return None
+        return f"tiktoken unavailable; tokens estimated as characters / {CHARS_PER_TOKEN}"
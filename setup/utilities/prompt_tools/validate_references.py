@@ -0,0 +1,417 @@
+"""
+Utility to validate references in optimized prompts.
+Checks that all $ref: references point to valid components.
+
+With --tree, every prompt file under a directory is scanned and the
+references are validated as one graph: broken references, reference
+cycles between components and unused components are reported together.
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from . import SETUP_DIR, profiling
+from .references import (ComponentIndex, discover_prompt_files,
+                          extract_located_references, extract_references,
+                          parse_reference, reference_text)
+
+
+def validate_reference(ref, base_path, index=None):
+    """Validate that a reference points to an existing component.
+    
+    Pass a ComponentIndex to share parsed files between calls; without one,
+    the target file is parsed for this reference alone.
+    """
+    if index is None:
+        index = ComponentIndex(base_path)
+    return index.validate(ref)
+
+
+def validate_prompt_file(prompt_file, setup_path, index=None):
+    """Validate all references in a prompt file."""
+    print(f"\nValidating: {prompt_file}")
+    
+    try:
+        with profiling.phase('read'), open(prompt_file, 'r') as f:
+            content = f.read()
+    except Exception as e:
+        print(f"  ERROR: Could not read file: {e}")
+        return False
+    profiling.count('bytes_read', len(content))
+    
+    references = extract_references(reference_text(prompt_file, content))
+    if not references:
+        print("  No references found")
+        return True
+    
+    if index is None:
+        index = ComponentIndex(setup_path)
+    
+    all_valid = True
+    for ref in references:
+        with profiling.phase('resolve'):
+            valid, message = index.validate(ref)
+        if valid:
+            print(f"  ✓ {ref}")
+        else:
+            print(f"  ✗ {ref}: {message}")
+            all_valid = False
+    
+    return all_valid
+
+
+def _scan_file(path):
+    """Read one prompt file and return (path, [(line, ref)], error)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        profiling.count('bytes_read', len(content))
+        return path, extract_located_references(reference_text(path, content)), None
+    except (OSError, UnicodeDecodeError) as e:
+        return path, [], str(e)
+
+
+def scan_files(paths, jobs=1):
+    """Return [(path, refs, error)] for paths, in a process pool when jobs > 1."""
+    if jobs > 1 and len(paths) > 1:
+        chunksize = max(1, len(paths) // (jobs * 8))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(_scan_file, paths, chunksize=chunksize))
+    return [_scan_file(path) for path in paths]
+
+
+def index_components(data):
+    """Find the components of a component file and the references inside them.
+    
+    A component is a mapping whose values hold no further mappings, such as
+    common_instructions/task_focus (a list of such mappings is one component
+    too). Returns (component paths, {owner path: [refs]}), where the owner
+    is the component a reference was found in, or None outside any component.
+    """
+    components = set()
+    owned_refs = {}
+    stack = [('', data, None, frozenset())]
+    while stack:
+        path, node, owner, ancestors = stack.pop()
+        if isinstance(node, (dict, list)):
+            if id(node) in ancestors:
+                continue
+            ancestors = ancestors | {id(node)}
+            values = node.values() if isinstance(node, dict) else node
+            if owner is None and (isinstance(node, list)
+                                  or not any(isinstance(v, dict) for v in values)):
+                owner = path
+                components.add(path)
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if isinstance(key, str) and '/' not in key:
+                        stack.append((f"{path}/{key}" if path else key, value, owner, ancestors))
+            else:
+                for item in node:
+                    stack.append((path, item, owner, ancestors))
+        elif isinstance(node, str) and '$ref:' in node:
+            owned_refs.setdefault(owner, []).extend(extract_references(node))
+    return components, owned_refs
+
+
+def component_name(file_part, path):
+    """Return the display name of a component, in $ref: syntax."""
+    return f"{file_part}#/{path}" if path else file_part
+
+
+class ReferenceGraph:
+    """Graph of $ref: references from prompt files to components.
+    
+    Each distinct reference is validated and resolved once against the
+    shared ComponentIndex. Components that reference other components add
+    edges between components, which is where cycles can form.
+    """
+    
+    def __init__(self, index, component_files=()):
+        self.index = index
+        self.component_files = list(component_files)
+        # source -> [(line, ref)]
+        self.sources = {}
+        self.files = {}
+        self.targets = {}
+    
+    def add_source(self, source, references):
+        """Record the (line, ref) pairs found in one prompt file."""
+        if references:
+            self.sources.setdefault(source, []).extend(references)
+    
+    def component_file(self, file_part):
+        """Return (components, owned refs) for a component file, indexing it once."""
+        entry = self.files.get(file_part)
+        if entry is None:
+            data, paths, error = self.index.load(file_part)
+            entry = index_components(data) if error is None else (set(), {})
+            self.files[file_part] = entry
+        return entry
+    
+    def resolve(self, ref):
+        """Return (valid, message, components the reference uses), memoized per ref."""
+        entry = self.targets.get(ref)
+        if entry is None:
+            valid, message = self.index.validate(ref)
+            used = ()
+            if valid:
+                file_part, path_part = parse_reference(ref)
+                components, _ = self.component_file(file_part)
+                used = tuple(component_name(file_part, path)
+                             for path in self._covering(components, (path_part or '').strip('/')))
+            entry = (valid, message, used)
+            self.targets[ref] = entry
+        return entry
+    
+    @staticmethod
+    def _covering(components, target):
+        """Return the components a reference to target pulls in."""
+        if not target:
+            return sorted(components)
+        parts = target.split('/')
+        for i in range(len(parts), 0, -1):
+            prefix = '/'.join(parts[:i])
+            if prefix in components:
+                return [prefix]
+        if '' in components:
+            return ['']
+        return sorted(c for c in components if c.startswith(target + '/'))
+    
+    def analyze(self):
+        """Validate the whole graph and return the report as a dict."""
+        # Component files: the configured ones plus every file a reference
+        # reaches, following references between component files
+        pending = list(self.component_files)
+        for references in self.sources.values():
+            pending.extend(parse_reference(ref)[0] for _, ref in references
+                           if self.resolve(ref)[0])
+        files = []
+        while pending:
+            file_part = pending.pop()
+            if file_part in files:
+                continue
+            files.append(file_part)
+            for refs in self.component_file(file_part)[1].values():
+                pending.extend(parse_reference(ref)[0] for ref in refs if self.resolve(ref)[0])
+        files.sort()
+        component_paths = {os.path.realpath(self.index.base_path / f) for f in files}
+        component_names = {os.path.basename(path) for path in component_paths}
+        
+        broken = []
+        roots = set()
+        sources = 0
+        prompt_refs = []
+        for source, references in self.sources.items():
+            if (os.path.basename(source) in component_names
+                    and os.path.realpath(source) in component_paths):
+                # Checked below as references between components
+                continue
+            sources += 1
+            for line, ref in references:
+                prompt_refs.append(ref)
+                valid, message, used = self.resolve(ref)
+                if valid:
+                    roots.update(used)
+                else:
+                    broken.append({'source': str(source), 'line': line, 'ref': ref,
+                                   'message': message})
+        
+        all_components = set()
+        edges = {}
+        for file_part in files:
+            components, owned_refs = self.component_file(file_part)
+            all_components.update(component_name(file_part, path) for path in components)
+            for owner, refs in owned_refs.items():
+                owner_name = component_name(file_part, owner) if owner is not None else None
+                for ref in refs:
+                    valid, message, used = self.resolve(ref)
+                    if not valid:
+                        broken.append({'source': owner_name or file_part, 'line': None,
+                                       'ref': ref, 'message': message})
+                    elif owner_name is None:
+                        # Outside any component: always in effect
+                        roots.update(used)
+                    else:
+                        edges.setdefault(owner_name, set()).update(used)
+        
+        # Everything reachable from the prompt files is in use
+        reachable = set(roots)
+        stack = list(roots)
+        while stack:
+            for target in edges.get(stack.pop(), ()):
+                if target not in reachable:
+                    reachable.add(target)
+                    stack.append(target)
+        
+        return {
+            'files_with_references': sources,
+            'references': len(prompt_refs),
+            'unique_references': len(set(prompt_refs)),
+            'component_files': files,
+            'components': len(all_components),
+            'broken': broken,
+            'cycles': find_cycles(edges),
+            'unused': sorted(all_components - reachable),
+        }
+
+
+def find_cycles(edges):
+    """Return one cycle (a closed list of nodes) per strongly connected group.
+    
+    Uses an iterative Tarjan's algorithm, so long reference chains do not
+    hit the recursion limit.
+    """
+    index_of = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    groups = []
+    counter = 0
+    
+    for start in sorted(edges):
+        if start in index_of:
+            continue
+        work = [(start, iter(sorted(edges.get(start, ()))))]
+        index_of[start] = lowlink[start] = counter
+        counter += 1
+        stack.append(start)
+        on_stack.add(start)
+        while work:
+            node, neighbours = work[-1]
+            advanced = False
+            for target in neighbours:
+                if target not in index_of:
+                    index_of[target] = lowlink[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(sorted(edges.get(target, ())))))
+                    advanced = True
+                    break
+                if target in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[target])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index_of[node]:
+                group = set()
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    group.add(member)
+                    if member == node:
+                        break
+                if len(group) > 1 or node in edges.get(node, ()):
+                    groups.append(group)
+    
+    return sorted(_cycle_path(group, edges) for group in groups)
+
+
+def _cycle_path(group, edges):
+    """Return a closed path through a strongly connected group of nodes."""
+    start = min(group)
+    parents = {start: None}
+    queue = [start]
+    for node in queue:
+        for target in sorted(edges.get(node, ())):
+            if target == start:
+                path = [node]
+                while parents[path[-1]] is not None:
+                    path.append(parents[path[-1]])
+                return list(reversed(path)) + [start]
+            if target in group and target not in parents:
+                parents[target] = node
+                queue.append(target)
+    return [start, start]
+
+
+def validate_tree(root, setup_path, component_files, exclude=(), jobs=1):
+    """Scan every prompt file under root and validate references as a graph."""
+    start = time.perf_counter()
+    with profiling.phase('discover'):
+        paths = list(discover_prompt_files(root, exclude))
+    
+    graph = ReferenceGraph(ComponentIndex(setup_path), component_files)
+    read_errors = []
+    with profiling.phase('scan'):
+        scanned = scan_files(paths, jobs)
+    for path, references, error in scanned:
+        if error:
+            read_errors.append({'source': path, 'message': error})
+        graph.add_source(path, references)
+    
+    with profiling.phase('analyze'):
+        report = graph.analyze()
+    report['files_scanned'] = len(paths)
+    report['read_errors'] = read_errors
+    report['seconds'] = round(time.perf_counter() - start, 3)
+    return report
+
+
+def print_tree_report(report):
+    """Print a tree-mode report as text."""
+    print("=" * 60)
+    print("REFERENCE GRAPH REPORT")
+    print("=" * 60)
+    print(f"Files scanned: {report['files_scanned']} "
+          f"({report['files_with_references']} with references) in {report['seconds']:.3f}s")
+    print(f"References: {report['references']} ({report['unique_references']} unique)")
+    print(f"Components: {report['components']} in {', '.join(report['component_files']) or 'no files'}")
+    
+    print(f"\nBroken references: {len(report['broken'])}")
+    for entry in report['broken']:
+        location = entry['source'] if entry['line'] is None else f"{entry['source']}:{entry['line']}"
+        print(f"  ✗ {location}: {entry['ref']}: {entry['message']}")
+    
+    print(f"\nReference cycles: {len(report['cycles'])}")
+    for cycle in report['cycles']:
+        print(f"  ✗ {' -> '.join(cycle)}")
+    
+    print(f"\nUnused components: {len(report['unused'])}")
+    for name in report['unused']:
+        print(f"  - {name}")
+    
+    if report['read_errors']:
+        print(f"\nUnreadable files: {len(report['read_errors'])}")
+        for entry in report['read_errors']:
+            print(f"  - {entry['source']}: {entry['message']}")
+    print("=" * 60)
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.validate_refs."""
+    if args.tree:
+        root = Path(args.tree)
+        if not root.is_dir():
+            print(f"Error: {root} is not a directory")
+            sys.exit(1)
+        
+        report = validate_tree(root, SETUP_DIR, args.components, args.exclude, args.jobs)
+        if args.format == 'json':
+            print(json.dumps(report, indent=2))
+        else:
+            print_tree_report(report)
+        if report['broken'] or report['cycles']:
+            sys.exit(1)
+        return
+    
+    index = ComponentIndex(SETUP_DIR)
+    all_valid = True
+    
+    for prompt_file in args.files:
+        if not validate_prompt_file(Path(prompt_file), SETUP_DIR, index):
+            all_valid = False
+    
+    if all_valid:
+        print("\nAll references are valid!")
+    else:
+        print("\nSome references are invalid.")
+        sys.exit(1)
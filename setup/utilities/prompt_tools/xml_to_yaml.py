@@ -0,0 +1,745 @@
+"""
+XML to YAML Converter
+
+Convert XML structured prompts to YAML format while preserving all content and structure.
+Handles nested elements properly and maintains formatting.
+
+Usage:
+    python xml-to-yaml.py <xml_file> [output_file]
+    python xml-to-yaml.py <directory> --batch
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Union, Any, Tuple, TextIO
+import re
+
+from xml.etree import ElementTree as ET
+
+import yaml
+
+from . import profiling
+from . import yaml_io
+from .discovery import walk_files
+from .files import atomic_output, write_artifact
+
+# Bump whenever the YAML produced for the same XML changes, so that
+# incremental runs reconvert outputs written by an older converter.
+CONVERTER_VERSION = '1.1'
+
+
+def file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with profiling.phase('hash'), open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+            profiling.count('bytes_hashed', len(chunk))
+    return digest.hexdigest()
+
+
+def read_metadata_header(yaml_path: Path, max_lines: int = 50) -> Optional[Dict]:
+    """Parse only the leading ``_metadata`` block of a converted YAML file.
+    
+    Lines are read up to the first top-level key after the block, so the
+    cost does not depend on the size of the document. Returns None when the
+    file is missing, unreadable or does not start with the block.
+    """
+    lines = []
+    try:
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not lines:
+                    if not line.startswith('_metadata:'):
+                        return None
+                elif line[:1] not in (' ', '\n'):
+                    break
+                lines.append(line)
+                if len(lines) > max_lines:
+                    return None
+    except (OSError, UnicodeDecodeError):
+        return None
+    
+    try:
+        header = yaml_io.safe_load(''.join(lines))
+    except yaml.YAMLError:
+        return None
+    metadata = header.get('_metadata') if isinstance(header, dict) else None
+    return metadata if isinstance(metadata, dict) else None
+
+
+def _convert_task(task: Tuple[str, str, bool, bool, bool, bool]) -> Tuple[str, str, int, bool, str]:
+    """Convert one file in a worker process.
+    
+    Returns (xml_path, yaml_path, source_bytes, skipped, error); skipped is
+    True when incremental mode found the output up to date, and error is
+    None on success.
+    """
+    xml_path, yaml_path, preserve_order, preserve_comments, stream, incremental = task
+    converter = XMLToYAMLConverter(preserve_order=preserve_order,
+                                   preserve_comments=preserve_comments)
+    try:
+        size = os.path.getsize(xml_path)
+        source_sha256 = file_sha256(Path(xml_path))
+        if incremental and converter.is_up_to_date(Path(yaml_path), source_sha256):
+            profiling.count('up_to_date_skips')
+            return xml_path, yaml_path, size, True, None
+        Path(yaml_path).parent.mkdir(parents=True, exist_ok=True)
+        if stream:
+            converter.convert_file_streaming(Path(xml_path), Path(yaml_path), source_sha256)
+        else:
+            converter.convert_file(Path(xml_path), Path(yaml_path), source_sha256)
+        return xml_path, yaml_path, size, False, None
+    except Exception as e:
+        return xml_path, yaml_path, 0, False, str(e)
+
+
+class XMLToYAMLConverter:
+    """Convert XML documents to YAML format."""
+    
+    def __init__(self, preserve_order: bool = True, preserve_comments: bool = True):
+        """Initialize converter with options."""
+        self.preserve_order = preserve_order
+        self.preserve_comments = preserve_comments
+        self.comment_pattern = re.compile(r'<!--(.*?)-->', re.DOTALL)
+    
+    def extract_comments(self, xml_content: str) -> List[Tuple[str, str]]:
+        """Extract comments from XML content."""
+        comments = []
+        for match in self.comment_pattern.finditer(xml_content):
+            comment_text = match.group(1).strip()
+            comments.append((match.start(), comment_text))
+        return comments
+    
+    def xml_to_dict(self, element: ET.Element) -> Union[Dict, str, List]:
+        """Convert XML element to dictionary structure.
+        
+        This is the raw, recursive form (with ``@attributes``/``@text``/
+        ``@tail`` keys). The converters use element_to_yaml() instead.
+        """
+        result = {}
+        
+        # Handle attributes
+        if element.attrib:
+            result['@attributes'] = dict(element.attrib)
+        
+        # Handle text content
+        if element.text and element.text.strip():
+            text = element.text.strip()
+            if len(element) == 0 and not element.attrib:
+                # Leaf node with only text
+                return text
+            else:
+                result['@text'] = text
+        
+        # Handle child elements
+        children = {}
+        for child in element:
+            child_data = self.xml_to_dict(child)
+            
+            if child.tag in children:
+                # Multiple children with same tag - convert to list
+                if not isinstance(children[child.tag], list):
+                    children[child.tag] = [children[child.tag]]
+                children[child.tag].append(child_data)
+            else:
+                children[child.tag] = child_data
+            
+            # Handle tail text (text after child element)
+            if child.tail and child.tail.strip():
+                if '@tail' not in result:
+                    result['@tail'] = []
+                result['@tail'].append({
+                    'after': child.tag,
+                    'text': child.tail.strip()
+                })
+        
+        # Merge children into result
+        result.update(children)
+        
+        # Simplify if only text content
+        if len(result) == 1 and '@text' in result:
+            return result['@text']
+        
+        return result if result else None
+    
+    def clean_yaml_structure(self, data: Any) -> Any:
+        """Clean up the YAML structure for better readability."""
+        if isinstance(data, dict):
+            cleaned = {}
+            
+            # Handle special keys
+            text_content = data.get('@text', '')
+            attributes = data.get('@attributes', {})
+            tail_content = data.get('@tail', [])
+            
+            # Remove special keys from main dict
+            regular_keys = {k: v for k, v in data.items() 
+                          if not k.startswith('@')}
+            
+            # Restructure based on content
+            if attributes:
+                cleaned['attributes'] = attributes
+            
+            if text_content and regular_keys:
+                cleaned['content'] = text_content
+            elif text_content and not regular_keys:
+                return text_content
+            
+            # Process regular keys
+            for key, value in regular_keys.items():
+                cleaned[key] = self.clean_yaml_structure(value)
+            
+            if tail_content:
+                cleaned['tail_text'] = tail_content
+            
+            return cleaned if cleaned else None
+        
+        elif isinstance(data, list):
+            return [self.clean_yaml_structure(item) for item in data]
+        
+        else:
+            return data
+    
+    def element_to_yaml(self, element: ET.Element) -> Any:
+        """Convert an element straight to its cleaned YAML structure.
+        
+        Gives the same result as clean_yaml_structure(xml_to_dict(element)),
+        but in one traversal with an explicit stack, so there is no limit on
+        nesting depth and no intermediate ``@``-keyed copy. Each element with
+        children gets its dict when its parent is visited. The dict is linked
+        into the parent straight away and filled when the element is popped.
+        """
+        if len(element) == 0:
+            return self._leaf_to_yaml(element)
+        
+        result = {}
+        stack = [(element, result)]
+        while stack:
+            elem, cleaned = stack.pop()
+            
+            if elem.attrib:
+                cleaned['attributes'] = dict(elem.attrib)
+            if elem.text and elem.text.strip():
+                cleaned['content'] = elem.text.strip()
+            
+            children = {}
+            tails = []
+            for child in elem:
+                if len(child) == 0:
+                    value = self._leaf_to_yaml(child)
+                else:
+                    value = {}
+                    stack.append((child, value))
+                
+                if child.tag in children:
+                    # Multiple children with same tag - convert to list
+                    if not isinstance(children[child.tag], list):
+                        children[child.tag] = [children[child.tag]]
+                    children[child.tag].append(value)
+                else:
+                    children[child.tag] = value
+                
+                if child.tail and child.tail.strip():
+                    tails.append({'after': child.tag, 'text': child.tail.strip()})
+            
+            cleaned.update(children)
+            if tails:
+                cleaned['tail_text'] = tails
+        
+        return result
+    
+    def _leaf_to_yaml(self, element: ET.Element) -> Any:
+        """Return the cleaned YAML value of an element without children."""
+        if element.text and element.text.strip():
+            # Text wins over attributes, as in clean_yaml_structure()
+            return element.text.strip()
+        if element.attrib:
+            return {'attributes': dict(element.attrib)}
+        return None
+    
+    def build_metadata(self, xml_path: Path, source_sha256: str = None) -> Dict[str, Any]:
+        """Return the ``_metadata`` block recorded at the top of every output."""
+        return {
+            'source': str(xml_path),
+            'converter': 'xml-to-yaml.py',
+            'version': CONVERTER_VERSION,
+            'source_sha256': source_sha256 or file_sha256(xml_path),
+            'options': self.options(),
+        }
+    
+    def options(self) -> Dict[str, bool]:
+        """Return the options that affect the YAML produced."""
+        return {
+            'preserve_order': self.preserve_order,
+            'preserve_comments': self.preserve_comments,
+        }
+    
+    def is_up_to_date(self, yaml_path: Path, source_sha256: str) -> bool:
+        """Check whether yaml_path was converted from this exact source.
+        
+        Only the output's ``_metadata`` header is read; the output is current
+        when it records the same source hash, converter version and options.
+        """
+        metadata = read_metadata_header(yaml_path)
+        return (metadata is not None
+                and metadata.get('source_sha256') == source_sha256
+                and metadata.get('version') == CONVERTER_VERSION
+                and metadata.get('options') == self.options())
+    
+    def convert_file(self, xml_path: Path, yaml_path: Path = None,
+                     source_sha256: str = None) -> Dict:
+        """Convert XML file to YAML format.
+        
+        source_sha256 may be passed when the caller has already hashed the
+        source; otherwise it is computed here.
+        """
+        try:
+            # Read XML content
+            with profiling.phase('read'), open(xml_path, 'r', encoding='utf-8') as f:
+                xml_content = f.read()
+            profiling.count('files_read')
+            profiling.count('bytes_read', len(xml_content))
+            
+            # Extract comments if preserving
+            comments = []
+            if self.preserve_comments:
+                comments = self.extract_comments(xml_content)
+            
+            # Parse XML
+            with profiling.phase('parse'):
+                root = ET.fromstring(xml_content)
+            
+            # Convert to the cleaned structure in one pass
+            with profiling.phase('convert'):
+                cleaned_data = {root.tag: self.element_to_yaml(root)}
+            
+            # Add metadata
+            result = {
+                '_metadata': self.build_metadata(xml_path, source_sha256)
+            }
+            
+            if comments:
+                result['_comments'] = [c[1] for c in comments]
+            
+            result.update(cleaned_data)
+            
+            # Write YAML if output path provided. The metadata is dumped on
+            # its own first, so it heads the file even when keys are sorted
+            # and read_metadata_header() can find it without a full parse.
+            if yaml_path:
+                with profiling.phase('write'):
+                    text = self.dump_yaml({'_metadata': result['_metadata']})
+                    body = {k: v for k, v in result.items() if k != '_metadata'}
+                    if body:
+                        text += self.dump_yaml(body)
+                    write_artifact(yaml_path, text)
+            
+            return result
+        
+        except ET.ParseError as e:
+            raise ValueError(f"Invalid XML in {xml_path}: {e}")
+        except Exception as e:
+            raise RuntimeError(f"Error converting {xml_path}: {e}")
+    
+    def dump_yaml(self, data: Any, stream: TextIO = None, indent: int = 0):
+        """Dump data with the converter's YAML style, optionally indented.
+        
+        Returns the YAML text when no stream is given.
+        """
+        text = yaml_io.dump_block(data,
+                                  sort_keys=not self.preserve_order,
+                                  allow_unicode=True,
+                                  width=80,
+                                  indent=2)
+        if indent:
+            prefix = ' ' * indent
+            text = ''.join(prefix + line if line.strip() else line
+                           for line in text.splitlines(True))
+        if stream is None:
+            return text
+        stream.write(text)
+    
+    def convert_file_streaming(self, xml_path: Path, yaml_path: Path,
+                               source_sha256: str = None) -> Dict[str, int]:
+        """Convert an XML file to YAML with bounded memory.
+        
+        The file is parsed with iterparse, comments are taken from comment
+        events, and each direct child of the root element is converted,
+        written and cleared as soon as it has been parsed. Memory use is
+        bounded by the largest child of the root rather than by the file.
+        
+        The output matches convert_file() except that ``_comments`` is
+        written after the document instead of before it. Repeated sibling
+        tags under the root must be adjacent, since a run of them is written
+        as a YAML list as it arrives; a tag that reappears later raises
+        ValueError.
+        
+        Returns conversion statistics.
+        """
+        stats = {'elements': 0, 'root_children': 0, 'comments': 0}
+        
+        try:
+            with profiling.phase('convert'), atomic_output(yaml_path, artifact=True) as out:
+                self.dump_yaml({
+                    '_metadata': self.build_metadata(xml_path, source_sha256)
+                }, out)
+                
+                emitter = _RootChildEmitter(self, out)
+                comments = _YAMLListSpool(self, '_comments')
+                root = None
+                previous = None
+                depth = 0
+                
+                for event, elem in ET.iterparse(str(xml_path), events=('start', 'end', 'comment')):
+                    if event == 'comment':
+                        if self.preserve_comments:
+                            comments.add(elem.text.strip())
+                        continue
+                    
+                    if event == 'start':
+                        depth += 1
+                        stats['elements'] += 1
+                        if depth == 1:
+                            root = elem
+                        elif depth == 2:
+                            if previous is None:
+                                # The root's own text is known once its first child starts
+                                emitter.open_root(root)
+                            else:
+                                emitter.add_tail(previous)
+                                root.remove(previous)
+                                previous = None
+                        continue
+                    
+                    depth -= 1
+                    if depth == 1:
+                        # A direct child of the root is complete: write it, then
+                        # drop its subtree. The element itself stays until the
+                        # next sibling starts so its tail text can be read.
+                        emitter.add_child(elem.tag, self.element_to_yaml(elem))
+                        stats['root_children'] += 1
+                        del elem[:]
+                        elem.attrib.clear()
+                        elem.text = None
+                        previous = elem
+                
+                if root is None:
+                    raise ValueError("No root element")
+                
+                if previous is not None:
+                    emitter.add_tail(previous)
+                    root.remove(previous)
+                    emitter.close_root()
+                else:
+                    # Childless root: the whole document is one small element
+                    self.dump_yaml({root.tag: self.element_to_yaml(root)}, out)
+                
+                stats['comments'] = comments.count
+                comments.write_to(out)
+            
+            return stats
+        
+        except ET.ParseError as e:
+            raise ValueError(f"Invalid XML in {xml_path}: {e}")
+        except ValueError as e:
+            raise ValueError(f"Error converting {xml_path}: {e}")
+        except Exception as e:
+            raise RuntimeError(f"Error converting {xml_path}: {e}")
+    
+    def convert_directory(self, directory: Path, output_dir: Path = None,
+                          recursive: bool = False, jobs: int = 1,
+                          stream: bool = False, incremental: bool = False,
+                          exclude: List[str] = ()) -> Dict[str, str]:
+        """Convert all XML files in a directory.
+        
+        With recursive, subdirectories are searched and their layout is
+        mirrored under output_dir; exclude holds .gitignore-style patterns
+        for files and directories to skip. With jobs > 1, files are converted in a
+        process pool. With incremental, files whose output already records
+        the same source hash, converter version and options are skipped.Every output
+        is written atomically, and a failure is recorded against its file
+        without stopping the batch.
+        
+        Returns {xml_path: yaml_path or "ERROR: ..."}.
+        """
+        results = {}
+        with profiling.phase('discover'):
+            xml_files = sorted(Path(p) for p in walk_files(directory, ('.xml',), exclude,
+                                                           recursive=recursive))
+        
+        if not xml_files:
+            print(f"No XML files found in {directory}")
+            return results
+        
+        if output_dir and not output_dir.exists():
+            output_dir.mkdir(parents=True)
+        
+        tasks = []
+        for xml_file in xml_files:
+            yaml_name = xml_file.stem + '.yaml'
+            if output_dir:
+                yaml_path = output_dir / xml_file.relative_to(directory).parent / yaml_name
+            else:
+                yaml_path = xml_file.parent / yaml_name
+            tasks.append((str(xml_file), str(yaml_path), self.preserve_order,
+                          self.preserve_comments, stream, incremental))
+        
+        start = time.perf_counter()
+        total_bytes = 0
+        errors = {}
+        skipped = []
+        
+        def record(outcome):
+            nonlocal total_bytes
+            xml_file, yaml_path, size, was_skipped, error = outcome
+            if error:
+                print(f"Error converting {xml_file}: {error}")
+                results[xml_file] = f"ERROR: {error}"
+                errors[xml_file] = error
+            elif was_skipped:
+                print(f"Up to date: {xml_file} -> {yaml_path}")
+                results[xml_file] = yaml_path
+                skipped.append(xml_file)
+            else:
+                print(f"Converted: {xml_file} -> {yaml_path}")
+                results[xml_file] = yaml_path
+                total_bytes += size
+        
+        if jobs > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [executor.submit(_convert_task, task) for task in tasks]
+                for future in as_completed(futures):
+                    record(future.result())
+        else:
+            for task in tasks:
+                record(_convert_task(task))
+        
+        elapsed = time.perf_counter() - start
+        converted = len(tasks) - len(errors) - len(skipped)
+        print("\n" + "=" * 60)
+        print("BATCH CONVERSION SUMMARY")
+        print("=" * 60)
+        print(f"Converted: {converted}/{len(tasks)} files with {max(jobs, 1)} job(s) "
+              f"in {elapsed:.2f}s")
+        if incremental:
+            print(f"Skipped (up to date): {len(skipped)} file(s)")
+        if elapsed > 0:
+            print(f"Throughput: {converted / elapsed:.1f} files/sec, "
+                  f"{total_bytes / (1024 * 1024) / elapsed:.2f} MB/sec")
+        if errors:
+            print(f"Failed: {len(errors)} file(s)")
+            for xml_file, error in sorted(errors.items()):
+                print(f"  - {xml_file}: {error}")
+        print("=" * 60)
+        
+        return results
+
+
+class _YAMLListSpool:
+    """Collect a YAML list item by item in a temporary file.
+    
+    Items are rendered as they arrive, so neither the items nor a node tree
+    for the whole list is held in memory; write_to() copies the rendered
+    list into the output under its key.
+    """
+    
+    def __init__(self, converter: XMLToYAMLConverter, key: str, indent: int = 0):
+        self.converter = converter
+        self.key = key
+        self.indent = indent
+        self.count = 0
+        self.spool = tempfile.TemporaryFile('w+', encoding='utf-8')
+    
+    def add(self, item: Any):
+        """Render one list item into the spool."""
+        self.converter.dump_yaml([item], self.spool, indent=self.indent)
+        self.count += 1
+    
+    def write_to(self, stream: TextIO):
+        """Write the collected list (if any) to stream and release the spool."""
+        try:
+            if self.count:
+                stream.write(' ' * self.indent + f"{self.key}:\n")
+                self.spool.seek(0)
+                shutil.copyfileobj(self.spool, stream)
+        finally:
+            self.spool.close()
+
+
+class _RootChildEmitter:
+    """Write the root element's converted children as they arrive.
+    
+    Mirrors the layout clean_yaml_structure() gives the root (attributes,
+    content, children, tail_text) while holding at most one converted child:
+    a child is kept back only until the next sibling shows whether it starts
+    a run of same-tag siblings, which is then written as a YAML list.
+    """
+    
+    def __init__(self, converter: XMLToYAMLConverter, stream: TextIO):
+        self.converter = converter
+        self.stream = stream
+        self.run_tag = None
+        self.held = None
+        self.run_length = 0
+        self.written_tags = set()
+        self.tails = _YAMLListSpool(converter, 'tail_text', indent=2)
+    
+    def open_root(self, root: ET.Element):
+        """Write the root key with its attributes and leading text."""
+        # Dump the key through YAML so namespaced tags are quoted correctly
+        key = self.converter.dump_yaml({root.tag: None}).rstrip('\n')[:-len(' null')]
+        self.stream.write(f"{key}\n")
+        head = {}
+        if root.attrib:
+            head['attributes'] = dict(root.attrib)
+        if root.text and root.text.strip():
+            head['content'] = root.text.strip()
+        if head:
+            self.converter.dump_yaml(head, self.stream, indent=2)
+    
+    def add_child(self, tag: str, value: Any):
+        """Write (or hold back) one converted child of the root."""
+        if tag == self.run_tag:
+            if self.run_length == 1:
+                self.converter.dump_yaml({tag: [self.held]}, self.stream, indent=2)
+                self.held = None
+            self.converter.dump_yaml([value], self.stream, indent=2)
+            self.run_length += 1
+        else:
+            self.flush()
+            if tag in self.written_tags:
+                raise ValueError(
+                    f"Element <{tag}> repeats non-adjacently under the root; "
+                    "use the default (non-streaming) mode for this file"
+                )
+            self.run_tag = tag
+            self.held = value
+            self.run_length = 1
+    
+    def add_tail(self, child: ET.Element):
+        """Record text that follows a child of the root."""
+        if child.tail and child.tail.strip():
+            self.tails.add({'after': child.tag, 'text': child.tail.strip()})
+    
+    def flush(self):
+        """Write a held single child as a plain mapping entry."""
+        if self.run_length == 1:
+            self.converter.dump_yaml({self.run_tag: self.held}, self.stream, indent=2)
+            self.held = None
+        if self.run_tag is not None:
+            self.written_tags.add(self.run_tag)
+        self.run_tag = None
+        self.run_length = 0
+    
+    def close_root(self):
+        """Flush the last child and write any collected tail text."""
+        self.flush()
+        self.tails.write_to(self.stream)
+
+
+def create_sample_xml():
+    """Create a sample XML file for testing."""
+    sample = """<?xml version="1.0" encoding="UTF-8"?>
+<!-- Sample prompt structure -->
+<prompt version="1.0">
+    <metadata>
+        <author>System</author>
+        <date>2024-01-01</date>
+        <tags>
+            <tag>example</tag>
+            <tag>template</tag>
+        </tags>
+    </metadata>
+    <content>
+        <section name="introduction">
+            <text>This is an example prompt structure.</text>
+            <note importance="high">Pay attention to formatting</note>
+        </section>
+        <section name="instructions">
+            <instruction>Step 1: Read the input</instruction>
+            <instruction>Step 2: Process the data</instruction>
+            <instruction>Step 3: Generate output</instruction>
+        </section>
+    </content>
+</prompt>"""
+    return sample
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.xml_to_yaml."""
+    # Handle sample creation
+    if args.sample:
+        sample_path = Path('sample_prompt.xml')
+        with open(sample_path, 'w', encoding='utf-8') as f:
+            f.write(create_sample_xml())
+        print(f"Sample XML file created: {sample_path}")
+        return
+    
+    input_path = Path(args.input_path)
+    if not input_path.exists():
+        print(f"Error: {input_path} does not exist")
+        sys.exit(1)
+    
+    # Initialize converter
+    converter = XMLToYAMLConverter(
+        preserve_order=not args.no_preserve_order,
+        preserve_comments=not args.no_comments
+    )
+    
+    # Handle batch conversion
+    if args.batch or input_path.is_dir():
+        if not input_path.is_dir():
+            print("Error: Batch mode requires a directory path")
+            sys.exit(1)
+        
+        output_dir = Path(args.output) if args.output else None
+        results = converter.convert_directory(
+            input_path, output_dir,
+            recursive=args.recursive,
+            jobs=args.jobs,
+            stream=args.stream,
+            incremental=args.incremental,
+            exclude=args.exclude
+        )
+        
+        failed = sum(1 for value in results.values() if value.startswith('ERROR:'))
+        print(f"\nConversion complete: {len(results)} files processed")
+        if failed:
+            sys.exit(1)
+    
+    # Handle single file conversion
+    else:
+        output_path = Path(args.output_path) if args.output_path else None
+        if not output_path:
+            output_path = input_path.with_suffix('.yaml')
+        
+        try:
+            source_sha256 = file_sha256(input_path)
+            if args.incremental and converter.is_up_to_date(output_path, source_sha256):
+                print(f"Up to date: {input_path} -> {output_path}")
+                return
+            
+            if args.stream:
+                stats = converter.convert_file_streaming(input_path, output_path, source_sha256)
+                print(f"Converted: {input_path} -> {output_path} "
+                      f"({stats['elements']:,} elements, streamed)")
+                return
+            
+            result = converter.convert_file(input_path, output_path, source_sha256)
+            print(f"Converted: {input_path} -> {output_path}")
+            
+            if args.pretty:
+                print("\nYAML Output:")
+                print("-" * 60)
+                print(yaml_io.safe_dump(result, default_flow_style=False, width=80))
+        
+        except Exception as e:
+            print(f"Error: {e}")
+            sys.exit(1)
@@ -0,0 +1,142 @@
+"""
+YAML I/O
+
+Shared YAML loading and dumping for all utilities. When PyYAML was built
+against libyaml, the C implementations (CSafeLoader / CSafeDumper) are used;
+otherwise the pure-Python SafeLoader / SafeDumper are used. Both produce the
+same data, node marks and output text for mappings and sequences, so callers
+never need to care which one is active; only a document that is a single
+plain scalar differs, ending with '...' in pure Python.
+
+Set PROMPT_TOOLS_PURE_YAML=1 in the environment to force the pure-Python
+implementation (useful when comparing behaviour or timings).
+"""
+
+import itertools
+import os
+from typing import Any, Iterator, Optional
+
+import yaml
+
+from . import profiling
+
+LIBYAML_AVAILABLE = hasattr(yaml, 'CSafeLoader') and hasattr(yaml, 'CSafeDumper')
+
+SafeLoader = yaml.SafeLoader
+SafeDumper = yaml.SafeDumper
+LIBYAML = False
+
+
+def use_libyaml(enabled: bool = True) -> bool:
+    """Select the C (libyaml) or pure-Python loader and dumper.
+    
+    Returns whether libyaml is in use afterwards; asking for it when PyYAML
+    was built without libyaml falls back to pure Python.
+    """
+    global SafeLoader, SafeDumper, LIBYAML
+    LIBYAML = enabled and LIBYAML_AVAILABLE
+    if LIBYAML:
+        SafeLoader, SafeDumper = yaml.CSafeLoader, yaml.CSafeDumper
+    else:
+        SafeLoader, SafeDumper = yaml.SafeLoader, yaml.SafeDumper
+    return LIBYAML
+
+
+use_libyaml(not os.environ.get('PROMPT_TOOLS_PURE_YAML'))
+
+
+def safe_load(stream) -> Any:
+    """Load a YAML document from a string or file object."""
+    with profiling.phase('parse'):
+        return yaml.load(stream, Loader=SafeLoader)
+
+
+def compose(stream) -> Optional[yaml.Node]:
+    """Compose a YAML document into its node tree (None if empty)."""
+    with profiling.phase('parse'):
+        return yaml.compose(stream, Loader=SafeLoader)
+
+
+def construct(node: Optional[yaml.Node]) -> Any:
+    """Build plain Python data from a composed node tree."""
+    if node is None:
+        return None
+    loader = SafeLoader('')
+    try:
+        with profiling.phase('parse'):
+            return loader.construct_document(node)
+    finally:
+        loader.dispose()
+
+
+def safe_dump(data: Any, stream=None, **kwargs) -> Optional[str]:
+    """Dump data as YAML; returns the text when no stream is given."""
+    with profiling.phase('dump'):
+        return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def iter_block_events(data: Any, sort_keys: bool = True) -> Iterator[yaml.Event]:
+    """Yield the YAML events for data in block style, using an explicit stack.
+    
+    PyYAML's representer and serializer recurse once or more per nesting
+    level, so dumping data nested a few hundred levels deep raises
+    RecursionError. This walk produces the same events without recursion.
+    Scalars still go through SafeRepresenter, so tags and quoting match
+    safe_dump(). Data must be tree-shaped: a container reached twice is
+    written twice rather than as an anchor and alias.
+    """
+    representer = yaml.representer.SafeRepresenter(default_flow_style=False,
+                                                   sort_keys=sort_keys)
+    resolver = yaml.resolver.Resolver()
+    
+    yield yaml.StreamStartEvent()
+    yield yaml.DocumentStartEvent(explicit=False)
+    
+    # Each level holds an iterator over the values still to emit and the
+    # event that closes it
+    stack = [(iter([data]), None)]
+    while stack:
+        values, end_event = stack[-1]
+        for value in values:
+            if isinstance(value, dict):
+                items = value.items()
+                if sort_keys:
+                    try:
+                        items = sorted(items)
+                    except TypeError:
+                        pass
+                yield yaml.MappingStartEvent(None, yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
+                                             True, flow_style=False)
+                stack.append((itertools.chain.from_iterable(items), yaml.MappingEndEvent()))
+                break
+            if isinstance(value, list):
+                yield yaml.SequenceStartEvent(None, yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG,
+                                              True, flow_style=False)
+                stack.append((iter(value), yaml.SequenceEndEvent()))
+                break
+            node = representer.represent_data(value)
+            implicit = (node.tag == resolver.resolve(yaml.ScalarNode, node.value, (True, False)),
+                        node.tag == resolver.resolve(yaml.ScalarNode, node.value, (False, True)))
+            yield yaml.ScalarEvent(None, node.tag, implicit, node.value, style=node.style)
+        else:
+            stack.pop()
+            if end_event is not None:
+                yield end_event
+    
+    yield yaml.DocumentEndEvent(explicit=False)
+    yield yaml.StreamEndEvent()
+
+
+def dump_block(data: Any, stream=None, sort_keys: bool = True, **kwargs) -> Optional[str]:
+    """Dump data in block style with no limit on nesting depth.
+    
+    Writes the same text as safe_dump(data, default_flow_style=False,
+    sort_keys=sort_keys, **kwargs) for a tree-shaped mapping or sequence.
+    A scalar at the root is written as safe_dump() writes it with the
+    active implementation, so a plain one ends with a '...' line in pure
+    Python and without it under libyaml. kwargs are emitter options
+    (indent, width, allow_unicode, line_break, canonical). Returns the text
+    when no stream is given.
+    """
+    with profiling.phase('dump'):
+        return yaml.emit(iter_block_events(data, sort_keys), stream, Dumper=SafeDumper, **kwargs)
@@ -0,0 +1,107 @@
+"""
+YAML Node Helpers
+
+Compose a YAML document into its node tree once and reuse it. The node tree
+carries start/end marks for every key and value, so the same parse serves
+both structure validation (by constructing plain Python data from the nodes)
+and exact line/column reporting, without re-reading or re-scanning the text.
+"""
+
+import bisect
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+from . import yaml_io
+
+
+def compose_document(content: str) -> Optional[yaml.Node]:
+    """Compose content into a node tree (None for an empty document).
+    
+    Raises yaml.YAMLError on invalid syntax.
+    """
+    return yaml_io.compose(content)
+
+
+def construct_document(node: Optional[yaml.Node]) -> Any:
+    """Build plain Python data from a composed node tree."""
+    return yaml_io.construct(node)
+
+
+def mark_location(mark) -> Dict[str, int]:
+    """Return 1-based line/column keyword arguments for a YAML mark."""
+    return {'line': mark.line + 1, 'column': mark.column + 1}
+
+
+def mapping_items(node: yaml.Node) -> Dict[str, Tuple[yaml.Node, yaml.Node]]:
+    """Return {key: (key_node, value_node)} for a mapping node's scalar keys."""
+    items = {}
+    if isinstance(node, yaml.MappingNode):
+        for key_node, value_node in node.value:
+            if isinstance(key_node, yaml.ScalarNode):
+                items[key_node.value] = (key_node, value_node)
+    return items
+
+
+class ScalarSpanIndex:
+    """Map source offsets to the scalar node (and its path) that contains them.
+    
+    Built with one walk over the node tree; lookups are a bisect over the
+    scalars' start offsets.
+    """
+    
+    def __init__(self, root: Optional[yaml.Node]):
+        self.starts = []
+        self.spans = []
+        
+        stack = [(root, '')] if root is not None else []
+        seen = set()
+        while stack:
+            node, path = stack.pop()
+            if id(node) in seen:
+                # Aliases share nodes; each node is indexed once
+                continue
+            seen.add(id(node))
+            
+            if isinstance(node, yaml.ScalarNode):
+                self.spans.append((node.start_mark.index, node.end_mark.index, path or '/'))
+            elif isinstance(node, yaml.MappingNode):
+                for key_node, value_node in node.value:
+                    key = key_node.value if isinstance(key_node, yaml.ScalarNode) else '?'
+                    stack.append((value_node, f"{path}/{key}"))
+            elif isinstance(node, yaml.SequenceNode):
+                for i, item in enumerate(node.value):
+                    stack.append((item, f"{path}/{i}"))
+        
+        self.spans.sort()
+        self.starts = [span[0] for span in self.spans]
+    
+    def path_at(self, offset: int) -> Optional[str]:
+        """Return the path of the scalar containing offset, if any."""
+        i = bisect.bisect_right(self.starts, offset) - 1
+        if i >= 0:
+            start, end, path = self.spans[i]
+            if start <= offset < end:
+                return path
+        return None
+
+
+class LineIndex:
+    """Convert character offsets to 1-based (line, column) pairs.
+    
+    Line starts are found once when the index is built; each lookup is a
+    bisect rather than a rescan of the text.
+    """
+    
+    def __init__(self, content: str):
+        self.line_starts = [0]
+        find = content.find
+        pos = find('\n')
+        while pos != -1:
+            self.line_starts.append(pos + 1)
+            pos = find('\n', pos + 1)
+    
+    def location(self, offset: int) -> Dict[str, int]:
+        """Return line/column keyword arguments for an offset."""
+        line = bisect.bisect_right(self.line_starts, offset)
+        return {'line': line, 'column': offset - self.line_starts[line - 1] + 1}
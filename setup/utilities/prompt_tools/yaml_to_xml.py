@@ -0,0 +1,466 @@
+"""
+YAML to XML Converter
+
+Convert YAML produced by xml-to-yaml.py back to XML, and verify that
+conversions are lossless by round-tripping them against the original XML.
+
+Understands the converter's layout (attributes, content, tail_text,
+_comments, _metadata) as well as the raw xml_to_dict form (@attributes,
+@text, @tail).
+
+Usage:
+    python yaml-to-xml.py <yaml_file> [output_file]
+    python yaml-to-xml.py <directory> --batch
+    python yaml-to-xml.py <directory> --verify [--xml-dir <originals>]
+"""
+
+import io
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from xml.etree import ElementTree as ET
+
+import yaml
+
+from . import profiling
+from . import yaml_io
+from .discovery import walk_files
+from .files import write_artifact
+
+METADATA_KEY = '_metadata'
+COMMENTS_KEY = '_comments'
+ATTRIBUTE_KEYS = ('attributes', '@attributes')
+TEXT_KEYS = ('content', '@text')
+TAIL_KEYS = ('tail_text', '@tail')
+
+YAML_EXTENSIONS = ('.yaml', '.yml')
+
+
+class YAMLToXMLConverter:
+    """Convert converted-prompt YAML documents back to XML."""
+    
+    def __init__(self, indent: str = '    '):
+        """Initialize converter with the indent used when writing XML."""
+        self.indent = indent
+    
+    def scalar_text(self, value: Any) -> str:
+        """Return the XML text for a YAML scalar."""
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        return '' if value is None else str(value)
+    
+    def data_to_xml(self, data: Dict) -> Tuple[ET.Element, List[str]]:
+        """Build the XML tree for a loaded YAML document.
+        
+        Returns (root element, comments). ``_metadata`` is dropped; every
+        other top-level key apart from ``_comments`` must be the one root.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Expected a mapping at the top of the document")
+        
+        comments = [self.scalar_text(c) for c in data.get(COMMENTS_KEY) or []]
+        roots = [key for key in data if key not in (METADATA_KEY, COMMENTS_KEY)]
+        if len(roots) != 1:
+            raise ValueError(f"Expected exactly one root element, found {len(roots)}: "
+                             f"{', '.join(map(str, roots))}")
+        
+        return self.value_to_element(str(roots[0]), data[roots[0]]), comments
+    
+    def value_to_element(self, tag: str, value: Any) -> ET.Element:
+        """Build an element (and its subtree) from a YAML value.
+        
+        Uses an explicit stack, so nesting depth is not limited by the
+        recursion limit.
+        """
+        root = ET.Element(tag)
+        stack = [(root, value)]
+        while stack:
+            elem, value = stack.pop()
+            if value is None:
+                continue
+            if not isinstance(value, dict):
+                elem.text = self.scalar_text(value)
+                continue
+            
+            tails = []
+            for key, child_value in value.items():
+                if key in ATTRIBUTE_KEYS and isinstance(child_value, dict):
+                    for name, attr_value in child_value.items():
+                        elem.set(str(name), self.scalar_text(attr_value))
+                elif key in TEXT_KEYS and not isinstance(child_value, (dict, list)):
+                    elem.text = self.scalar_text(child_value)
+                elif key in TAIL_KEYS and isinstance(child_value, list):
+                    tails = child_value
+                else:
+                    # A list under a key is a run of same-tag siblings
+                    items = child_value if isinstance(child_value, list) else [child_value]
+                    for item in items:
+                        stack.append((ET.SubElement(elem, str(key)), item))
+            
+            if tails:
+                self._attach_tails(elem, tails)
+        
+        return root
+    
+    def _attach_tails(self, elem: ET.Element, tails: List[Any]):
+        """Give each recorded tail text to the next child with its tag.
+        
+        The YAML only records which tag a tail followed, so tails are
+        matched to children in document order.
+        """
+        children = list(elem)
+        position = 0
+        for tail in tails:
+            if not isinstance(tail, dict):
+                continue
+            after = str(tail.get('after'))
+            for i in range(position, len(children)):
+                if children[i].tag == after:
+                    children[i].tail = self.scalar_text(tail.get('text'))
+                    position = i + 1
+                    break
+    
+    def write_xml(self, root: ET.Element, comments: List[str], stream: TextIO):
+        """Write the document as indented XML.
+        
+        Comments go before the root element, since the YAML does not record
+        where they were. The tree is written with an explicit stack, so deep
+        documents do not hit the recursion limit.
+        """
+        namespaces = {}
+        for elem in root.iter():
+            for name in [elem.tag, *elem.attrib]:
+                if name.startswith('{'):
+                    uri = name[1:].split('}', 1)[0]
+                    namespaces.setdefault(uri, f"ns{len(namespaces)}")
+        
+        def qualify(name: str) -> str:
+            if name.startswith('{'):
+                uri, local = name[1:].split('}', 1)
+                return f"{namespaces[uri]}:{local}"
+            return name
+        
+        stream.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        for comment in comments:
+            # "--" is not allowed inside an XML comment
+            stream.write(f"<!-- {comment.replace('--', '- -')} -->\n")
+        
+        stack = [(root, 0)]
+        while stack:
+            item, depth = stack.pop()
+            if isinstance(item, str):
+                # A closing tag queued behind the element's children
+                stream.write(item)
+                continue
+            
+            pad = self.indent * depth
+            tag = qualify(item.tag)
+            attributes = ''.join(f" {qualify(name)}={quoteattr(value)}"
+                                 for name, value in item.attrib.items())
+            if depth == 0:
+                attributes += ''.join(f" xmlns:{prefix}={quoteattr(uri)}"
+                                      for uri, prefix in namespaces.items())
+            text = escape(item.text.strip()) if item.text else ''
+            tail = escape(item.tail.strip()) if item.tail and depth else ''
+            
+            if len(item) == 0:
+                if text:
+                    stream.write(f"{pad}<{tag}{attributes}>{text}</{tag}>{tail}\n")
+                else:
+                    stream.write(f"{pad}<{tag}{attributes}/>{tail}\n")
+                continue
+            
+            stream.write(f"{pad}<{tag}{attributes}>{text}\n")
+            stack.append((f"{pad}</{tag}>{tail}\n", depth))
+            stack.extend((child, depth + 1) for child in reversed(item))
+    
+    def to_xml_string(self, data: Dict) -> str:
+        """Return the XML text for a loaded YAML document."""
+        with profiling.phase('convert'):
+            root, comments = self.data_to_xml(data)
+        with profiling.phase('render'):
+            buffer = io.StringIO()
+            self.write_xml(root, comments, buffer)
+            return buffer.getvalue()
+    
+    def convert_file(self, yaml_path: Path, xml_path: Path = None) -> str:
+        """Convert a YAML file to XML, writing it when xml_path is given."""
+        try:
+            with open(yaml_path, 'r', encoding='utf-8') as f:
+                data = yaml_io.safe_load(f)
+            profiling.count('files_read')
+            
+            xml_text = self.to_xml_string(data)
+            if xml_path:
+                with profiling.phase('write'):
+                    write_artifact(xml_path, xml_text)
+            return xml_text
+        
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in {yaml_path}: {e}")
+        except ValueError as e:
+            raise ValueError(f"Error converting {yaml_path}: {e}")
+        except Exception as e:
+            raise RuntimeError(f"Error converting {yaml_path}: {e}")
+
+
+def _normalize(text: Optional[str]) -> str:
+    """Strip text the way xml-to-yaml.py does; None becomes ''."""
+    return text.strip() if text else ''
+
+
+def canonical_events(root: ET.Element) -> List[Tuple]:
+    """Flatten a tree into comparable pre-order entries.
+    
+    Each entry is (depth, path, tag, sorted attributes, text, tail) with text
+    and tails stripped, which is what the YAML conversion preserves. The
+    root's tail lies outside the document and is ignored.
+    """
+    events = []
+    stack = [(root, f"/{root.tag}", 0)]
+    while stack:
+        elem, path, depth = stack.pop()
+        events.append((depth, path, elem.tag, tuple(sorted(elem.attrib.items())),
+                       _normalize(elem.text), _normalize(elem.tail) if depth else ''))
+        
+        counts = {}
+        children = []
+        for child in elem:
+            counts[child.tag] = counts.get(child.tag, 0) + 1
+            children.append((child, f"{path}/{child.tag}[{counts[child.tag]}]", depth + 1))
+        stack.extend(reversed(children))
+    return events
+
+
+def compare_trees(original: ET.Element, rebuilt: ET.Element) -> Optional[str]:
+    """Return a description of the first difference, or None if equivalent."""
+    expected = canonical_events(original)
+    actual = canonical_events(rebuilt)
+    
+    for want, got in zip(expected, actual):
+        if want == got:
+            continue
+        depth, path, tag, attributes, text, tail = want
+        if (depth, path, tag) != got[:3]:
+            return f"Element order or nesting differs at {path}: found {got[1]}"
+        if attributes != got[3]:
+            return (f"Attributes differ at {path}: expected {dict(attributes)}, "
+                    f"found {dict(got[3])}")
+        if text != got[4]:
+            return f"Text differs at {path}: expected {text!r}, found {got[4]!r}"
+        return f"Tail text differs after {path}: expected {tail!r}, found {got[5]!r}"
+    
+    if len(expected) > len(actual):
+        return f"Missing element {expected[len(actual)][1]}"
+    if len(actual) > len(expected):
+        return f"Unexpected element {actual[len(expected)][1]}"
+    return None
+
+
+def parse_original(xml_path: Path) -> Tuple[ET.Element, List[str]]:
+    """Parse an original XML file, returning (root, comments in order)."""
+    comments = []
+    with profiling.phase('parse'):
+        parser = ET.iterparse(str(xml_path), events=('comment',))
+        for _, comment in parser:
+            comments.append(_normalize(comment.text))
+    return parser.root, comments
+
+
+def verify_round_trip(converter: YAMLToXMLConverter, yaml_path: Path,
+                      xml_path: Path = None) -> Tuple[Path, Optional[str]]:
+    """Check that yaml_path converts back to its original XML.
+    
+    The YAML is converted to XML text, reparsed, and compared with the
+    original as canonical trees. Comments are compared in order unless the
+    YAML records that they were not preserved. When xml_path is None it is
+    taken from ``_metadata.source``.
+    
+    Returns (xml_path, mismatch description or None).
+    """
+    with open(yaml_path, 'r', encoding='utf-8') as f:
+        data = yaml_io.safe_load(f)
+    
+    metadata = data.get(METADATA_KEY) if isinstance(data, dict) else None
+    metadata = metadata if isinstance(metadata, dict) else {}
+    if xml_path is None:
+        if not metadata.get('source'):
+            raise ValueError("No _metadata.source recorded; pass --xml-dir")
+        xml_path = Path(metadata['source'])
+    
+    original, original_comments = parse_original(xml_path)
+    xml_text = converter.to_xml_string(data)
+    with profiling.phase('parse'):
+        rebuilt = ET.fromstring(xml_text)
+    
+    with profiling.phase('compare'):
+        mismatch = compare_trees(original, rebuilt)
+    if mismatch is None:
+        options = metadata.get('options')
+        comments_preserved = not (isinstance(options, dict)
+                                  and options.get('preserve_comments') is False)
+        rebuilt_comments = [_normalize(c) for c in (data.get(COMMENTS_KEY) or [])]
+        if comments_preserved and rebuilt_comments != original_comments:
+            mismatch = (f"Comments differ: expected {len(original_comments)}, "
+                        f"found {len(rebuilt_comments)}")
+    
+    return xml_path, mismatch
+
+
+def _verify_task(task: Tuple[str, Optional[str]]) -> Tuple[str, str, Optional[str], Optional[str]]:
+    """Verify one file in a worker process.
+    
+    Returns (yaml_path, xml_path, mismatch, error).
+    """
+    yaml_path, xml_path = task
+    converter = YAMLToXMLConverter()
+    try:
+        xml_path, mismatch = verify_round_trip(converter, Path(yaml_path),
+                                               Path(xml_path) if xml_path else None)
+        return yaml_path, str(xml_path), mismatch, None
+    except Exception as e:
+        return yaml_path, xml_path or '', None, str(e)
+
+
+def _convert_task(task: Tuple[str, str]) -> Tuple[str, str, Optional[str]]:
+    """Convert one file in a worker process. Returns (yaml_path, xml_path, error)."""
+    yaml_path, xml_path = task
+    try:
+        Path(xml_path).parent.mkdir(parents=True, exist_ok=True)
+        YAMLToXMLConverter().convert_file(Path(yaml_path), Path(xml_path))
+        return yaml_path, xml_path, None
+    except Exception as e:
+        return yaml_path, xml_path, str(e)
+
+
+def find_yaml_files(path: Path, recursive: bool, exclude: List[str] = ()) -> List[Path]:
+    """Return the YAML files to process for a file or directory argument."""
+    if path.is_file():
+        return [path]
+    with profiling.phase('discover'):
+        return sorted(Path(p) for p in walk_files(path, YAML_EXTENSIONS, exclude,
+                                                  recursive=recursive))
+
+
+def run_tasks(worker, tasks: List[Tuple], jobs: int):
+    """Yield worker results, in a process pool when jobs > 1.
+    
+    Tasks are sent to the pool in chunks, since a single small file takes
+    less time to check than a round trip to a worker.
+    """
+    if jobs > 1 and len(tasks) > 1:
+        chunksize = max(1, len(tasks) // (jobs * 8))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            yield from executor.map(worker, tasks, chunksize=chunksize)
+    else:
+        for task in tasks:
+            yield worker(task)
+
+
+def verify_paths(input_path: Path, xml_dir: Optional[Path], recursive: bool,
+                 jobs: int, output_format: str, exclude: List[str] = ()) -> bool:
+    """Round-trip every YAML file under input_path and report the results.
+    
+    Returns True when every file converts back to its original XML.
+    """
+    yaml_files = find_yaml_files(input_path, recursive, exclude)
+    base = input_path if input_path.is_dir() else input_path.parent
+    tasks = []
+    for yaml_file in yaml_files:
+        xml_file = None
+        if xml_dir:
+            xml_file = str(xml_dir / yaml_file.relative_to(base).with_suffix('.xml'))
+        tasks.append((str(yaml_file), xml_file))
+    
+    start = time.perf_counter()
+    mismatches = []
+    errors = []
+    for yaml_file, xml_file, mismatch, error in run_tasks(_verify_task, tasks, jobs):
+        if error:
+            errors.append({'yaml': yaml_file, 'xml': xml_file, 'error': error})
+        elif mismatch:
+            mismatches.append({'yaml': yaml_file, 'xml': xml_file, 'mismatch': mismatch})
+    elapsed = time.perf_counter() - start
+    
+    mismatches.sort(key=lambda entry: entry['yaml'])
+    errors.sort(key=lambda entry: entry['yaml'])
+    matched = len(tasks) - len(mismatches) - len(errors)
+    
+    if output_format == 'json':
+        print(json.dumps({
+            'files': len(tasks),
+            'matched': matched,
+            'mismatches': mismatches,
+            'errors': errors,
+            'seconds': round(elapsed, 3),
+        }, indent=2))
+    else:
+        print("=" * 60)
+        print("ROUND-TRIP VERIFICATION")
+        print("=" * 60)
+        print(f"Verified: {matched}/{len(tasks)} files lossless with {max(jobs, 1)} job(s) "
+              f"in {elapsed:.2f}s")
+        if elapsed > 0:
+            print(f"Throughput: {len(tasks) / elapsed:.1f} files/sec")
+        if mismatches:
+            print(f"\nMismatches: {len(mismatches)} file(s)")
+            for entry in mismatches:
+                print(f"  - {entry['yaml']} vs {entry['xml']}: {entry['mismatch']}")
+        if errors:
+            print(f"\nErrors: {len(errors)} file(s)")
+            for entry in errors:
+                print(f"  - {entry['yaml']}: {entry['error']}")
+        print("=" * 60)
+    
+    return not mismatches and not errors
+
+
+def run(args):
+    """Run the command with arguments parsed by prompt_tools.commands.yaml_to_xml."""
+    input_path = Path(args.input_path)
+    if not input_path.exists():
+        print(f"Error: {input_path} does not exist")
+        sys.exit(1)
+    
+    if args.verify:
+        xml_dir = Path(args.xml_dir) if args.xml_dir else None
+        if not verify_paths(input_path, xml_dir, args.recursive, args.jobs, args.format,
+                            args.exclude):
+            sys.exit(1)
+        return
+    
+    if args.batch or input_path.is_dir():
+        if not input_path.is_dir():
+            print("Error: Batch mode requires a directory path")
+            sys.exit(1)
+        
+        output_dir = Path(args.output) if args.output else input_path
+        tasks = [(str(yaml_file),
+                  str(output_dir / yaml_file.relative_to(input_path).with_suffix('.xml')))
+                 for yaml_file in find_yaml_files(input_path, args.recursive, args.exclude)]
+        
+        failed = 0
+        for yaml_file, xml_file, error in run_tasks(_convert_task, tasks, args.jobs):
+            if error:
+                print(f"Error converting {yaml_file}: {error}")
+                failed += 1
+            else:
+                print(f"Converted: {yaml_file} -> {xml_file}")
+        
+        print(f"\nConversion complete: {len(tasks)} files processed")
+        if failed:
+            sys.exit(1)
+        return
+    
+    output_path = Path(args.output_path) if args.output_path else input_path.with_suffix('.xml')
+    try:
+        YAMLToXMLConverter().convert_file(input_path, output_path)
+        print(f"Converted: {input_path} -> {output_path}")
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,36 @@
+"""Tests for prompt_tools.bundle_prompts."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from prompt_tools.bundle_prompts import PromptBundler
+from prompt_tools.references import ComponentIndex
+
+
+def test_markdown_code_references_are_left_as_written(tmp_path):
+    (tmp_path / 'shared-components.yaml').write_text(
+        'greeting:\n  content: Hello there.\n', encoding='utf-8')
+    prompt = tmp_path / 'prompt.md'
+    prompt.write_text(
+        "$ref: shared-components.yaml#/greeting\n"
+        "\n"
+        "Write `$ref: missing.yaml#/example` to reference a component:\n"
+        "\n"
+        "```yaml\n"
+        "$ref: missing.yaml#/example\n"
+        "```\n",
+        encoding='utf-8')
+    
+    bundler = PromptBundler(ComponentIndex(tmp_path))
+    text, count = bundler.bundle_file(prompt)
+    
+    assert count == 1
+    assert text == ("Hello there.\n"
+                    "\n"
+                    "Write `$ref: missing.yaml#/example` to reference a component:\n"
+                    "\n"
+                    "```yaml\n"
+                    "$ref: missing.yaml#/example\n"
+                    "```\n")
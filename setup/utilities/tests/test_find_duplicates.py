@@ -0,0 +1,32 @@
+"""Tests for prompt_tools.find_duplicates."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from prompt_tools import find_duplicates
+from prompt_tools.find_duplicates import NUM_PERMUTATIONS, Block, group_blocks
+
+
+def test_bucket_mates_are_compared_with_each_other(monkeypatch):
+    # A, B and C share every LSH bucket; only B and C are similar, so B
+    # and C must be joined even though neither is similar to A
+    shingles = {
+        'a': frozenset(range(0, 10)),
+        'b': frozenset(range(100, 110)),
+        'c': frozenset(range(100, 109)) | {200},
+    }
+    signature = (0,) * NUM_PERMUTATIONS
+    
+    def signatures(task):
+        texts, _ = task
+        return [(shingles[text], signature) for text in texts]
+    
+    monkeypatch.setattr(find_duplicates, '_signature_task', signatures)
+    blocks = [Block(f"{text}.md", 'paragraph', 1, 1, text, text) for text in shingles]
+    
+    clusters = group_blocks(blocks, threshold=0.8, shingle_size=3, jobs=1)
+    
+    grouped = sorted(sorted(variant[0].normalized for variant in cluster) for cluster in clusters)
+    assert grouped == [['a'], ['b', 'c']]
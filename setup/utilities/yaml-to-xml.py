@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+YAML to XML Converter
+
+Same as `python -m prompt_tools yaml-to-xml`; the implementation is in
+prompt_tools/yaml_to_xml.py.
+"""
+
+from prompt_tools.commands import yaml_to_xml
+
+if __name__ == '__main__':
+    yaml_to_xml.main()